@@ -1 +1,19 @@
- 
+import customtkinter as ctk
+from Absent_Copy_Case_Nos.seat_marks_screen import build_seat_marks_screen
+from Absent_Copy_Case_Nos.attendance import ABSENT
+
+
+# Display the absent seat number entry screen
+def display_module(root):
+    build_seat_marks_screen(root, "Absent Seat Nos. - Entry / Edit", ABSENT)
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Absent Seat Nos. - Entry / Edit")
+    root.geometry("900x600")
+    display_module(root)
+    root.mainloop()
@@ -0,0 +1,144 @@
+import re
+from collections import Counter
+
+from config.db_connection import db
+
+ABSENT = "ABSENT"
+COPY_CASE = "COPY_CASE"
+STATUSES = (ABSENT, COPY_CASE)
+COUNTER_COLUMN = {ABSENT: "absent", COPY_CASE: "copy_case"}
+
+# Fresh per-block, per-paper counts straight from block_seats and attendance_marks
+COUNT_QUERY = """
+    SELECT s.exam_date, s.session, s.block_id, s.paper_code, COUNT(*) AS allotted,
+           SUM(CASE WHEN m.status = 'ABSENT' THEN 1 ELSE 0 END) AS absent,
+           SUM(CASE WHEN m.status = 'COPY_CASE' THEN 1 ELSE 0 END) AS copy_case
+    FROM block_seats s
+    LEFT JOIN attendance_marks m ON m.exam_date = s.exam_date AND m.session = s.session AND m.seat_no = s.seat_no
+    {where}
+    GROUP BY s.exam_date, s.session, s.block_id, s.paper_code
+"""
+COUNT_COLUMNS = ("exam_date", "session", "block_id", "paper_code", "allotted", "absent", "copy_case")
+
+
+def parse_seat_numbers(text):
+    """Split free text into seat numbers; 'first-last' expands to a numeric range."""
+    seat_nos = []
+    for token in re.split(r"[\s,;]+", text.strip().upper()):
+        if not token:
+            continue
+        first, dash, last = token.partition("-")
+        if dash and first.isdigit() and last.isdigit() and int(first) <= int(last):
+            seat_nos.extend(str(n).zfill(len(first)) for n in range(int(first), int(last) + 1))
+        else:
+            seat_nos.append(token)
+    return list(dict.fromkeys(seat_nos))
+
+
+def _session_filter(exam_date, session):
+    if exam_date is None:
+        return "", ()
+    return "WHERE s.exam_date = %s AND s.session = %s", (exam_date, session)
+
+
+def rebuild_counts(exam_date=None, session=None):
+    """Recompute attendance_counts from scratch for one session, or for all sessions."""
+    where, params = _session_filter(exam_date, session)
+    with db.transaction():
+        if exam_date is None:
+            db.exec("DELETE FROM attendance_counts")
+        else:
+            db.exec("DELETE FROM attendance_counts WHERE exam_date = %s AND session = %s", params)
+        db.exec(f"INSERT INTO attendance_counts ({', '.join(COUNT_COLUMNS)}) " + COUNT_QUERY.format(where=where), params)
+
+
+def verify_counts(exam_date=None, session=None, repair=True):
+    """Compare the stored counters with a full recount.
+
+    Returns a list of (exam_date, session, block_id, paper_code, stored, fresh)
+    for every counter row that differs; with `repair` the counters are
+    rebuilt when anything is off.
+    """
+    where, params = _session_filter(exam_date, session)
+    key = lambda row: (str(row["exam_date"]), row["session"], row["block_id"], row["paper_code"])
+    value = lambda row: (int(row["allotted"]), int(row["absent"] or 0), int(row["copy_case"] or 0))
+    fresh = {key(row): value(row) for row in db.fetch(COUNT_QUERY.format(where=where), params) or []}
+    stored = {key(row): value(row) for row in db.fetch(
+        "SELECT s.exam_date, s.session, s.block_id, s.paper_code, s.allotted, s.absent, s.copy_case "
+        f"FROM attendance_counts s {where}", params) or []}
+    mismatches = [(*k, stored.get(k), fresh.get(k)) for k in sorted(set(fresh) | set(stored)) if stored.get(k) != fresh.get(k)]
+    if mismatches and repair:
+        rebuild_counts(exam_date, session)
+    return mismatches
+
+
+def session_marks(exam_date, session, status):
+    rows = db.fetch("SELECT seat_no FROM attendance_marks WHERE exam_date = %s AND session = %s AND status = %s ORDER BY seat_no",
+                    (exam_date, session, status)) or []
+    return [row["seat_no"] for row in rows]
+
+
+def save_marks(exam_date, session, status, seat_nos):
+    """Make `seat_nos` the complete list of seats with `status` in the session.
+
+    Seats dropped from the list are unmarked. Marks and the per-block,
+    per-paper counters change in one transaction, so a summary read from
+    attendance_counts always matches the marks. Seats not seated in the
+    session, or already marked with the other status, are skipped and
+    reported. Returns a summary dict.
+    """
+    if status not in STATUSES:
+        raise ValueError(f"Unknown attendance status '{status}'.")
+    seat_nos = list(dict.fromkeys(seat_nos))
+    summary = {"added": 0, "removed": 0, "unknown": [], "conflicts": []}
+
+    with db.transaction():
+        seated = {row["seat_no"]: row for row in db.fetch(
+            "SELECT seat_no, block_id, paper_code FROM block_seats WHERE exam_date = %s AND session = %s",
+            (exam_date, session)) or []}
+        marked = {row["seat_no"]: row["status"] for row in db.fetch(
+            "SELECT seat_no, status FROM attendance_marks WHERE exam_date = %s AND session = %s",
+            (exam_date, session)) or []}
+
+        wanted = set()
+        for seat_no in seat_nos:
+            if seat_no not in seated:
+                summary["unknown"].append(seat_no)
+            elif marked.get(seat_no, status) != status:
+                summary["conflicts"].append(seat_no)
+            else:
+                wanted.add(seat_no)
+        current = {seat_no for seat_no, mark in marked.items() if mark == status}
+        added, removed = sorted(wanted - current), sorted(current - wanted)
+
+        db.exec_many("INSERT INTO attendance_marks (exam_date, session, seat_no, status) VALUES (%s, %s, %s, %s)",
+                     [(exam_date, session, seat_no, status) for seat_no in added])
+        db.exec_many("DELETE FROM attendance_marks WHERE exam_date = %s AND session = %s AND seat_no = %s",
+                     [(exam_date, session, seat_no) for seat_no in removed])
+
+        delta = Counter()
+        for seat_no in added:
+            delta[(seated[seat_no]["block_id"], seated[seat_no]["paper_code"])] += 1
+        for seat_no in removed:
+            if seat_no in seated:
+                delta[(seated[seat_no]["block_id"], seated[seat_no]["paper_code"])] -= 1
+        delta = {key: change for key, change in delta.items() if change}
+        column = COUNTER_COLUMN[status]
+        updated = db.exec_many(
+            f"UPDATE attendance_counts SET {column} = {column} + %s "
+            "WHERE exam_date = %s AND session = %s AND block_id = %s AND paper_code = %s",
+            [(change, exam_date, session, block_id, paper_code) for (block_id, paper_code), change in delta.items()])
+        if updated < len(delta):
+            # Counter rows missing (blocks prepared before counters existed): recount the session
+            rebuild_counts(exam_date, session)
+
+    summary["added"], summary["removed"] = len(added), len(removed)
+    return summary
+
+
+def session_counts(exam_date, session):
+    """Counter rows of a session joined with block numbers, ordered by block and paper."""
+    return db.fetch(
+        "SELECT c.block_id, b.block_no, c.paper_code, c.allotted, c.absent, c.copy_case FROM attendance_counts c "
+        "JOIN blocks b ON b.id = c.block_id WHERE c.exam_date = %s AND c.session = %s ORDER BY b.block_no, c.paper_code",
+        (exam_date, session)) or []
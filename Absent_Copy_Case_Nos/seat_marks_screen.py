@@ -0,0 +1,94 @@
+import customtkinter as ctk
+from tkinter import messagebox
+from tkcalendar import DateEntry
+from config.config_store import config_store
+from config.async_query import run_in_background, LoadingIndicator
+from config.init import SESSIONS
+from Absent_Copy_Case_Nos.attendance import parse_seat_numbers, save_marks, session_marks, verify_counts
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+
+# Build an entry/edit screen for the seats of a session with the given attendance status
+def build_seat_marks_screen(root, title, status):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text=title, font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=15)
+
+    ctk.CTkLabel(form_frame, text="Exam Date:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    date_entry = DateEntry(form_frame, font=NORMAL_FONT, date_pattern="yyyy-mm-dd", background=ACCENT_COLOR, foreground=TEXT_COLOR, borderwidth=2)
+    date_entry.pack(side="left", padx=10)
+
+    ctk.CTkLabel(form_frame, text="Session:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    session_var = ctk.StringVar(value=SESSIONS[0])
+    ctk.CTkComboBox(form_frame, variable=session_var, values=list(SESSIONS), font=NORMAL_FONT, width=160).pack(side="left", padx=10)
+
+    ctk.CTkLabel(content_frame, text="Seat numbers (separated by commas, spaces or new lines; 1001-1005 for a range):",
+                 font=NORMAL_FONT, text_color="#C7C7C7").pack(anchor="w", padx=30)
+    seats_box = ctk.CTkTextbox(content_frame, font=NORMAL_FONT, fg_color=BACKGROUND_COLOR, text_color=TEXT_COLOR, height=200)
+    seats_box.pack(fill="both", expand=True, padx=30, pady=10)
+
+    status_label = ctk.CTkLabel(content_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR, justify="left")
+    loading = LoadingIndicator(content_frame, text="Working...", font=NORMAL_FONT)
+
+    def session_key():
+        return date_entry.get_date(), session_var.get()
+
+    def load():
+        exam_date, session = session_key()
+        run_in_background(content_frame, lambda: session_marks(exam_date, session, status), on_done=show_marks,
+                          on_error=lambda e: messagebox.showerror("Error", f"Error loading seat numbers: {e}"), loading=loading)
+
+    def show_marks(seat_nos):
+        seats_box.delete("1.0", "end")
+        seats_box.insert("1.0", ", ".join(seat_nos))
+        status_label.configure(text=f"{len(seat_nos)} seat number(s) recorded for this session.")
+
+    def save():
+        exam_date, session = session_key()
+        seat_nos = parse_seat_numbers(seats_box.get("1.0", "end"))
+        run_in_background(content_frame, lambda: save_marks(exam_date, session, status, seat_nos), on_done=show_summary,
+                          on_error=lambda e: messagebox.showerror("Error", f"Error saving seat numbers, nothing was changed: {e}"),
+                          loading=loading)
+
+    def show_summary(summary):
+        text = f"{summary['added']} added, {summary['removed']} removed."
+        if summary["unknown"]:
+            text += f"\nNot seated in this session: {', '.join(summary['unknown'][:20])}"
+        if summary["conflicts"]:
+            text += f"\nAlready marked otherwise: {', '.join(summary['conflicts'][:20])}"
+        status_label.configure(text=text)
+
+    def verify():
+        exam_date, session = session_key()
+        run_in_background(content_frame, lambda: verify_counts(exam_date, session), loading=loading,
+                          on_done=lambda mismatches: status_label.configure(
+                              text=f"Counters rebuilt: {len(mismatches)} block/paper total(s) were wrong." if mismatches
+                              else "Attendance counters match the recorded seat numbers."),
+                          on_error=lambda e: messagebox.showerror("Error", f"Verification failed: {e}"))
+
+    button_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    button_frame.pack(pady=10)
+    ctk.CTkButton(button_frame, text="Load", font=NORMAL_FONT, fg_color="#3C3C3C", hover_color="#4E4E4E", command=load).pack(side="left", padx=10)
+    ctk.CTkButton(button_frame, text="Save", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f", command=save).pack(side="left", padx=10)
+    ctk.CTkButton(button_frame, text="Verify Counters", font=NORMAL_FONT, fg_color="#3C3C3C", hover_color="#4E4E4E", command=verify).pack(side="left", padx=10)
+    status_label.pack(pady=10)
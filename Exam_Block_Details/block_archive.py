@@ -0,0 +1,165 @@
+import os
+import time
+from datetime import datetime, timedelta
+
+from config.db_connection import db
+from Absent_Copy_Case_Nos.attendance import verify_counts
+
+UNDO_HOURS = float(os.getenv("BLOCK_UNDO_HOURS", "24"))  # deleted blocks can be brought back for this long
+BLOCKS_PER_CHUNK = 25  # blocks moved per transaction, about 1,000 seats
+
+ARCHIVED, RESTORED, PURGED = "ARCHIVED", "RESTORED", "PURGED"
+
+# Session tables cleared together with the blocks: (table, column holding blocks.id, columns).
+# Each table `t` has an archive table `t_archive` with the same columns plus batch_id.
+# Dependent rows come first and blocks last, so an interrupted move never leaves orphans behind.
+ARCHIVE_TABLES = (
+    ("block_seats", "block_id", ("id", "block_id", "exam_date", "session", "bench_no", "seat_no", "paper_code")),
+    ("supervision_order", "block_id", ("id", "block_id", "exam_date", "session", "supervisor_id")),
+    ("attendance_counts", "block_id", ("id", "exam_date", "session", "block_id", "paper_code", "allotted", "absent", "copy_case")),
+    ("blocks", "id", ("id", "exam_date", "session", "block_no", "capacity", "allotted")),
+)
+
+
+class ArchiveError(Exception):
+    """Raised when a session's blocks cannot be deleted or brought back."""
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _archive_chunk(batch_id, exam_date, session, block_ids):
+    """Move the rows of `block_ids` into the archive tables in one transaction. Returns seats moved."""
+    marks = ", ".join(["%s"] * len(block_ids))
+    seats = 0
+    with db.transaction():
+        for table, key, columns in ARCHIVE_TABLES:
+            where = f"WHERE exam_date = %s AND session = %s AND {key} IN ({marks})"
+            params = (exam_date, session, *block_ids)
+            moved = db.exec(f"INSERT INTO {table}_archive (batch_id, {', '.join(columns)}) "
+                            f"SELECT %s, {', '.join(columns)} FROM {table} {where}", (batch_id, *params))
+            db.exec(f"DELETE FROM {table} {where}", params)
+            if table == "block_seats":
+                seats = moved
+    return seats
+
+
+def _restore_chunk(batch_id, block_ids):
+    """Move the archived rows of `block_ids` back in one transaction (blocks first)."""
+    marks = ", ".join(["%s"] * len(block_ids))
+    with db.transaction():
+        for table, key, columns in reversed(ARCHIVE_TABLES):
+            where = f"WHERE batch_id = %s AND {key} IN ({marks})"
+            params = (batch_id, *block_ids)
+            db.exec(f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"SELECT {', '.join(columns)} FROM {table}_archive {where}", params)
+            db.exec(f"DELETE FROM {table}_archive {where}", params)
+
+
+def _archived_block_ids(batch_id):
+    return [row["id"] for row in db.fetch("SELECT id FROM blocks_archive WHERE batch_id = %s ORDER BY id", (batch_id,)) or []]
+
+
+def delete_session_blocks(exam_date, session, progress=None, chunk_size=BLOCKS_PER_CHUNK):
+    """Clear the blocks of a session, with their seats, supervision order and attendance counters.
+
+    Rows are moved to the archive tables with set-based INSERT ... SELECT and
+    DELETE statements, `chunk_size` blocks per transaction, so other screens
+    are never locked out for more than one short chunk. If a chunk fails the
+    chunks already moved are put back. The batch can be undone with
+    `undo_delete` for UNDO_HOURS. `progress(done, total)` is called per chunk
+    with block counts. Returns a summary dict.
+    """
+    started = time.perf_counter()
+    purge_expired()
+    block_ids = [row["id"] for row in db.fetch(
+        "SELECT id FROM blocks WHERE exam_date = %s AND session = %s ORDER BY id", (exam_date, session)) or []]
+    if not block_ids:
+        raise ArchiveError(f"No blocks prepared for {exam_date} {session}.")
+
+    deleted_at = datetime.now().replace(microsecond=0)
+    batch_id = db.insert("INSERT INTO block_delete_batches (exam_date, session, deleted_at, undo_until, status, blocks) "
+                         "VALUES (%s, %s, %s, %s, %s, %s)",
+                         (exam_date, session, deleted_at, deleted_at + timedelta(hours=UNDO_HOURS), ARCHIVED, len(block_ids)))
+
+    seats, done, longest = 0, 0, 0.0
+    if progress:
+        progress(0, len(block_ids))
+    try:
+        for chunk in _chunks(block_ids, chunk_size):
+            chunk_started = time.perf_counter()
+            seats += _archive_chunk(batch_id, exam_date, session, chunk)
+            longest = max(longest, time.perf_counter() - chunk_started)
+            done += len(chunk)
+            if progress:
+                progress(done, len(block_ids))
+    except Exception:
+        for chunk in _chunks(_archived_block_ids(batch_id), chunk_size):
+            _restore_chunk(batch_id, chunk)
+        db.exec("UPDATE block_delete_batches SET status = %s WHERE id = %s", (RESTORED, batch_id))
+        raise
+    db.exec("UPDATE block_delete_batches SET seats = %s WHERE id = %s", (seats, batch_id))
+
+    return {
+        "batch_id": batch_id, "exam_date": str(exam_date), "session": session, "blocks": len(block_ids), "seats": seats,
+        "undo_until": str(deleted_at + timedelta(hours=UNDO_HOURS)),
+        "longest_chunk_ms": round(longest * 1000, 1), "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def undo_delete(batch_id, progress=None, chunk_size=BLOCKS_PER_CHUNK):
+    """Bring back the blocks archived by batch `batch_id`.
+
+    Only possible within the undo window and while the session has no
+    blocks of its own again (prepare or delete those first). Attendance
+    counters are checked against the current marks afterwards, since marks
+    may have changed while the blocks were gone. Returns a summary dict.
+    """
+    started = time.perf_counter()
+    rows = db.fetch("SELECT * FROM block_delete_batches WHERE id = %s", (batch_id,))
+    if not rows:
+        raise ArchiveError(f"No deleted batch {batch_id}.")
+    batch = rows[0]
+    if batch["status"] != ARCHIVED:
+        raise ArchiveError(f"Batch {batch_id} was already {batch['status'].lower()}.")
+    if datetime.now() > batch["undo_until"]:
+        raise ArchiveError(f"The undo window of batch {batch_id} closed at {batch['undo_until']}.")
+    if db.fetch("SELECT id FROM blocks WHERE exam_date = %s AND session = %s LIMIT 1", (batch["exam_date"], batch["session"])):
+        raise ArchiveError(f"{batch['exam_date']} {batch['session']} has blocks again. Delete them before undoing.")
+
+    block_ids = _archived_block_ids(batch_id)
+    done = 0
+    if progress:
+        progress(0, len(block_ids))
+    for chunk in _chunks(block_ids, chunk_size):
+        _restore_chunk(batch_id, chunk)
+        done += len(chunk)
+        if progress:
+            progress(done, len(block_ids))
+    db.exec("UPDATE block_delete_batches SET status = %s WHERE id = %s", (RESTORED, batch_id))
+    repaired = verify_counts(batch["exam_date"], batch["session"], repair=True)
+
+    return {
+        "batch_id": batch_id, "exam_date": str(batch["exam_date"]), "session": batch["session"],
+        "blocks": len(block_ids), "counters_repaired": len(repaired), "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def purge_expired(now=None):
+    """Drop the archived rows of batches whose undo window has closed. Returns the number of batches purged."""
+    expired = [row["id"] for row in db.fetch(
+        "SELECT id FROM block_delete_batches WHERE status = %s AND undo_until < %s",
+        (ARCHIVED, now or datetime.now())) or []]
+    for batch_id in expired:
+        with db.transaction():
+            for table, _, _ in ARCHIVE_TABLES:
+                db.exec(f"DELETE FROM {table}_archive WHERE batch_id = %s", (batch_id,))
+            db.exec("UPDATE block_delete_batches SET status = %s WHERE id = %s", (PURGED, batch_id))
+    return len(expired)
+
+
+def recent_batches(limit=20):
+    """Newest delete batches first, for the undo list."""
+    return db.fetch("SELECT * FROM block_delete_batches ORDER BY id DESC LIMIT %s", (limit,)) or []
@@ -1 +1,158 @@
- 
+import customtkinter as ctk
+from tkinter import ttk, messagebox
+from tkcalendar import DateEntry
+from config.config_store import config_store
+from config.async_query import run_in_background, LoadingIndicator
+from config.init import SESSIONS
+from System_Parameters.supervision_scheduler import change_assigned_supervisor, duty_rosters
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+CANDIDATE_LIMIT = 25
+BLOCK_COLUMNS = [("Block", 80), ("Supervisor", 260), ("Dept", 80), ("Duties", 80)]
+CANDIDATE_COLUMNS = [("Name", 260), ("Dept", 80), ("Designation", 160), ("Duties", 80)]
+
+
+def build_list(parent, columns, name_column, style_name):
+    tree = ttk.Treeview(parent, columns=[heading for heading, _ in columns], show="headings", height=14, selectmode="browse")
+    for heading, width in columns:
+        tree.heading(heading, text=heading, anchor="center")
+        tree.column(heading, anchor="center", width=width)
+    tree.column(name_column, anchor="w")
+    style = ttk.Style()
+    style.configure(style_name, font=NORMAL_FONT, rowheight=28)
+    style.configure("Treeview.Heading", font=NORMAL_FONT)
+    tree.configure(style=style_name)
+    return tree
+
+
+# Display the change assigned supervisor screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Change Assigned Supervisor", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=15)
+
+    ctk.CTkLabel(form_frame, text="Exam Date:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    date_entry = DateEntry(form_frame, font=NORMAL_FONT, date_pattern="yyyy-mm-dd", background=ACCENT_COLOR, foreground=TEXT_COLOR, borderwidth=2)
+    date_entry.pack(side="left", padx=10)
+
+    ctk.CTkLabel(form_frame, text="Session:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    session_var = ctk.StringVar(value=SESSIONS[0])
+    ctk.CTkComboBox(form_frame, variable=session_var, values=list(SESSIONS), font=NORMAL_FONT, width=160).pack(side="left", padx=10)
+    load_button = ctk.CTkButton(form_frame, text="Load Session", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    load_button.pack(side="left", padx=10)
+    assign_button = ctk.CTkButton(form_frame, text="Assign Selected Supervisor", font=NORMAL_FONT, fg_color="#3C3C3C",
+                                  hover_color="#4E4E4E", state="disabled")
+    assign_button.pack(side="left", padx=10)
+
+    status_label = ctk.CTkLabel(content_frame, text="Load a session, pick a block, then pick its new supervisor.",
+                                font=NORMAL_FONT, text_color="#C7C7C7")
+    status_label.pack(anchor="w", padx=30)
+
+    lists_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    lists_frame.pack(fill="both", expand=True, padx=20, pady=10)
+    block_tree = build_list(lists_frame, BLOCK_COLUMNS, "Supervisor", "Blocks.Treeview")
+    block_tree.pack(side="left", fill="both", expand=True, padx=(0, 10))
+    candidate_tree = build_list(lists_frame, CANDIDATE_COLUMNS, "Name", "Candidates.Treeview")
+    candidate_tree.pack(side="left", fill="both", expand=True)
+    loading = LoadingIndicator(content_frame, text="Loading supervision order...", font=NORMAL_FONT)
+
+    state = {"roster": None, "session": None}
+
+    def load(session=None, message=None):
+        session = session or (date_entry.get_date(), session_var.get())
+        run_in_background(content_frame, duty_rosters.get, on_done=lambda roster: loaded(roster, session, message),
+                          loading=loading, on_error=lambda e: messagebox.showerror("Error", f"Error loading supervision order: {e}"))
+
+    def loaded(roster, session, message=None):
+        state["roster"], state["session"] = roster, session
+        selected = block_tree.selection()
+        blocks = fill_blocks()
+        if selected and block_tree.exists(selected[0]):
+            block_tree.selection_set(selected[0])
+        if message is None:
+            message = (f"{blocks} blocks in {session[0]} {session[1]}." if blocks
+                       else f"No blocks prepared for {session[0]} {session[1]}.")
+        status_label.configure(text=message)
+
+    # Rows are copied out of the roster under its lock, which is never held across database work
+    def fill_blocks():
+        with duty_rosters.lock:
+            rows = state["roster"].block_rows(state["session"])
+        block_tree.delete(*block_tree.get_children())
+        candidate_tree.delete(*candidate_tree.get_children())
+        for block, sup, duties in rows:
+            block_tree.insert("", "end", iid=str(block["id"]), values=(
+                block["block_no"], sup["name"] if sup else "(none)", sup["dept_code"] if sup else "",
+                duties if sup else ""))
+        return len(rows)
+
+    # Candidates come from the in-memory roster, so they are listed as soon as a block is picked
+    def show_candidates(event=None):
+        roster, selection = state["roster"], block_tree.selection()
+        candidate_tree.delete(*candidate_tree.get_children())
+        assign_button.configure(state="disabled")
+        if roster is None or not selection:
+            return
+        with duty_rosters.lock:
+            rows = roster.replacement_rows(int(selection[0]), CANDIDATE_LIMIT)
+        for sup, duties in rows:
+            candidate_tree.insert("", "end", iid=str(sup["id"]), values=(sup["name"], sup["dept_code"], sup["desg"], duties))
+        if not candidate_tree.get_children():
+            status_label.configure(text="Every supervisor available that day is already on duty in this session.")
+
+    def pick_candidate(event=None):
+        if candidate_tree.selection():
+            assign_button.configure(state="normal")
+
+    def assign():
+        blocks, candidates = block_tree.selection(), candidate_tree.selection()
+        if not blocks or not candidates:
+            return
+        block_id, supervisor_id = int(blocks[0]), int(candidates[0])
+        assign_button.configure(state="disabled")
+        run_in_background(content_frame, lambda: change_assigned_supervisor(block_id, supervisor_id), on_done=assigned,
+                          on_error=failed)
+
+    def assigned(summary):
+        name = state["roster"].supervisors[summary["supervisor_id"]]["name"]
+        load(state["session"], f"Block {summary['block_no']} is now supervised by {name}.")
+
+    def failed(error):
+        assign_button.configure(state="normal")
+        messagebox.showerror("Change Not Possible", str(error))
+
+    load_button.configure(command=lambda: load())
+    assign_button.configure(command=assign)
+    block_tree.bind("<<TreeviewSelect>>", show_candidates)
+    candidate_tree.bind("<<TreeviewSelect>>", pick_candidate)
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Change Assigned Supervisor")
+    root.geometry("1100x650")
+    display_module(root)
+    root.mainloop()
@@ -1 +1,145 @@
- 
+import customtkinter as ctk
+from tkinter import ttk, messagebox
+from tkcalendar import DateEntry
+from config.config_store import config_store
+from config.async_query import run_in_background
+from config.init import SESSIONS
+from Exam_Block_Details.block_archive import ARCHIVED, UNDO_HOURS, delete_session_blocks, recent_batches, undo_delete
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+PROGRESS_POLL_MS = 200
+BATCH_COLUMNS = [("Batch", 70), ("Exam Date", 120), ("Session", 120), ("Blocks", 80), ("Seats", 90),
+                 ("Deleted At", 180), ("Undo Until", 180), ("Status", 110)]
+
+
+# Display the delete session blocks screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Delete Session Blocks (All)", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    ctk.CTkLabel(content_frame, text="Deletes every block of the session with its seats, supervision order and attendance "
+                                     f"counters. Deleted blocks can be brought back for {UNDO_HOURS:g} hours.",
+                 font=NORMAL_FONT, text_color="#C7C7C7", wraplength=900, justify="left").pack(anchor="w", padx=20, pady=(15, 5))
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=10)
+
+    ctk.CTkLabel(form_frame, text="Exam Date:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    date_entry = DateEntry(form_frame, font=NORMAL_FONT, date_pattern="yyyy-mm-dd", background=ACCENT_COLOR, foreground=TEXT_COLOR, borderwidth=2)
+    date_entry.pack(side="left", padx=10)
+
+    ctk.CTkLabel(form_frame, text="Session:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    session_var = ctk.StringVar(value=SESSIONS[0])
+    ctk.CTkComboBox(form_frame, variable=session_var, values=list(SESSIONS), font=NORMAL_FONT, width=160).pack(side="left", padx=10)
+
+    delete_button = ctk.CTkButton(form_frame, text="Delete Blocks", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    delete_button.pack(side="left", padx=10)
+    undo_button = ctk.CTkButton(form_frame, text="Undo Selected", font=NORMAL_FONT, fg_color="#3C3C3C", hover_color="#4E4E4E")
+    undo_button.pack(side="left", padx=10)
+    status_label = ctk.CTkLabel(content_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR)
+    status_label.pack(pady=5)
+
+    tree = ttk.Treeview(content_frame, columns=[heading for heading, _ in BATCH_COLUMNS], show="headings", height=10, selectmode="browse")
+    for heading, width in BATCH_COLUMNS:
+        tree.heading(heading, text=heading, anchor="center")
+        tree.column(heading, anchor="center", width=width)
+    style = ttk.Style()
+    style.configure("Batches.Treeview", font=NORMAL_FONT, rowheight=28)
+    style.configure("Treeview.Heading", font=NORMAL_FONT)
+    tree.configure(style="Batches.Treeview")
+    tree.pack(fill="both", expand=True, padx=20, pady=10)
+    progress = {"done": 0, "total": 0, "running": False, "action": ""}
+
+    # The engine reports progress from its worker thread; the Tk thread polls it
+    def on_progress(done, total):
+        progress["done"], progress["total"] = done, total
+
+    def poll_progress():
+        if progress["running"] and status_label.winfo_exists():
+            status_label.configure(text=f"{progress['action']}... {progress['done']} of {progress['total']} blocks done")
+            status_label.after(PROGRESS_POLL_MS, poll_progress)
+
+    def fill_batches(batches):
+        tree.delete(*tree.get_children())
+        for batch in batches:
+            tree.insert("", "end", iid=str(batch["id"]), values=(
+                batch["id"], batch["exam_date"], batch["session"], batch["blocks"], batch["seats"],
+                batch["deleted_at"], batch["undo_until"], batch["status"].title()))
+
+    def refresh():
+        run_in_background(content_frame, recent_batches, on_done=fill_batches)
+
+    def start(action, work, done):
+        progress.update(done=0, total=0, running=True, action=action)
+        delete_button.configure(state="disabled")
+        undo_button.configure(state="disabled")
+        poll_progress()
+        run_in_background(content_frame, work, on_done=done, on_error=fail)
+
+    def finish():
+        progress["running"] = False
+        delete_button.configure(state="normal")
+        undo_button.configure(state="normal")
+        refresh()
+
+    def delete():
+        exam_date, session = date_entry.get_date(), session_var.get()
+        if not messagebox.askyesno("Delete Blocks", f"Delete every block of {exam_date} {session}?\n"
+                                                    f"You can undo this for {UNDO_HOURS:g} hours."):
+            return
+        start("Deleting blocks", lambda: delete_session_blocks(exam_date, session, progress=on_progress), deleted)
+
+    def deleted(summary):
+        finish()
+        status_label.configure(text=f"Deleted {summary['blocks']} blocks and {summary['seats']} seats of "
+                                    f"{summary['exam_date']} {summary['session']} in {summary['seconds']:.1f} s")
+
+    def undo():
+        selection = tree.selection()
+        if not selection or tree.set(selection[0], "Status") != ARCHIVED.title():
+            messagebox.showwarning("Undo", "Select a deleted batch that can still be undone.")
+            return
+        batch_id = int(selection[0])
+        start("Restoring blocks", lambda: undo_delete(batch_id, progress=on_progress), undone)
+
+    def undone(summary):
+        finish()
+        status_label.configure(text=f"Restored {summary['blocks']} blocks of {summary['exam_date']} {summary['session']}")
+
+    def fail(error):
+        finish()
+        status_label.configure(text="")
+        messagebox.showerror("Error", str(error))
+
+    delete_button.configure(command=delete)
+    undo_button.configure(command=undo)
+    refresh()
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Delete Session Blocks (All)")
+    root.geometry("1100x650")
+    display_module(root)
+    root.mainloop()
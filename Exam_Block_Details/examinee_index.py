@@ -0,0 +1,269 @@
+import heapq
+import re
+import threading
+from bisect import bisect_left
+
+from config.db_connection import db
+
+ENTRY_QUERY = """
+    SELECT s.seat_no, c.enrollment_no, c.name, s.paper_code, s.block_id, b.block_no, l.room, s.bench_no
+    FROM block_seats s
+    JOIN blocks b ON b.id = s.block_id
+    LEFT JOIN block_layout l ON l.block_no = b.block_no
+    LEFT JOIN seating_chart c ON c.seat_no = s.seat_no AND c.paper_code = s.paper_code
+    WHERE s.exam_date = %s AND s.session = %s
+"""
+SOURCE_TABLES = ("block_seats", "blocks", "block_layout", "seating_chart")
+DEFAULT_LIMIT = 50
+FULL_RELOAD_TABLES = ("blocks", "block_layout", "seating_chart")  # changes here rebuild the index
+NAME_CHECK_RATIO = 10  # filter by name words instead of intersecting when a span is this much larger
+REFRESH_CHUNK = 500  # seat numbers per IN (...) query
+
+
+def normalize_name(name):
+    """Lower-case words with punctuation dropped: "PATIL, Ravi S." -> "patil ravi s"."""
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", str(name or "").lower()).split())
+
+
+class SortedKeys:
+    """Sorted (key, seat_no) pairs answering prefix queries in O(log n + k).
+
+    `seat_nos` mirrors the second element of `pairs`, so a span of matches
+    can be sliced and turned into a set without a Python-level loop.
+    """
+
+    def __init__(self, pairs=()):
+        self.pairs = sorted(pairs)
+        self.seat_nos = [seat_no for _, seat_no in self.pairs]
+
+    def add(self, key, seat_no):
+        i = bisect_left(self.pairs, (key, seat_no))
+        self.pairs.insert(i, (key, seat_no))
+        self.seat_nos.insert(i, seat_no)
+
+    def remove(self, key, seat_no):
+        i = bisect_left(self.pairs, (key, seat_no))
+        if i < len(self.pairs) and self.pairs[i] == (key, seat_no):
+            del self.pairs[i]
+            del self.seat_nos[i]
+
+    def span(self, prefix):
+        """(start, stop) positions of the keys beginning with `prefix`."""
+        start = bisect_left(self.pairs, (prefix,))
+        return start, bisect_left(self.pairs, (prefix + "\uffff",), start)
+
+    def with_prefix(self, prefix, limit):
+        start, stop = self.span(prefix)
+        return self.seat_nos[start:min(stop, start + limit)]
+
+
+class ExamineeIndex:
+    """Where every examinee of one session sits, searchable as you type.
+
+    Seat numbers are unique within a session, so entries are keyed by seat
+    number. Seat and enrollment numbers are kept in sorted lists for prefix
+    search, and every word of the normalized name in another, so a query
+    like "pat rav" finds "PATIL RAVI" by intersecting word prefixes. Entries
+    can be added, moved or removed one at a time as blocks change.
+    """
+
+    def __init__(self, exam_date, session, database=db):
+        self.exam_date, self.session = exam_date, session
+        self.db = database
+        self.entries = {}  # seat_no -> entry dict
+        self.seats = SortedKeys()
+        self.enrollments = SortedKeys()
+        self.name_words = SortedKeys()
+        self.versions = None  # source table versions the index was last synced with
+        self._lock = threading.RLock()
+
+    # ----- building and updates -----
+
+    def load(self):
+        """(Re)build the index from the database."""
+        versions = self.db.table_versions(SOURCE_TABLES)
+        rows = self.db.fetch(ENTRY_QUERY, (self.exam_date, self.session))
+        if rows is None:
+            return self
+        with self._lock:
+            self.entries = {entry["seat_no"]: entry for entry in map(self._prepare, rows)}
+            self.seats = SortedKeys((entry["seat_no"], seat_no) for seat_no, entry in self.entries.items())
+            self.enrollments = SortedKeys((entry["enrollment_no"], seat_no) for seat_no, entry in self.entries.items()
+                                          if entry["enrollment_no"])
+            self.name_words = SortedKeys((word, seat_no) for seat_no, entry in self.entries.items()
+                                         for word in set(entry["name_words"]))
+            self.versions = versions
+        return self
+
+    def sync(self):
+        """Apply changes made since the last load or sync. Returns the number of entries changed.
+
+        The source tables' change counters are checked first, so an
+        unchanged session costs one small query. When only block_seats
+        changed, the session's seat positions are compared and just the
+        seats that moved are re-read; changes to blocks, rooms or names
+        rebuild the index.
+        """
+        versions = self.db.table_versions(SOURCE_TABLES)
+        if versions is not None and versions == self.versions:
+            return 0
+        if versions is None or self.versions is None or any(
+                versions[table] != self.versions[table] for table in FULL_RELOAD_TABLES):
+            before = len(self.entries)
+            self.load()
+            return max(before, len(self.entries))
+
+        rows = self.db.fetch("SELECT seat_no, block_id, bench_no, paper_code FROM block_seats WHERE exam_date = %s AND session = %s",
+                             (self.exam_date, self.session))
+        if rows is None:
+            return 0
+        with self._lock:
+            positions = {str(row["seat_no"]).upper(): (row["block_id"], row["bench_no"], row["paper_code"]) for row in rows}
+            changed = list(set(self.entries) - set(positions))
+            changed += [seat_no for seat_no, position in positions.items()
+                        if (entry := self.entries.get(seat_no)) is None
+                        or (entry["block_id"], entry["bench_no"], entry["paper_code"]) != position]
+        if not self.refresh_seats(changed):
+            return 0  # versions stay behind, so the next sync looks for these seats again
+        self.versions = versions
+        return len(changed)
+
+    def refresh_seats(self, seat_nos):
+        """Re-read only the given seats, e.g. after moving them to another block.
+
+        Returns False, with the index untouched, if any chunk cannot be read.
+        """
+        seat_nos = list(seat_nos)
+        rows = []
+        for start in range(0, len(seat_nos), REFRESH_CHUNK):
+            chunk = seat_nos[start:start + REFRESH_CHUNK]
+            fetched = self.db.fetch(ENTRY_QUERY + f" AND s.seat_no IN ({', '.join(['%s'] * len(chunk))})",
+                                    (self.exam_date, self.session, *chunk))
+            if fetched is None:
+                return False
+            rows += fetched
+        with self._lock:
+            found = set()
+            for row in rows:
+                self.upsert(row)
+                found.add(str(row["seat_no"]).upper())
+            for seat_no in {str(seat_no).upper() for seat_no in seat_nos} - found:
+                self.remove(seat_no)
+        return True
+
+    def upsert(self, entry):
+        with self._lock:
+            self.remove(entry["seat_no"])
+            entry = self._prepare(entry)
+            seat_no = entry["seat_no"]
+            self.entries[seat_no] = entry
+            self.seats.add(seat_no, seat_no)
+            if entry["enrollment_no"]:
+                self.enrollments.add(entry["enrollment_no"], seat_no)
+            for word in set(entry["name_words"]):
+                self.name_words.add(word, seat_no)
+
+    def remove(self, seat_no):
+        with self._lock:
+            entry = self.entries.pop(seat_no, None)
+            if entry is None:
+                return
+            self.seats.remove(seat_no, seat_no)
+            if entry["enrollment_no"]:
+                self.enrollments.remove(entry["enrollment_no"], seat_no)
+            for word in set(entry["name_words"]):
+                self.name_words.remove(word, seat_no)
+
+    @staticmethod
+    def _prepare(row):
+        entry = dict(row)
+        entry["seat_no"] = str(entry["seat_no"]).upper()
+        entry["enrollment_no"] = str(entry.get("enrollment_no") or "").upper()
+        entry["name_key"] = normalize_name(entry.get("name"))
+        entry["name_words"] = tuple(entry["name_key"].split())
+        return entry
+
+    # ----- search -----
+
+    def search(self, text, limit=DEFAULT_LIMIT):
+        """Entries matching `text`, best matches first.
+
+        Order: exact seat number, seat number prefix, enrollment number
+        prefix, then names whose words start with every word of the query.
+        """
+        query = text.strip().upper()
+        if not query:
+            return []
+        with self._lock:
+            found = []
+            if " " not in query:
+                if query in self.entries:
+                    found.append(query)
+                found += self.seats.with_prefix(query, limit + 1)
+                found += self.enrollments.with_prefix(query, limit)
+            found += self._name_matches(normalize_name(text), limit)
+            return [self.entries[seat_no] for seat_no in dict.fromkeys(found)][:limit]
+
+    def _name_matches(self, name_query, limit):
+        words = list(dict.fromkeys(name_query.split()))
+        if not words:
+            return []
+        seat_nos = self.name_words.seat_nos
+        spans = sorted(((self.name_words.span(word), word) for word in words), key=lambda item: item[0][1] - item[0][0])
+        (start, stop), _ = spans[0]
+        if len(words) == 1:
+            # One word: stream the matching words in order and stop at the limit
+            matches = {}
+            for i in range(start, stop):
+                matches[seat_nos[i]] = True
+                if len(matches) >= limit:
+                    break
+            return list(matches)
+
+        # Several words: start from the rarest prefix, then narrow with each other word,
+        # by set intersection when its span is comparable in size, else by checking names
+        candidates = set(seat_nos[start:stop])
+        for (start, stop), word in spans[1:]:
+            if not candidates:
+                break
+            if len(candidates) * NAME_CHECK_RATIO < stop - start:
+                candidates = {seat_no for seat_no in candidates
+                              if any(name_word.startswith(word) for name_word in self.entries[seat_no]["name_words"])}
+            else:
+                candidates.intersection_update(seat_nos[start:stop])
+        return heapq.nsmallest(limit, candidates)
+
+
+class SessionIndexes:
+    """One ExamineeIndex per session, built on first use and synced on later use."""
+
+    def __init__(self, database=db):
+        self.db = database
+        self._indexes = {}
+        self._lock = threading.Lock()
+
+    def get(self, exam_date, session):
+        key = (str(exam_date), session)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = ExamineeIndex(exam_date, session, self.db)
+                fresh = True
+            else:
+                fresh = False
+        if fresh:
+            index.load()
+        else:
+            index.sync()
+        return index
+
+    def discard(self, exam_date=None, session=None):
+        """Forget one session's index, or all of them."""
+        with self._lock:
+            if exam_date is None:
+                self._indexes.clear()
+            else:
+                self._indexes.pop((str(exam_date), session), None)
+
+
+examinee_indexes = SessionIndexes()
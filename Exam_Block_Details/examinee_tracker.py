@@ -1 +1,145 @@
- 
+import time
+import customtkinter as ctk
+from tkinter import ttk, messagebox
+from tkcalendar import DateEntry
+from config.config_store import config_store
+from config.async_query import run_in_background, LoadingIndicator
+from config.init import SESSIONS
+from Exam_Block_Details.examinee_index import examinee_indexes
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+SYNC_POLL_MS = 2000
+
+COLUMNS = [
+    ("seat_no", "Seat No"),
+    ("enrollment_no", "Enrollment No"),
+    ("name", "Name"),
+    ("paper_code", "Paper"),
+    ("block_no", "Block"),
+    ("room", "Room"),
+    ("bench_no", "Bench"),
+]
+
+
+# Display the examinee tracker screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Examinee Tracker", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=15)
+
+    ctk.CTkLabel(form_frame, text="Exam Date:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    date_entry = DateEntry(form_frame, font=NORMAL_FONT, date_pattern="yyyy-mm-dd", background=ACCENT_COLOR, foreground=TEXT_COLOR, borderwidth=2)
+    date_entry.pack(side="left", padx=10)
+
+    ctk.CTkLabel(form_frame, text="Session:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    session_var = ctk.StringVar(value=SESSIONS[0])
+    ctk.CTkComboBox(form_frame, variable=session_var, values=list(SESSIONS), font=NORMAL_FONT, width=160).pack(side="left", padx=10)
+    load_button = ctk.CTkButton(form_frame, text="Load Session", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    load_button.pack(side="left", padx=10)
+
+    search_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    search_frame.pack(fill="x", padx=20, pady=5)
+    ctk.CTkLabel(search_frame, text="Seat No / Enrollment No / Name:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    search_entry = ctk.CTkEntry(search_frame, font=NORMAL_FONT, width=350, state="disabled")
+    search_entry.pack(side="left", padx=10)
+    status_label = ctk.CTkLabel(search_frame, text="Load a session to search.", font=NORMAL_FONT, text_color="#C7C7C7")
+    status_label.pack(side="left", padx=10)
+
+    tree = ttk.Treeview(content_frame, columns=[heading for _, heading in COLUMNS], show="headings", height=15, selectmode="browse")
+    for _, heading in COLUMNS:
+        tree.heading(heading, text=heading, anchor="center")
+        tree.column(heading, anchor="center", width=140)
+    tree.column("Name", width=300, anchor="w")
+    style = ttk.Style()
+    style.configure("Tracker.Treeview", font=NORMAL_FONT, rowheight=28)
+    style.configure("Treeview.Heading", font=NORMAL_FONT)
+    tree.configure(style="Tracker.Treeview")
+    tree.pack(fill="both", expand=True, padx=20, pady=10)
+    loading = LoadingIndicator(content_frame, text="Loading examinees...", font=NORMAL_FONT)
+
+    state = {"index": None, "generation": 0}
+
+    def load():
+        exam_date, session = date_entry.get_date(), session_var.get()
+        run_in_background(content_frame, lambda: examinee_indexes.get(exam_date, session), on_done=loaded, loading=loading,
+                          on_error=lambda e: messagebox.showerror("Error", f"Error loading examinees: {e}"))
+
+    def loaded(index):
+        state["index"] = index
+        search_entry.configure(state="normal")
+        search_entry.focus_set()
+        status_label.configure(text=f"{len(index.entries)} examinees seated in {index.exam_date} {index.session}.")
+        search()
+        state["generation"] += 1
+        schedule_sync(state["generation"])
+
+    # Blocks can be prepared, changed or deleted while the screen is open: apply those
+    # changes every SYNC_POLL_MS (one change-counter query when nothing changed)
+    def schedule_sync(generation):
+        if status_label.winfo_exists():
+            status_label.after(SYNC_POLL_MS, lambda: sync(generation))
+
+    def sync(generation):
+        index = state["index"]
+        if index is None or generation != state["generation"] or not status_label.winfo_exists():
+            return
+        run_in_background(content_frame, index.sync, on_done=lambda changed: synced(generation, changed),
+                          on_error=lambda e: schedule_sync(generation))
+
+    def synced(generation, changed):
+        if generation != state["generation"]:
+            return
+        if changed:
+            index = state["index"]
+            if not search_entry.get().strip():
+                status_label.configure(text=f"{len(index.entries)} examinees seated in {index.exam_date} {index.session}.")
+            search()
+        schedule_sync(generation)
+
+    # Runs on every keystroke; the index answers in a few milliseconds
+    def search(event=None):
+        index = state["index"]
+        if index is None:
+            return
+        started = time.perf_counter()
+        results = index.search(search_entry.get())
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        tree.delete(*tree.get_children())
+        for entry in results:
+            tree.insert("", "end", values=["" if entry.get(col) is None else entry[col] for col, _ in COLUMNS])
+        if search_entry.get().strip():
+            status_label.configure(text=f"{len(results)} match(es) in {elapsed_ms:.1f} ms")
+
+    load_button.configure(command=load)
+    search_entry.bind("<KeyRelease>", search)
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Examinee Tracker")
+    root.geometry("1100x650")
+    display_module(root)
+    root.mainloop()
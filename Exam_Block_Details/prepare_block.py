@@ -1 +1,85 @@
- 
+import customtkinter as ctk
+from tkinter import messagebox
+from tkcalendar import DateEntry
+from config.config_store import config_store
+from config.async_query import run_in_background, LoadingIndicator
+from config.init import SESSIONS
+from Exam_Block_Details.seat_allocation import prepare_session_blocks
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+
+# Display the automatic block preparation screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Automatic Block Preparation", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=15)
+
+    ctk.CTkLabel(form_frame, text="Exam Date:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    date_entry = DateEntry(form_frame, font=NORMAL_FONT, date_pattern="yyyy-mm-dd", background=ACCENT_COLOR, foreground=TEXT_COLOR, borderwidth=2)
+    date_entry.pack(side="left", padx=10)
+
+    ctk.CTkLabel(form_frame, text="Session:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    session_var = ctk.StringVar(value=SESSIONS[0])
+    ctk.CTkComboBox(form_frame, variable=session_var, values=list(SESSIONS), font=NORMAL_FONT, width=160).pack(side="left", padx=10)
+
+    ctk.CTkLabel(form_frame, text="Shuffle Seed:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    seed_entry = ctk.CTkEntry(form_frame, font=NORMAL_FONT, width=80)
+    seed_entry.insert(0, "0")
+    seed_entry.pack(side="left", padx=10)
+
+    summary_label = ctk.CTkLabel(content_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR, justify="left")
+    loading = LoadingIndicator(content_frame, text="Allocating seats...", font=NORMAL_FONT)
+
+    def prepare():
+        try:
+            seed = int(seed_entry.get().strip() or 0)
+        except ValueError:
+            messagebox.showwarning("Invalid Seed", "Shuffle seed must be a whole number.")
+            return
+        exam_date, session = date_entry.get_date(), session_var.get()
+        run_in_background(
+            content_frame, lambda: prepare_session_blocks(exam_date, session, seed),
+            on_done=show_summary, on_error=lambda e: messagebox.showerror("Error", f"Block preparation failed: {e}"),
+            loading=loading
+        )
+
+    def show_summary(summary):
+        summary_label.configure(text=(
+            f"Session {summary['exam_date']} {summary['session']}: {summary['examinees']} examinees seated "
+            f"in {summary['blocks']} blocks.\nNeighbouring seats with the same paper: {summary['conflicts']}"
+        ))
+
+    ctk.CTkButton(content_frame, text="Prepare Blocks", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f",
+                  command=prepare).pack(pady=20)
+    summary_label.pack(pady=10)
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Automatic Block Preparation")
+    root.geometry("900x500")
+    display_module(root)
+    root.mainloop()
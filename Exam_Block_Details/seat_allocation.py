@@ -0,0 +1,146 @@
+import numpy as np
+
+from config.db_connection import db
+from Absent_Copy_Case_Nos.attendance import rebuild_counts
+
+
+class AllocationError(Exception):
+    """Raised when a session cannot be seated with the available blocks."""
+
+
+def allocate(seat_nos, paper_codes, capacities, bench_columns, seed=0):
+    """Assign examinees to blocks and benches.
+
+    Examinees are grouped by paper code (paper order shuffled by `seed`,
+    seat numbers ascending inside a paper) and the sorted list is split into
+    two halves. Seats are coloured like a chessboard inside each block; the
+    first half fills the "white" seats and the second half the "black" seats,
+    block by block. Left/right and front/back neighbours are always of
+    opposite colour, so they only share a paper when one paper has more than
+    half of the session's examinees.
+
+    All work is done with array operations. Returns a dict of arrays
+    `block` (index into `capacities`) and `bench` (1-based seat in the block),
+    both in the order of the input examinees, plus `blocks_used` and the
+    number of remaining same-paper `conflicts`.
+    """
+    seat_nos = np.asarray(seat_nos, dtype=str)
+    paper_codes = np.asarray(paper_codes, dtype=str)
+    capacities = np.asarray(capacities, dtype=np.int64)
+    bench_columns = np.maximum(np.asarray(bench_columns, dtype=np.int64), 1)
+    n = len(seat_nos)
+    if n == 0:
+        return {"block": np.empty(0, np.int64), "bench": np.empty(0, np.int64), "blocks_used": 0, "conflicts": 0}
+
+    # Use only as many blocks (in layout order) as the session needs
+    cumulative = np.cumsum(capacities)
+    if cumulative.size == 0 or cumulative[-1] < n:
+        raise AllocationError(f"{n} examinees but only {int(cumulative[-1]) if cumulative.size else 0} seats in the block layout.")
+    blocks_used = int(np.searchsorted(cumulative, n) + 1)
+    capacities = capacities[:blocks_used]
+    bench_columns = bench_columns[:blocks_used]
+
+    # Group by paper code: random (but seeded) paper order, seat number inside a paper
+    papers, paper_index = np.unique(paper_codes, return_inverse=True)
+    paper_rank = np.random.default_rng(seed).permutation(len(papers))[paper_index]
+    order = np.lexsort((seat_nos, paper_rank))
+
+    # Every seat of the used blocks, in block order, with its chessboard colour
+    seat_block = np.repeat(np.arange(blocks_used), capacities)
+    block_start = np.concatenate(([0], np.cumsum(capacities)[:-1]))
+    seat_pos = np.arange(seat_block.size) - block_start[seat_block]
+    columns = bench_columns[seat_block]
+    colour = ((seat_pos // columns) + (seat_pos % columns)) % 2
+    white, black = np.flatnonzero(colour == 0), np.flatnonzero(colour == 1)
+
+    # Split the grouped list so each half fits its colour
+    first_half = min(white.size, max(n - black.size, (n + 1) // 2))
+    seat_of_examinee = np.empty(n, dtype=np.int64)
+    seat_of_examinee[order[:first_half]] = white[:first_half]
+    seat_of_examinee[order[first_half:]] = black[:n - first_half]
+
+    block = seat_block[seat_of_examinee]
+    bench = seat_pos[seat_of_examinee] + 1
+    conflicts = count_conflicts(seat_of_examinee, paper_index, seat_block, seat_pos, columns)
+    return {"block": block, "bench": bench, "blocks_used": blocks_used, "conflicts": conflicts}
+
+
+def count_conflicts(seat_of_examinee, paper_index, seat_block, seat_pos, columns):
+    """Count neighbouring seats (left/right or front/back) holding the same paper."""
+    paper_at_seat = np.full(seat_block.size, -1, dtype=np.int64)
+    paper_at_seat[seat_of_examinee] = paper_index
+    conflicts = 0
+    for step, same_row_only in ((1, True), (columns, False)):
+        seats = np.arange(seat_block.size)
+        neighbour = seats + step
+        valid = neighbour < seat_block.size
+        seats, neighbour = seats[valid], neighbour[valid]
+        valid = seat_block[seats] == seat_block[neighbour]
+        if same_row_only:
+            valid &= (seat_pos[seats] // columns[seats]) == (seat_pos[neighbour] // columns[seats])
+        a, b = paper_at_seat[seats[valid]], paper_at_seat[neighbour[valid]]
+        conflicts += int(np.count_nonzero((a == b) & (a >= 0)))
+    return conflicts
+
+
+def load_session_examinees(exam_date, session):
+    """Return (seat_no, paper_code) rows for every paper in the session."""
+    query = """
+        SELECT sc.seat_no, sc.paper_code
+        FROM seating_chart sc
+        JOIN timetable t ON t.paper_code = sc.paper_code
+        WHERE t.exam_date = %s AND t.session = %s
+    """
+    return db.fetch(query, (exam_date, session)) or []
+
+
+def prepare_session_blocks(exam_date, session, seed=0):
+    """Allocate the session's examinees and store blocks and seats.
+
+    Any earlier allocation for the session is replaced in one transaction,
+    together with the session's attendance counters; its supervision order
+    is cleared, as it refers to the old blocks.
+    Returns a summary dict.
+    """
+    examinees = load_session_examinees(exam_date, session)
+    layout = db.fetch("SELECT block_no, capacity, bench_columns FROM block_layout ORDER BY block_no") or []
+    if not examinees:
+        raise AllocationError(f"No examinees found for {exam_date} {session}. Import the timetable and seating chart first.")
+    if not layout:
+        raise AllocationError("No blocks defined. Add blocks under System Tools > Block Arrangement (Layout).")
+
+    result = allocate(
+        [row["seat_no"] for row in examinees],
+        [row["paper_code"] for row in examinees],
+        [row["capacity"] for row in layout],
+        [row["bench_columns"] for row in layout],
+        seed=seed,
+    )
+    used_layout = layout[:result["blocks_used"]]
+    allotted = np.bincount(result["block"], minlength=result["blocks_used"])
+
+    with db.transaction():
+        db.exec("DELETE FROM block_seats WHERE exam_date = %s AND session = %s", (exam_date, session))
+        db.exec("DELETE FROM supervision_order WHERE exam_date = %s AND session = %s", (exam_date, session))
+        db.exec("DELETE FROM blocks WHERE exam_date = %s AND session = %s", (exam_date, session))
+        db.exec_many(
+            "INSERT INTO blocks (exam_date, session, block_no, capacity, allotted) VALUES (%s, %s, %s, %s, %s)",
+            [(exam_date, session, row["block_no"], row["capacity"], int(count)) for row, count in zip(used_layout, allotted)],
+        )
+        block_ids = {row["block_no"]: row["id"] for row in db.fetch(
+            "SELECT id, block_no FROM blocks WHERE exam_date = %s AND session = %s", (exam_date, session))}
+        block_id_by_index = [block_ids[row["block_no"]] for row in used_layout]
+        db.exec_many(
+            "INSERT INTO block_seats (block_id, exam_date, session, bench_no, seat_no, paper_code) VALUES (%s, %s, %s, %s, %s, %s)",
+            [(block_id_by_index[b], exam_date, session, int(bench), row["seat_no"], row["paper_code"])
+             for row, b, bench in zip(examinees, result["block"], result["bench"])],
+        )
+        rebuild_counts(exam_date, session)
+
+    return {
+        "exam_date": str(exam_date),
+        "session": session,
+        "examinees": len(examinees),
+        "blocks": result["blocks_used"],
+        "conflicts": result["conflicts"],
+    }
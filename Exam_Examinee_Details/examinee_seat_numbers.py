@@ -1 +1,20 @@
- 
+import customtkinter as ctk
+from Exam_Examinee_Details.import_screen import build_import_screen
+from Exam_Examinee_Details.seating_chart_importer import import_seating_chart
+
+
+# Display the MSBTE seating chart import screen
+def display_module(root):
+    build_import_screen(root, "Import MSBTE Seating Chart", "Seat No, Enrollment No, Name, Course Code, Paper Codes",
+                        lambda path, progress: import_seating_chart(path, progress=progress))
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Import MSBTE Seating Chart")
+    root.geometry("900x500")
+    display_module(root)
+    root.mainloop()
@@ -0,0 +1,97 @@
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from config.config_store import config_store
+from config.async_query import run_in_background
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+FILE_TYPES = [("Spreadsheets", "*.xlsx *.xls *.csv"), ("All files", "*.*")]
+PROGRESS_POLL_MS = 200
+
+
+# Build a spreadsheet import screen; `run_import(path, progress)` does the work on a worker thread
+def build_import_screen(root, title, columns_hint, run_import):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text=title, font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    ctk.CTkLabel(content_frame, text=f"Columns expected: {columns_hint}",
+                 font=NORMAL_FONT, text_color="#C7C7C7").pack(pady=(20, 10))
+
+    file_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    file_frame.pack(fill="x", padx=20, pady=10)
+    path_var = ctk.StringVar()
+    ctk.CTkEntry(file_frame, textvariable=path_var, font=NORMAL_FONT, state="readonly").pack(side="left", fill="x", expand=True, padx=10)
+    ctk.CTkButton(file_frame, text="Browse", font=NORMAL_FONT, width=100,
+                  command=lambda: path_var.set(filedialog.askopenfilename(filetypes=FILE_TYPES) or path_var.get())).pack(side="left", padx=10)
+
+    progress_bar = ctk.CTkProgressBar(content_frame, mode="indeterminate")
+    status_label = ctk.CTkLabel(content_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR, justify="left")
+    import_button = ctk.CTkButton(content_frame, text="Import", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    progress = {"read": 0, "written": 0, "running": False}
+
+    # The importer reports progress from its worker thread; the Tk thread polls it
+    def on_progress(read, written):
+        progress["read"], progress["written"] = read, written
+
+    def poll_progress():
+        if progress["running"] and status_label.winfo_exists():
+            status_label.configure(text=f"{progress['read']} rows read, {progress['written']} written...")
+            status_label.after(PROGRESS_POLL_MS, poll_progress)
+
+    def start_import():
+        path = path_var.get()
+        if not path:
+            messagebox.showwarning("No File", "Please choose a file to import.")
+            return
+        progress.update(read=0, written=0, running=True)
+        import_button.configure(state="disabled")
+        progress_bar.pack(fill="x", padx=40, pady=10)
+        progress_bar.start()
+        poll_progress()
+        run_in_background(content_frame, lambda: run_import(path, on_progress),
+                          on_done=finish_import, on_error=fail_import)
+
+    def stop_progress():
+        progress["running"] = False
+        progress_bar.stop()
+        progress_bar.pack_forget()
+        import_button.configure(state="normal")
+
+    def finish_import(summary):
+        stop_progress()
+        text = (f"{summary['read']} rows read: {summary['inserted']} added, {summary['updated']} updated, "
+                f"{summary['unchanged']} unchanged, {summary['invalid']} invalid.")
+        if summary.get("duplicates"):
+            text += f" {summary['duplicates']} duplicates skipped."
+        if summary.get("not_in_file"):
+            text += f"\n{summary['not_in_file']} stored entries are not in this file."
+        if summary["errors"]:
+            text += "\n" + "\n".join(summary["errors"][:10])
+        status_label.configure(text=text)
+
+    def fail_import(error):
+        stop_progress()
+        status_label.configure(text="")
+        messagebox.showerror("Import Failed", f"Import failed, nothing was saved: {error}")
+
+    import_button.configure(command=start_import)
+    import_button.pack(pady=20)
+    status_label.pack(pady=10)
+
@@ -0,0 +1,130 @@
+import hashlib
+import re
+
+from config.db_connection import db, DB_BATCH_SIZE
+from Exam_Examinee_Details.spreadsheet_rows import iter_records, clean_text
+from Exam_Examinee_Details.timetable_importer import PAPER_CODE_PATTERN, MAX_REPORTED_ERRORS
+
+SEATING_CHART_COLUMNS = {
+    "seat_no": ("Seat No", "Seat Number", "Seat"),
+    "enrollment_no": ("Enrollment No", "Enrolment No", "Enrollment Number", "Enroll No"),
+    "name": ("Name", "Student Name", "Examinee Name", "Name of Student"),
+    "course_code": ("Course Code", "Course", "Programme", "Program Code"),
+    "paper_codes": ("Paper Code", "Paper Codes", "Papers", "Subject Codes"),
+}
+STORED_COLUMNS = ["seat_no", "enrollment_no", "name", "course_code", "paper_code", "row_hash"]
+SEAT_NO_PATTERN = re.compile(r"^[A-Z0-9/-]{1,20}$")
+PAPER_SEPARATORS = re.compile(r"[,;/\s]+")
+
+
+def row_hash(seat_no, enrollment_no, name, course_code, paper_code):
+    """Content hash of one seating chart entry."""
+    text = "\x1f".join((seat_no, enrollment_no, name, course_code, paper_code))
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def parse_seating_row(record):
+    """Validate one spreadsheet row and return one entry tuple per paper code."""
+    seat_no = clean_text(record["seat_no"]).upper()
+    if not SEAT_NO_PATTERN.match(seat_no):
+        raise ValueError(f"invalid seat number '{seat_no}'")
+    name = " ".join(clean_text(record["name"]).split())[:100]
+    if not name:
+        raise ValueError(f"missing name for seat number {seat_no}")
+    enrollment_no = clean_text(record["enrollment_no"])[:20]
+    course_code = clean_text(record["course_code"]).upper()[:10]
+    paper_codes = [code for code in PAPER_SEPARATORS.split(clean_text(record["paper_codes"]).upper()) if code]
+    if not paper_codes:
+        raise ValueError(f"no paper code for seat number {seat_no}")
+    entries = []
+    for paper_code in paper_codes:
+        if not PAPER_CODE_PATTERN.match(paper_code):
+            raise ValueError(f"invalid paper code '{paper_code}' for seat number {seat_no}")
+        entries.append((seat_no, enrollment_no, name, course_code, paper_code,
+                        row_hash(seat_no, enrollment_no, name, course_code, paper_code)))
+    return entries
+
+
+def load_stored_hashes():
+    """(seat_no, paper_code) -> row_hash for the whole stored chart, read in one query."""
+    return {(row["seat_no"], row["paper_code"]): row["row_hash"]
+            for row in db.fetch("SELECT seat_no, paper_code, row_hash FROM seating_chart") or []}
+
+
+def store_entries(entries, chunk_size=DB_BATCH_SIZE):
+    """Upsert parsed entries into `seating_chart`."""
+    return db.upsert_many("seating_chart", STORED_COLUMNS, ["seat_no", "paper_code"], entries, chunk_size)
+
+
+def import_seating_chart(path, progress=None, chunk_size=DB_BATCH_SIZE):
+    """Stream an MSBTE seating chart file into `seating_chart`.
+
+    Every entry is hashed; entries whose hash matches the stored row are
+    skipped, so re-importing a revised chart only writes what the board
+    changed. A seat number that reappears with a different enrollment
+    number, or the same seat/paper twice in one file, is reported as a
+    duplicate. Changes are upserted in batches inside one transaction.
+    """
+    stored_hashes = load_stored_hashes()
+    seen = set()
+    seat_index = {}  # seat_no -> enrollment_no as seen in this file
+    summary = {"read": 0, "inserted": 0, "updated": 0, "unchanged": 0, "duplicates": 0, "invalid": 0, "errors": []}
+    batch = []
+
+    def report(row_number, message):
+        if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+            summary["errors"].append(f"Row {row_number}: {message}")
+
+    def flush():
+        if batch:
+            store_entries(batch, chunk_size)
+            batch.clear()
+        if progress:
+            progress(summary["read"], summary["inserted"] + summary["updated"])
+
+    with db.transaction():
+        for row_number, record in iter_records(path, SEATING_CHART_COLUMNS):
+            summary["read"] += 1
+            try:
+                entries = parse_seating_row(record)
+            except ValueError as e:
+                summary["invalid"] += 1
+                report(row_number, e)
+                continue
+
+            seat_no, enrollment_no = entries[0][0], entries[0][1]
+            if seat_index.setdefault(seat_no, enrollment_no) != enrollment_no:
+                summary["duplicates"] += 1
+                report(row_number, f"seat number {seat_no} is already used by enrollment {seat_index[seat_no]}")
+                continue
+
+            for entry in entries:
+                key = (entry[0], entry[4])
+                if key in seen:
+                    summary["duplicates"] += 1
+                    report(row_number, f"seat number {entry[0]} listed twice for paper {entry[4]}")
+                    continue
+                seen.add(key)
+                stored_hash = stored_hashes.get(key)
+                if stored_hash == entry[5]:
+                    summary["unchanged"] += 1
+                    continue
+                summary["inserted" if stored_hash is None else "updated"] += 1
+                batch.append(entry)
+            if len(batch) >= chunk_size:
+                flush()
+        flush()
+
+    summary["not_in_file"] = len(stored_hashes.keys() - seen)
+    return summary
+
+
+def save_manual_entry(seat_no, enrollment_no, name, course_code, paper_codes):
+    """Add or update one examinee typed in by hand. Returns the number of paper entries saved."""
+    entries = parse_seating_row({"seat_no": seat_no, "enrollment_no": enrollment_no, "name": name,
+                                 "course_code": course_code, "paper_codes": paper_codes})
+    stored = db.fetch("SELECT enrollment_no FROM seating_chart WHERE seat_no = %s LIMIT 1", (entries[0][0],)) or []
+    if stored and (stored[0]["enrollment_no"] or "") != entries[0][1]:
+        raise ValueError(f"Seat number {entries[0][0]} already belongs to enrollment {stored[0]['enrollment_no']}.")
+    store_entries(entries)
+    return len(entries)
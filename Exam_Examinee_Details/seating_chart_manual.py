@@ -0,0 +1,79 @@
+import customtkinter as ctk
+from tkinter import messagebox
+from config.config_store import config_store
+from Exam_Examinee_Details.seating_chart_importer import save_manual_entry
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+FIELDS = [
+    ("Seat No", "seat_no"),
+    ("Enrollment No", "enrollment_no"),
+    ("Name of Examinee", "name"),
+    ("Course Code", "course_code"),
+    ("Paper Codes (comma separated)", "paper_codes"),
+]
+
+
+# Display the manual seating chart entry screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Create Seating Chart Manually", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    entries = {}
+    for label, key in FIELDS:
+        frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+        frame.pack(fill="x", pady=8, padx=20)
+        ctk.CTkLabel(frame, text=f"{label}:", width=260, anchor="w", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+        entry = ctk.CTkEntry(frame, font=NORMAL_FONT, fg_color=BACKGROUND_COLOR, text_color=TEXT_COLOR)
+        entry.pack(side="left", fill="x", expand=True, padx=10)
+        entries[key] = entry
+
+    def clear():
+        for entry in entries.values():
+            entry.delete(0, ctk.END)
+
+    def save():
+        values = {key: entry.get() for key, entry in entries.items()}
+        try:
+            saved = save_manual_entry(**values)
+        except ValueError as e:
+            messagebox.showwarning("Invalid Entry", str(e))
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Error saving examinee: {e}")
+            return
+        messagebox.showinfo("Saved", f"Seat number {values['seat_no'].strip().upper()} saved for {saved} paper(s).")
+        clear()
+
+    button_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    button_frame.pack(pady=20)
+    ctk.CTkButton(button_frame, text="Save", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f", command=save).pack(side="left", padx=10)
+    ctk.CTkButton(button_frame, text="Clear", font=NORMAL_FONT, fg_color="#3C3C3C", hover_color="#4E4E4E", command=clear).pack(side="left", padx=10)
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Create Seating Chart Manually")
+    root.geometry("800x500")
+    display_module(root)
+    root.mainloop()
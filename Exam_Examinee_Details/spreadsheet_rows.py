@@ -0,0 +1,103 @@
+import csv
+import os
+from datetime import date, datetime
+
+DATE_FORMATS = ("%Y-%m-%d", "%d-%m-%Y", "%d/%m/%Y", "%d.%m.%Y", "%Y/%m/%d", "%d-%b-%Y", "%d %b %Y")
+
+
+class SpreadsheetError(Exception):
+    """Raised for unreadable or unsupported import files."""
+
+
+def iter_rows(path):
+    """Yield every row of the first sheet of a .csv, .xlsx or .xls file as a list of cells.
+
+    .csv and .xlsx are streamed row by row (openpyxl read-only mode), so memory
+    stays flat whatever the file size. The old .xls format cannot be streamed
+    by xlrd; its sheet is loaded on demand and rows are still yielded one at
+    a time.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            yield from csv.reader(f)
+    elif extension in (".xlsx", ".xlsm"):
+        import openpyxl
+        workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            for row in workbook.worksheets[0].iter_rows(values_only=True):
+                yield list(row)
+        finally:
+            workbook.close()
+    elif extension == ".xls":
+        import xlrd
+        workbook = xlrd.open_workbook(path, on_demand=True)
+        try:
+            sheet = workbook.sheet_by_index(0)
+            for index in range(sheet.nrows):
+                yield [_xls_value(cell, workbook.datemode) for cell in sheet.row(index)]
+        finally:
+            workbook.release_resources()
+    else:
+        raise SpreadsheetError(f"Unsupported file type '{extension}'. Use .xlsx, .xls or .csv.")
+
+
+def _xls_value(cell, datemode):
+    import xlrd
+    if cell.ctype == xlrd.XL_CELL_DATE:
+        return xlrd.xldate_as_datetime(cell.value, datemode)
+    if cell.ctype == xlrd.XL_CELL_NUMBER and cell.value == int(cell.value):
+        return int(cell.value)
+    return cell.value
+
+
+def iter_records(path, columns):
+    """Yield (row number, {field: value}) for each data row.
+
+    `columns` maps field names to accepted header spellings. The header row is
+    the first row that contains every required field; matching ignores case,
+    spaces, dots and underscores.
+    """
+    wanted = {field: {_normalize_header(alias) for alias in aliases} for field, aliases in columns.items()}
+    positions = None
+    for row_number, row in enumerate(iter_rows(path), start=1):
+        if positions is None:
+            headers = [_normalize_header(cell) for cell in row]
+            found = {field: next((i for i, header in enumerate(headers) if header in aliases), None)
+                     for field, aliases in wanted.items()}
+            if all(position is not None for position in found.values()):
+                positions = found
+            continue
+        if not any(cell not in (None, "") for cell in row):
+            continue
+        yield row_number, {field: (row[position] if position < len(row) else None) for field, position in positions.items()}
+    if positions is None:
+        raise SpreadsheetError("Header row not found. Expected columns: " + ", ".join(columns))
+
+
+def _normalize_header(value):
+    return "".join(ch for ch in str(value or "").lower() if ch.isalnum())
+
+
+def parse_date(value):
+    """Turn a spreadsheet cell into a date, or raise ValueError."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value or "").strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"invalid date '{text}'")
+
+
+def clean_text(value):
+    """Cell value as stripped text; whole numbers lose their '.0'."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
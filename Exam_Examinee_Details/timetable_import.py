@@ -1 +1,20 @@
- 
+import customtkinter as ctk
+from Exam_Examinee_Details.import_screen import build_import_screen
+from Exam_Examinee_Details.timetable_importer import import_timetable
+
+
+# Display the timetable import screen
+def display_module(root):
+    build_import_screen(root, "Import Time Table", "Date, Session, Paper Code, Paper Name",
+                        lambda path, progress: import_timetable(path, progress=progress))
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Import Time Table")
+    root.geometry("900x500")
+    display_module(root)
+    root.mainloop()
@@ -0,0 +1,78 @@
+import re
+
+from config.db_connection import db, DB_BATCH_SIZE
+from Exam_Examinee_Details.spreadsheet_rows import iter_records, parse_date, clean_text
+
+PAPER_CODE_PATTERN = re.compile(r"^[A-Z0-9-]{2,10}$")
+TIMETABLE_COLUMNS = {
+    "exam_date": ("Date", "Exam Date", "Date of Exam"),
+    "session": ("Session", "Shift"),
+    "paper_code": ("Paper Code", "Code", "Subject Code"),
+    "paper_name": ("Paper Name", "Paper", "Subject", "Subject Name", "Title"),
+}
+SESSION_ALIASES = {
+    "MORNING": "MORNING", "M": "MORNING", "FN": "MORNING", "FORENOON": "MORNING", "MOR": "MORNING",
+    "AFTERNOON": "AFTERNOON", "A": "AFTERNOON", "AN": "AFTERNOON", "AFT": "AFTERNOON",
+}
+MAX_REPORTED_ERRORS = 50
+
+
+def parse_timetable_row(record):
+    """Validate one spreadsheet row and return (exam_date, session, paper_code, paper_name)."""
+    exam_date = parse_date(record["exam_date"])
+    session = SESSION_ALIASES.get(clean_text(record["session"]).upper().replace(".", ""))
+    if session is None:
+        raise ValueError(f"unknown session '{clean_text(record['session'])}'")
+    paper_code = clean_text(record["paper_code"]).upper()
+    if not PAPER_CODE_PATTERN.match(paper_code):
+        raise ValueError(f"invalid paper code '{paper_code}'")
+    return exam_date, session, paper_code, clean_text(record["paper_name"])[:100]
+
+
+def import_timetable(path, progress=None, chunk_size=DB_BATCH_SIZE):
+    """Stream a timetable file into the `timetable` table.
+
+    Rows are read and validated one at a time and written with batched
+    upserts; rows identical to what is already stored are skipped, so a
+    re-import only touches what changed. The whole import is one transaction.
+    `progress(rows_read, rows_written)` is called after every batch.
+    Returns a summary dict with per-row errors (first MAX_REPORTED_ERRORS).
+    """
+    existing = {
+        (row["exam_date"], row["session"], row["paper_code"]): row["paper_name"] or ""
+        for row in db.fetch("SELECT exam_date, session, paper_code, paper_name FROM timetable") or []
+    }
+    summary = {"read": 0, "inserted": 0, "updated": 0, "unchanged": 0, "invalid": 0, "errors": []}
+    columns = ["exam_date", "session", "paper_code", "paper_name"]
+    batch = []
+
+    def flush():
+        if batch:
+            db.upsert_many("timetable", columns, columns[:3], batch, chunk_size)
+            batch.clear()
+        if progress:
+            progress(summary["read"], summary["inserted"] + summary["updated"])
+
+    with db.transaction():
+        for row_number, record in iter_records(path, TIMETABLE_COLUMNS):
+            summary["read"] += 1
+            try:
+                exam_date, session, paper_code, paper_name = parse_timetable_row(record)
+            except ValueError as e:
+                summary["invalid"] += 1
+                if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+                    summary["errors"].append(f"Row {row_number}: {e}")
+                continue
+
+            key = (exam_date, session, paper_code)
+            stored = existing.get(key)
+            if stored == paper_name:
+                summary["unchanged"] += 1
+                continue
+            summary["inserted" if stored is None else "updated"] += 1
+            existing[key] = paper_name
+            batch.append((exam_date, session, paper_code, paper_name))
+            if len(batch) >= chunk_size:
+                flush()
+        flush()
+    return summary
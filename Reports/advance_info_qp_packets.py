@@ -0,0 +1,18 @@
+import customtkinter as ctk
+from Reports.report_screen import build_report_screen
+
+
+# Display the advance Q.P. information screen
+def display_module(root):
+    build_report_screen(root, "Advance Information Of Q.P. Packets", ["advance_qp_info"])
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Advance Information Of Q.P. Packets")
+    root.geometry("900x600")
+    display_module(root)
+    root.mainloop()
@@ -0,0 +1,18 @@
+import customtkinter as ctk
+from Reports.report_screen import build_report_screen
+
+
+# Display the answer book receipt screen
+def display_module(root):
+    build_report_screen(root, "Daily Answer Book Bundle Receipt", ["daily_answer_book_receipt"])
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Daily Answer Book Bundle Receipt")
+    root.geometry("900x600")
+    display_module(root)
+    root.mainloop()
@@ -0,0 +1,18 @@
+import customtkinter as ctk
+from Reports.report_screen import build_report_screen
+
+
+# Display the officer in-charge document screen
+def display_module(root):
+    build_report_screen(root, "Document for Officer In-Charge", ["officer_in_charge"])
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Document for Officer In-Charge")
+    root.geometry("900x600")
+    display_module(root)
+    root.mainloop()
@@ -0,0 +1,18 @@
+import customtkinter as ctk
+from Reports.report_screen import build_report_screen
+
+
+# Display the blackboard details screen
+def display_module(root):
+    build_report_screen(root, "Examination Hall Black Board Details", ["blackboard_details"])
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Examination Hall Black Board Details")
+    root.geometry("900x600")
+    display_module(root)
+    root.mainloop()
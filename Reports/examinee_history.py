@@ -1 +1,18 @@
- 
+import customtkinter as ctk
+from Reports.report_screen import build_report_screen
+
+
+# Display the examinee history screen
+def display_module(root):
+    build_report_screen(root, "Examinee History For Session", ["examinee_history"])
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Examinee History For Session")
+    root.geometry("900x600")
+    display_module(root)
+    root.mainloop()
@@ -0,0 +1,72 @@
+"""PDF rendering for report jobs.
+
+This module runs inside worker processes, so it must not import the
+database layer or any GUI package: a job arrives as a plain dict and the
+only dependency is reportlab.
+"""
+import os
+from xml.sax.saxutils import escape
+
+PAGE_MARGIN = 36  # points (half an inch)
+TEMPLATE_VERSION = 2  # bump when the layout changes so cached reports are rebuilt
+
+
+def render_report(job):
+    """Render one report job to PDF and return the output path.
+
+    A job is a dict with `output`, `title`, `header_lines` and `sections`.
+    Each section is a dict with `heading`, `columns`, `rows` and optional
+    `col_widths` (fractions of the page width), `footer` and `new_page`.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+
+    page_size = landscape(A4) if job.get("landscape") else A4
+    os.makedirs(os.path.dirname(job["output"]), exist_ok=True)
+    tmp_path = job["output"] + ".part"
+    doc = SimpleDocTemplate(tmp_path, pagesize=page_size, title=job["title"],
+                            leftMargin=PAGE_MARGIN, rightMargin=PAGE_MARGIN, topMargin=PAGE_MARGIN, bottomMargin=PAGE_MARGIN)
+    styles = getSampleStyleSheet()
+    width = page_size[0] - 2 * PAGE_MARGIN
+    table_style = TableStyle([
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.grey),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#E0E0E0")),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 9),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ])
+
+    # Paragraph parses its text as markup; report text is plain, so "<", ">" and "&" must be escaped
+    def text(value, style):
+        return Paragraph(escape(str(value)), styles[style])
+
+    def page_header():
+        flowables = [text(job["title"], "Title")]
+        flowables += [text(line, "Normal") for line in job.get("header_lines", [])]
+        flowables.append(Spacer(1, 12))
+        return flowables
+
+    story = page_header()
+    for index, section in enumerate(job["sections"]):
+        if index and section.get("new_page"):
+            story.append(PageBreak())
+            story += page_header()
+        if section.get("heading"):
+            story.append(text(section["heading"], "Heading3"))
+        col_widths = [fraction * width for fraction in section["col_widths"]] if section.get("col_widths") else None
+        data = [section["columns"]] + [["" if value is None else str(value) for value in row] for row in section["rows"]]
+        table = Table(data, colWidths=col_widths, repeatRows=1)
+        table.setStyle(table_style)
+        story.append(table)
+        if section.get("footer"):
+            story.append(Spacer(1, 6))
+            story.append(text(section["footer"], "Normal"))
+        story.append(Spacer(1, 18))
+    if not job["sections"]:
+        story.append(text("No data for this session.", "Normal"))
+
+    doc.build(story)
+    os.replace(tmp_path, job["output"])
+    return job["output"]
@@ -1 +1,19 @@
- 
+import customtkinter as ctk
+from Reports.report_screen import build_report_screen
+from Reports.report_engine import REPORTS
+
+
+# Display the "print all reports for session" screen
+def display_module(root):
+    build_report_screen(root, "Print All Reports For Session", list(REPORTS))
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Print All Reports For Session")
+    root.geometry("900x600")
+    display_module(root)
+    root.mainloop()
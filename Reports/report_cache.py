@@ -0,0 +1,85 @@
+import os
+import threading
+import time
+
+CACHE_MAX_AGE_DAYS = 30
+CACHE_MAX_BYTES = 500 * 1024 * 1024
+VERSION_SUFFIX = ".version"
+
+
+class ReportCache:
+    """Generated PDFs kept on disk and reused while their data version matches.
+
+    Next to every PDF sits a small `<file>.version` sidecar holding the data
+    version it was rendered from. A lookup is a stat plus a tiny read, so
+    reprinting an unchanged report is instant. Reused files are touched, and
+    eviction removes reports older than `max_age_days` and then the least
+    recently used ones until the directory is under `max_bytes`.
+    """
+
+    def __init__(self, root, max_age_days=CACHE_MAX_AGE_DAYS, max_bytes=CACHE_MAX_BYTES):
+        self.root = root
+        self.max_age = max_age_days * 86400
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def lookup(self, path, version):
+        """Return True if `path` exists and was rendered from `version`."""
+        try:
+            with open(path + VERSION_SUFFIX) as f:
+                if f.read().strip() != version or not os.path.exists(path):
+                    return False
+            os.utime(path)
+            return True
+        except OSError:
+            return False
+
+    def store(self, path, version):
+        """Record the version a freshly rendered `path` was built from."""
+        with open(path + VERSION_SUFFIX, "w") as f:
+            f.write(version)
+
+    def invalidate(self, path):
+        for name in (path + VERSION_SUFFIX, path):
+            try:
+                os.remove(name)
+            except FileNotFoundError:
+                pass
+
+    def evict(self, keep=()):
+        """Drop expired reports, then the oldest until under the size limit. Returns files removed."""
+        keep = {os.path.abspath(path) for path in keep}
+        with self._lock:
+            entries = []
+            for folder, _, files in os.walk(self.root):
+                for name in files:
+                    if not name.endswith(".pdf"):
+                        continue
+                    path = os.path.join(folder, name)
+                    try:
+                        stat = os.stat(path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+
+            now, removed = time.time(), 0
+            total = sum(size for _, size, _ in entries)
+            for mtime, size, path in entries:
+                if now - mtime <= self.max_age and total <= self.max_bytes:
+                    break
+                if os.path.abspath(path) in keep:
+                    continue
+                self.invalidate(path)
+                total -= size
+                removed += 1
+            self._remove_empty_folders()
+            return removed
+
+    def _remove_empty_folders(self):
+        for folder, subfolders, files in os.walk(self.root, topdown=False):
+            if folder != self.root and not subfolders and not files:
+                try:
+                    os.rmdir(folder)
+                except OSError:
+                    pass
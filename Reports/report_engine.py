@@ -0,0 +1,367 @@
+import atexit
+import hashlib
+import os
+import threading
+from collections import defaultdict, namedtuple
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from config.db_connection import db
+from config.config_store import config_store
+from Absent_Copy_Case_Nos.attendance import session_counts
+from Reports.pdf_templates import render_report, TEMPLATE_VERSION
+from Reports.report_cache import ReportCache
+
+OUTPUT_DIR = os.getenv("REPORTS_DIR") or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "generated_reports")
+SIGNATURE = ""  # blank column left for signatures and handwritten counts
+
+
+class SessionData:
+    """Everything the session reports need, read once from the database.
+
+    Report builders work only on this snapshot, so "print all" costs one set
+    of queries however many reports are rendered.
+    """
+
+    def __init__(self, exam_date, session):
+        self.exam_date, self.session = exam_date, session
+        self.blocks = db.fetch(
+            "SELECT b.id, b.block_no, l.room, b.capacity, b.allotted FROM blocks b "
+            "LEFT JOIN block_layout l ON l.block_no = b.block_no "
+            "WHERE b.exam_date = %s AND b.session = %s ORDER BY b.block_no", (exam_date, session)) or []
+        self.seats = defaultdict(list)  # block id -> seats in bench order
+        for row in db.fetch(
+                "SELECT s.block_id, s.bench_no, s.seat_no, s.paper_code, c.name, c.enrollment_no FROM block_seats s "
+                "LEFT JOIN seating_chart c ON c.seat_no = s.seat_no AND c.paper_code = s.paper_code "
+                "WHERE s.exam_date = %s AND s.session = %s ORDER BY s.block_id, s.bench_no", (exam_date, session)) or []:
+            self.seats[row["block_id"]].append(row)
+        self.supervisors = {
+            row["block_id"]: row for row in db.fetch(
+                "SELECT o.block_id, p.name, p.dept_code, p.desg FROM supervision_order o "
+                "JOIN supervisors p ON p.id = o.supervisor_id WHERE o.exam_date = %s AND o.session = %s",
+                (exam_date, session)) or []
+        }
+        self.paper_names = {
+            row["paper_code"]: row["paper_name"] for row in db.fetch(
+                "SELECT paper_code, paper_name FROM timetable WHERE exam_date = %s AND session = %s ORDER BY paper_code",
+                (exam_date, session)) or []
+        }
+        self.registered = {
+            row["paper_code"]: row["examinees"] for row in db.fetch(
+                "SELECT t.paper_code, COUNT(c.id) AS examinees FROM timetable t "
+                "LEFT JOIN seating_chart c ON c.paper_code = t.paper_code "
+                "WHERE t.exam_date = %s AND t.session = %s GROUP BY t.paper_code", (exam_date, session)) or []
+        }
+
+    @cached_property
+    def attendance(self):
+        """Per-block, per-paper attendance counters; only read by reports that need them."""
+        return session_counts(self.exam_date, self.session)
+
+    def block_label(self, block):
+        return f"Block {block['block_no']}" + (f" ({block['room']})" if block.get("room") else "")
+
+    def papers_in_block(self, block):
+        """{paper code: [seat numbers]} for one block, in bench order."""
+        papers = defaultdict(list)
+        for seat in self.seats[block["id"]]:
+            papers[seat["paper_code"]].append(seat["seat_no"])
+        return papers
+
+    def seated_per_paper(self):
+        counts = defaultdict(int)
+        for seats in self.seats.values():
+            for seat in seats:
+                counts[seat["paper_code"]] += 1
+        return counts
+
+
+def seat_ranges(seat_nos):
+    """Compress sorted seat numbers into 'first-last' runs of consecutive numbers."""
+    ranges, start, previous = [], None, None
+    for seat_no in sorted(seat_nos, key=lambda s: (len(s), s)):
+        if previous is not None and seat_no.isdigit() and previous.isdigit() and int(seat_no) == int(previous) + 1:
+            previous = seat_no
+            continue
+        if start is not None:
+            ranges.append(start if start == previous else f"{start}-{previous}")
+        start = previous = seat_no
+    if start is not None:
+        ranges.append(start if start == previous else f"{start}-{previous}")
+    return ", ".join(ranges)
+
+
+# ----- report builders: SessionData -> list of sections (see pdf_templates.render_report) -----
+
+def examinee_history(data):
+    rows = []
+    for block in data.blocks:
+        for seat in data.seats[block["id"]]:
+            rows.append((seat["seat_no"], seat["enrollment_no"], seat["name"], seat["paper_code"], block["block_no"], seat["bench_no"]))
+    rows.sort(key=lambda row: (row[0], row[3]))
+    return [{"columns": ["Seat No", "Enrollment No", "Name", "Paper", "Block", "Bench"], "rows": rows,
+             "col_widths": [0.14, 0.16, 0.38, 0.1, 0.1, 0.12]}]
+
+
+def students_attendance(data):
+    return [{
+        "heading": f"{data.block_label(block)} - Supervisor: {data.supervisors.get(block['id'], {}).get('name', '')}",
+        "columns": ["Bench", "Seat No", "Name", "Paper", "Answer Book No", "Signature"],
+        "rows": [(s["bench_no"], s["seat_no"], s["name"], s["paper_code"], SIGNATURE, SIGNATURE) for s in data.seats[block["id"]]],
+        "col_widths": [0.07, 0.13, 0.36, 0.1, 0.16, 0.18],
+        "footer": "Present: ______   Absent: ______   Supervisor's signature: ______________",
+        "new_page": True,
+    } for block in data.blocks]
+
+
+def supervisor_report(data):
+    rows = []
+    for block in data.blocks:
+        sup = data.supervisors.get(block["id"], {})
+        rows.append((block["block_no"], block.get("room"), block["allotted"], sup.get("name"), sup.get("dept_code"), sup.get("desg"), SIGNATURE))
+    return [{"columns": ["Block", "Room", "Examinees", "Supervisor", "Dept", "Designation", "Signature"], "rows": rows,
+             "col_widths": [0.08, 0.1, 0.1, 0.28, 0.08, 0.18, 0.18]}]
+
+
+def block_wise_seating_chart(data):
+    return [{
+        "heading": f"{data.block_label(block)} - {block['allotted']} examinees",
+        "columns": ["Bench", "Seat No", "Enrollment No", "Name", "Paper"],
+        "rows": [(s["bench_no"], s["seat_no"], s["enrollment_no"], s["name"], s["paper_code"]) for s in data.seats[block["id"]]],
+        "col_widths": [0.08, 0.15, 0.17, 0.45, 0.15],
+        "new_page": True,
+    } for block in data.blocks]
+
+
+def seating_arrangement(data):
+    rows = []
+    for block in data.blocks:
+        for paper_code, seat_nos in sorted(data.papers_in_block(block).items()):
+            rows.append((block["block_no"], block.get("room"), paper_code, seat_ranges(seat_nos), len(seat_nos)))
+    return [{"columns": ["Block", "Room", "Paper", "Seat Numbers", "Count"], "rows": rows,
+             "col_widths": [0.08, 0.1, 0.1, 0.6, 0.12]}]
+
+
+def blackboard_details(data):
+    return [{
+        "heading": data.block_label(block),
+        "columns": ["Paper Code", "Paper Name", "Seat Numbers", "Count"],
+        "rows": [(code, data.paper_names.get(code), seat_ranges(seat_nos), len(seat_nos))
+                 for code, seat_nos in sorted(data.papers_in_block(block).items())],
+        "col_widths": [0.12, 0.3, 0.46, 0.12],
+        "new_page": True,
+    } for block in data.blocks]
+
+
+def officer_in_charge(data):
+    seated = data.seated_per_paper()
+    blocks_per_paper = defaultdict(list)
+    for block in data.blocks:
+        for code in data.papers_in_block(block):
+            blocks_per_paper[code].append(str(block["block_no"]))
+    rows = [(code, data.paper_names.get(code), data.registered.get(code, 0), seated.get(code, 0), ", ".join(blocks_per_paper[code]))
+            for code in sorted(set(data.paper_names) | set(seated))]
+    return [{"columns": ["Paper Code", "Paper Name", "Registered", "Seated", "Blocks"], "rows": rows,
+             "col_widths": [0.12, 0.34, 0.12, 0.1, 0.32],
+             "footer": f"Blocks in use: {len(data.blocks)}   Supervisors on duty: {len(data.supervisors)}"}]
+
+
+def blank_absent_report(data):
+    rows = []
+    for block in data.blocks:
+        for code, seat_nos in sorted(data.papers_in_block(block).items()):
+            rows.append((block["block_no"], code, len(seat_nos), SIGNATURE, SIGNATURE, SIGNATURE))
+    return [{"columns": ["Block", "Paper", "Allotted", "Absent Seat Numbers", "Present", "Supervisor"], "rows": rows,
+             "col_widths": [0.08, 0.1, 0.1, 0.42, 0.1, 0.2]}]
+
+
+def paper_account(columns, widths):
+    """Per-paper table with the seated count and blank columns for the hand-filled figures."""
+    def build(data):
+        seated = data.seated_per_paper()
+        blanks = (SIGNATURE,) * (len(columns) - 3)
+        rows = [(code, data.paper_names.get(code), seated.get(code, 0)) + blanks
+                for code in sorted(set(data.paper_names) | set(seated))]
+        return [{"columns": columns, "rows": rows, "col_widths": widths}]
+    return build
+
+
+def packing_slip(data):
+    return [{
+        "heading": data.block_label(block),
+        "columns": ["Paper Code", "Paper Name", "Answer Books", "Absent", "Bundle No", "Sealed By"],
+        "rows": [(code, data.paper_names.get(code), len(seat_nos), SIGNATURE, SIGNATURE, SIGNATURE)
+                 for code, seat_nos in sorted(data.papers_in_block(block).items())],
+        "col_widths": [0.12, 0.3, 0.14, 0.1, 0.14, 0.2],
+    } for block in data.blocks]
+
+
+def advance_qp_info(data):
+    rows = [(code, name, data.registered.get(code, 0), SIGNATURE) for code, name in sorted(data.paper_names.items())]
+    return [{"columns": ["Paper Code", "Paper Name", "Registered Examinees", "Packets Expected"], "rows": rows,
+             "col_widths": [0.14, 0.46, 0.2, 0.2]}]
+
+
+def attendance_report(data):
+    per_paper = defaultdict(lambda: [0, 0, 0])
+    per_block = defaultdict(lambda: [0, 0, 0])
+    for row in data.attendance:
+        for totals in (per_paper[row["paper_code"]], per_block[row["block_no"]]):
+            totals[0] += row["allotted"]
+            totals[1] += row["absent"]
+            totals[2] += row["copy_case"]
+    columns = ["Allotted", "Present", "Absent", "Copy Case"]
+    counts = lambda t: (t[0], t[0] - t[1], t[1], t[2])
+    allotted, absent, copy_case = (sum(t[i] for t in per_block.values()) for i in range(3))
+    return [
+        {"heading": "Paper-wise", "columns": ["Paper Code", "Paper Name"] + columns,
+         "rows": [(code, data.paper_names.get(code)) + counts(t) for code, t in sorted(per_paper.items())],
+         "col_widths": [0.12, 0.4, 0.12, 0.12, 0.12, 0.12]},
+        {"heading": "Block-wise", "columns": ["Block"] + columns,
+         "rows": [(block_no,) + counts(t) for block_no, t in sorted(per_block.items())],
+         "col_widths": [0.2, 0.2, 0.2, 0.2, 0.2],
+         "footer": f"Total allotted: {allotted}   Present: {allotted - absent}   Absent: {absent}   Copy cases: {copy_case}"},
+    ]
+
+
+class Report(namedtuple("Report", "title build landscape tables")):
+    """A session report: its builder and the tables whose changes invalidate it."""
+
+
+SEATS = ("blocks", "block_seats")
+ROOMS = ("blocks", "block_layout", "block_seats")
+DUTIES = ("supervision_order", "supervisors")
+
+REPORTS = {
+    "examinee_history": Report("Examinee History For Session", examinee_history, False, SEATS + ("seating_chart",)),
+    "students_attendance": Report("Student's Attendance Report", students_attendance, False, ROOMS + DUTIES + ("seating_chart",)),
+    "supervisor_report": Report("Supervisor Report (Appendix - 'B')", supervisor_report, True, ROOMS + DUTIES),
+    "block_wise_seating_chart": Report("Block Wise Examinee Seating Chart", block_wise_seating_chart, False, ROOMS + ("seating_chart",)),
+    "seating_arrangement": Report("Seating Arrangement For Examinee", seating_arrangement, True, ROOMS),
+    "blackboard_details": Report("Examination Hall Black Board Details", blackboard_details, True, ROOMS + ("timetable",)),
+    "officer_in_charge": Report("Document for Officer In-Charge", officer_in_charge, True, SEATS + DUTIES + ("timetable", "seating_chart")),
+    "blank_absent_report": Report("Session Wise Blank Absent Report", blank_absent_report, True, SEATS),
+    "qp_packet_receipt": Report("Q.P. Packet Receipt To Controller", paper_account(
+        ["Paper Code", "Paper Name", "Examinees", "Packets Received", "Received By"], [0.12, 0.4, 0.12, 0.16, 0.2]), True, SEATS + ("timetable",)),
+    "packing_slip": Report("Packing Slip For Answer Book Bundle", packing_slip, True, ROOMS + ("timetable",)),
+    "daily_answer_book_receipt": Report("Daily Answer Book Bundle Receipt", paper_account(
+        ["Paper Code", "Paper Name", "Examinees", "Answer Books", "Bundles", "Received By"], [0.12, 0.34, 0.12, 0.14, 0.1, 0.18]), True, SEATS + ("timetable",)),
+    "daily_qp_account": Report("Daily Question Paper Account", paper_account(
+        ["Paper Code", "Paper Name", "Examinees", "Q.P. Received", "Q.P. Used", "Q.P. Balance"], [0.12, 0.34, 0.12, 0.14, 0.14, 0.14]), True, SEATS + ("timetable",)),
+    "attendance_report": Report("Attendance Report - 'A' (Consolidated)", attendance_report, True,
+                                ("attendance_counts", "blocks", "timetable")),
+    "advance_qp_info": Report("Advance Information Of Q.P. Packets", advance_qp_info, False, ("timetable", "seating_chart")),
+}
+
+report_cache = ReportCache(OUTPUT_DIR)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _executor():
+    """The shared rendering pool, started on first use and kept for later prints."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+            atexit.register(_pool.shutdown, cancel_futures=True)
+        return _pool
+
+
+def _reset_executor():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def output_path(exam_date, session, key):
+    return os.path.join(OUTPUT_DIR, f"{exam_date}_{session}", f"{key}.pdf")
+
+
+def session_header(exam_date, session):
+    institute = config_store.get("institute", default={}) or {}
+    return [
+        f"{institute.get('INS_NAME', '')} ({institute.get('INS_CODE', '')}) - Exam Centre: {institute.get('EXAM_CENTER', '')}",
+        f"Exam Period: {config_store.get('exam_details', 'EXAM_PERIOD', '')}    Date: {exam_date}    Session: {session}",
+    ]
+
+
+def data_version(key, versions, header_lines):
+    """Digest of everything a report's output depends on: its tables' change counters,
+    the page header and the template revision."""
+    parts = [key, str(TEMPLATE_VERSION)] + header_lines + [f"{table}={versions[table]}" for table in sorted(REPORTS[key].tables)]
+    return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def build_jobs(keys, exam_date, session, header_lines=None):
+    """Collect data once and turn each requested report into a picklable render job."""
+    data = SessionData(exam_date, session)
+    header_lines = header_lines or session_header(exam_date, session)
+    jobs = []
+    for key in keys:
+        report = REPORTS[key]
+        sections = report.build(data)
+        jobs.append({"key": key, "title": report.title, "header_lines": header_lines, "sections": sections,
+                     "landscape": report.landscape, "output": output_path(exam_date, session, key),
+                     "size": sum(len(section["rows"]) for section in sections)})
+    return jobs
+
+
+def render_reports(keys, exam_date, session, progress=None, force=False):
+    """Render the given reports for a session and return {key: pdf path}.
+
+    Reports whose data version matches a PDF already on disk are served
+    from the cache; `force` rebuilds them anyway. Table versions are read
+    before the data, so a write that lands in between only causes an
+    extra rebuild later, never a stale hit.
+
+    Each remaining report is one task in a process pool, largest first, so
+    a batch finishes in about the time of its slowest report. With a single
+    job or a single core the report is rendered in this process instead.
+    `progress(done, total)` is called as reports finish.
+    """
+    header_lines = session_header(exam_date, session)
+    versions = db.table_versions({table for key in keys for table in REPORTS[key].tables})
+    wanted = {key: data_version(key, versions, header_lines) for key in keys} if versions is not None else {}
+
+    results = {}
+    for key in keys:
+        path = output_path(exam_date, session, key)
+        if not force and key in wanted and report_cache.lookup(path, wanted[key]):
+            results[key] = path
+    stale = [key for key in keys if key not in results]
+    if progress:
+        progress(len(results), len(keys))
+
+    def finished(key, path):
+        results[key] = path
+        if key in wanted:
+            report_cache.store(path, wanted[key])
+        if progress:
+            progress(len(results), len(keys))
+
+    jobs = sorted(build_jobs(stale, exam_date, session, header_lines), key=lambda job: job["size"], reverse=True) if stale else []
+    if len(jobs) <= 1 or (os.cpu_count() or 1) == 1:
+        for job in jobs:
+            finished(job["key"], render_report(job))
+    else:
+        try:
+            futures = {_executor().submit(render_report, job): job["key"] for job in jobs}
+            for future in as_completed(futures):
+                finished(futures[future], future.result())
+        except BrokenProcessPool:
+            # A worker died (e.g. killed by the OS); start a fresh pool next time
+            _reset_executor()
+            raise
+    if jobs:
+        report_cache.evict(keep=results.values())
+    return results
+
+
+def print_all_reports(exam_date, session, progress=None, force=False):
+    """Render every session report. Returns {key: pdf path}."""
+    return render_reports(list(REPORTS), exam_date, session, progress, force)
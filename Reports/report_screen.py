@@ -0,0 +1,108 @@
+import os
+import time
+import webbrowser
+import customtkinter as ctk
+from tkinter import messagebox
+from tkcalendar import DateEntry
+from config.config_store import config_store
+from config.async_query import run_in_background
+from config.init import SESSIONS
+from Reports.report_engine import REPORTS, render_reports
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+PROGRESS_POLL_MS = 200
+
+
+def open_file(path):
+    """Open a generated PDF in the system viewer."""
+    if hasattr(os, "startfile"):
+        os.startfile(path)
+    else:
+        webbrowser.open("file://" + os.path.abspath(path))
+
+
+# Build a report screen that renders `keys` (from report_engine.REPORTS) for a chosen session
+def build_report_screen(root, title, keys):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text=title, font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=15)
+
+    ctk.CTkLabel(form_frame, text="Exam Date:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    date_entry = DateEntry(form_frame, font=NORMAL_FONT, date_pattern="yyyy-mm-dd", background=ACCENT_COLOR, foreground=TEXT_COLOR, borderwidth=2)
+    date_entry.pack(side="left", padx=10)
+
+    ctk.CTkLabel(form_frame, text="Session:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    session_var = ctk.StringVar(value=SESSIONS[0])
+    ctk.CTkComboBox(form_frame, variable=session_var, values=list(SESSIONS), font=NORMAL_FONT, width=160).pack(side="left", padx=10)
+
+    force_var = ctk.BooleanVar(value=False)
+    ctk.CTkCheckBox(form_frame, text="Rebuild unchanged reports", variable=force_var, font=NORMAL_FONT,
+                    text_color=TEXT_COLOR).pack(side="left", padx=10)
+
+    generate_button = ctk.CTkButton(content_frame, text="Generate PDF", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    status_label = ctk.CTkLabel(content_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR)
+    files_frame = ctk.CTkScrollableFrame(content_frame, fg_color=BACKGROUND_COLOR)
+    progress = {"done": 0, "total": len(keys), "running": False}
+
+    # render_reports reports progress from its worker thread; the Tk thread polls it
+    def on_progress(done, total):
+        progress["done"], progress["total"] = done, total
+
+    def poll_progress():
+        if progress["running"] and status_label.winfo_exists():
+            status_label.configure(text=f"Rendering reports... {progress['done']} of {progress['total']} done")
+            status_label.after(PROGRESS_POLL_MS, poll_progress)
+
+    def generate():
+        exam_date, session, force = date_entry.get_date(), session_var.get(), force_var.get()
+        progress.update(done=0, total=len(keys), running=True)
+        generate_button.configure(state="disabled")
+        for widget in files_frame.winfo_children(): widget.destroy()
+        started = time.perf_counter()
+        poll_progress()
+        run_in_background(content_frame, lambda: render_reports(keys, exam_date, session, on_progress, force),
+                          on_done=lambda paths: show_files(paths, time.perf_counter() - started), on_error=fail)
+
+    def show_files(paths, elapsed):
+        progress["running"] = False
+        generate_button.configure(state="normal")
+        status_label.configure(text=f"{len(paths)} report(s) ready in {elapsed:.1f} s")
+        for key in keys:
+            if key not in paths:
+                continue
+            row = ctk.CTkFrame(files_frame, fg_color=BACKGROUND_COLOR)
+            row.pack(fill="x", pady=3)
+            ctk.CTkLabel(row, text=REPORTS[key].title, font=NORMAL_FONT, text_color=TEXT_COLOR, anchor="w").pack(side="left", padx=10, fill="x", expand=True)
+            ctk.CTkButton(row, text="Open", font=NORMAL_FONT, width=80, fg_color=ACCENT_COLOR, hover_color="#2a5d8f",
+                          command=lambda p=paths[key]: open_file(p)).pack(side="right", padx=10)
+
+    def fail(error):
+        progress["running"] = False
+        generate_button.configure(state="normal")
+        status_label.configure(text="")
+        messagebox.showerror("Error", f"Report generation failed: {error}")
+
+    generate_button.configure(command=generate)
+    generate_button.pack(pady=10)
+    status_label.pack(pady=5)
+    files_frame.pack(fill="both", expand=True, padx=20, pady=10)
@@ -1 +1,18 @@
- 
+import customtkinter as ctk
+from Reports.report_screen import build_report_screen
+
+
+# Display the supervisor report screen
+def display_module(root):
+    build_report_screen(root, "Supervisor Report (Appendix - 'B')", ["supervisor_report"])
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Supervisor Report (Appendix - 'B')")
+    root.geometry("900x600")
+    display_module(root)
+    root.mainloop()
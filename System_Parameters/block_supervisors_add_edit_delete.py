@@ -1,7 +1,8 @@
 import customtkinter as ctk
-from tkinter import messagebox, ttk
-import json
-from config.db_connection import db
+from tkinter import messagebox
+from config.config_store import config_store
+from config.supervisor_repository import supervisor_repository
+from config.virtual_table import VirtualTable
 
 
 def display_module(master):
@@ -15,16 +16,17 @@ class BlockSupervisorApp(ctk.CTkFrame):
         self.master.configure(fg_color="#1E1E1E")
         self.data = self.load_data()
         self.fonts = self.data.get("fonts", {})  # Load fonts from the JSON
+        self.dept_names = {dept["code"]: dept["name"] for dept in self.data["departments"]}
+        self.dept_codes = {dept["name"]: dept["code"] for dept in self.data["departments"]}
         self.create_widgets()
 
     def load_data(self):
-        """Load department, role, and font data from JSON."""
-        try:
-            with open('config/data.json', 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
+        """Load department, role, and font data from the shared config."""
+        data = config_store.data()
+        if not data:
             messagebox.showerror("Error", "Error loading or parsing 'data.json'.")
             return {"departments": [], "roles": [], "fonts": {}}  # Return empty fonts if there's an error
+        return data
 
     def create_widgets(self):
         """Create all the widgets for the supervisor management interface."""
@@ -80,59 +82,46 @@ class BlockSupervisorApp(ctk.CTkFrame):
             button.grid(row=0, column=idx, padx=10)
 
     def create_supervisor_table(self):
-        """Create a table to display supervisor information."""
-        columns = ("Name", "Department", "Designation", "RFID")
-        
-        self.tree = ttk.Treeview(self, columns=columns, show="headings", height=100)
-        self.tree.grid(row=5, column=0, columnspan=2, pady=40, padx=20)
-
-        for col in columns:
-            self.tree.heading(col, text=col, anchor="center")
-            self.tree.column(col, anchor="center", width=200)
-
-        style = ttk.Style()
+        """Create a paged table to display supervisor information."""
         font = self.get_font("h4")
-        style.configure("Treeview.Heading", font=font)  # Font for the headings
-        style.configure("Treeview", font=font)  # Font for the rows
-
-        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
-        self.tree.configure(yscroll=scrollbar.set)
-        scrollbar.grid(row=5, column=2, sticky='ns')
+        search_frame = ctk.CTkFrame(self, fg_color="transparent")
+        search_frame.grid(row=5, column=0, columnspan=2, sticky="ew", padx=20)
+        ctk.CTkLabel(search_frame, text="Search:", font=font, text_color="#C7C7C7").pack(side="left", padx=(0, 10))
+        self.search_var = ctk.StringVar()
+        search_entry = ctk.CTkEntry(search_frame, textvariable=self.search_var, font=font, width=300, corner_radius=8, fg_color="#3C3C3C")
+        search_entry.pack(side="left")
+        search_entry.bind("<Return>", lambda _: self.table.set_filter(self.search_var.get()))
+
+        columns = [("name", "Name"), ("dept_code", "Department"), ("desg", "Designation"), ("rfid", "RFID")]
+        self.table = VirtualTable(self, "supervisors", columns, key="id", row_formatter=self.format_row, font=font,
+                                  display_filters={"dept_code": self.dept_codes_matching})
+        self.table.grid(row=6, column=0, columnspan=2, pady=(10, 40), padx=20, sticky="nsew")
+
+    def format_row(self, row):
+        """Turn a supervisors row into the values shown in the table."""
+        dept_name = self.dept_names.get(row["dept_code"], row["dept_code"])
+        return (row["name"], dept_name, row["desg"], row["rfid"])
+
+    def dept_codes_matching(self, text):
+        """Codes of the departments whose displayed name contains `text`."""
+        return [code for code, name in self.dept_names.items() if text.lower() in name.lower()]
 
     def load_supervisor_data(self):
-        """Load and display supervisor data from the database."""
-        self.tree.delete(*self.tree.get_children())
-
-        query = "SELECT name AS Name, dept_code AS Department, desg AS Designation, rfid AS RFID FROM supervisors"
-        
-        try:
-            results = db.fetch(query)
-            font = self.get_font("h4")
-            style = ttk.Style()
-            style.configure("Custom.Treeview", font=font, rowheight=35)  # Increased row height (30 pixels)
-            self.tree.configure(style="Custom.Treeview")
-
-            for row in results:
-                dept_name = next((dept["name"] for dept in self.data["departments"] if dept["code"] == row["Department"]), row["Department"])
-                self.tree.insert("", ctk.END, values=(row["Name"], dept_name, row["Designation"], row["RFID"]))
-        except Exception as e:
-            messagebox.showerror("Error", f"Error loading supervisor data: {e}")
+        """Reload the visible page of supervisors from the database."""
+        self.table.refresh()
 
     def add(self):
         """Add a new block supervisor entry."""
         form_data = {field: entry.get().strip() for field, entry in self.entries.items()}
-        dept_code = next((dept["code"] for dept in self.data["departments"] if dept["name"] == self.department_var.get()), "")
+        dept_code = self.dept_codes.get(self.department_var.get(), "")
         role = self.role_var.get().strip()
 
         if not all([form_data["Name of Block Supervisor"], form_data["Supervisor's RFID"], dept_code, role]):
             messagebox.showwarning("Incomplete Data", "Please fill in all fields before adding.")
             return
 
-        query = "INSERT INTO supervisors (name, dept_code, desg, rfid) VALUES (%s, %s, %s, %s)"
-        values = (form_data["Name of Block Supervisor"], dept_code, role, form_data["Supervisor's RFID"])
-
         try:
-            db.exec(query, values)
+            supervisor_repository.add(form_data["Name of Block Supervisor"], dept_code, role, form_data["Supervisor's RFID"])
             messagebox.showinfo("Success", "Block Supervisor added successfully.")
             self.load_supervisor_data()
             self.clear()
@@ -141,26 +130,22 @@ class BlockSupervisorApp(ctk.CTkFrame):
 
     def update(self):
         """Update the selected supervisor."""
-        selected_item = self.tree.selection()
-        if not selected_item:
+        selected_row = self.table.selected_row()
+        if not selected_row:
             messagebox.showwarning("No Selection", "Please select a supervisor to update.")
             return
 
-        selected_values = self.tree.item(selected_item[0], "values")
         form_data = {field: entry.get().strip() for field, entry in self.entries.items()}
 
-        dept_code = next((dept["code"] for dept in self.data["departments"] if dept["name"] == self.department_var.get()), "")
+        dept_code = self.dept_codes.get(self.department_var.get(), "")
         role = self.role_var.get().strip()
 
         if not all([form_data["Name of Block Supervisor"], form_data["Supervisor's RFID"], dept_code, role]):
             messagebox.showwarning("Incomplete Data", "Please fill in all fields before updating.")
             return
 
-        query = "UPDATE supervisors SET name = %s, dept_code = %s, desg = %s, rfid = %s WHERE rfid = %s"
-        values = (form_data["Name of Block Supervisor"], dept_code, role, form_data["Supervisor's RFID"], selected_values[3])
-
         try:
-            db.exec(query, values)
+            supervisor_repository.update(selected_row["id"], form_data["Name of Block Supervisor"], dept_code, role, form_data["Supervisor's RFID"])
             messagebox.showinfo("Success", "Block Supervisor updated successfully.")
             self.load_supervisor_data()
             self.clear()
@@ -169,16 +154,13 @@ class BlockSupervisorApp(ctk.CTkFrame):
 
     def delete(self):
         """Delete the selected supervisor."""
-        selected_item = self.tree.selection()
-        if not selected_item:
+        selected_row = self.table.selected_row()
+        if not selected_row:
             messagebox.showwarning("No Selection", "Please select a supervisor to delete.")
             return
 
-        selected_values = self.tree.item(selected_item[0], "values")
-        query = "DELETE FROM supervisors WHERE rfid = %s"
-
         try:
-            db.exec(query, (selected_values[3],))
+            supervisor_repository.delete(selected_row["id"])
             messagebox.showinfo("Success", "Block Supervisor deleted successfully.")
             self.load_supervisor_data()
             self.clear()
@@ -3,30 +3,26 @@ from tkinter import messagebox
 from tkcalendar import DateEntry
 import os
 import sys
-import json
 from PIL import Image
 
 # Configure paths and load the JSON configuration
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-CONFIG_DIR = os.path.join(BASE_DIR, '../config')
-data_path = os.path.join(CONFIG_DIR, 'data.json')  # Path for the JSON config
-sys.path.insert(0, CONFIG_DIR)
+sys.path.insert(0, os.path.join(BASE_DIR, '..'))
 
-from db_connection import db
+from config.async_query import run_in_background, LoadingIndicator
+from config.supervisor_repository import supervisor_repository
+from System_Parameters.supervision_scheduler import update_order_for_supervisor
+from config.config_store import config_store
 
-# Load configuration from JSON
-with open(data_path, 'r') as file:
-    config_data = json.load(file)
+# Font styles from the shared config
+FONT_H1 = config_store.font("h1")
+FONT_H2 = config_store.font("h2")
+FONT_H3 = config_store.font("h3")
+FONT_H4 = config_store.font("h4")
 
-# Font styles from JSON
-FONT_H1 = (config_data["fonts"]["h1"][0], config_data["fonts"]["h1"][1], config_data["fonts"]["h1"][2])
-FONT_H2 = (config_data["fonts"]["h2"][0], config_data["fonts"]["h2"][1], config_data["fonts"]["h2"][2])
-FONT_H3 = (config_data["fonts"]["h3"][0], config_data["fonts"]["h3"][1], config_data["fonts"]["h3"][2])
-FONT_H4 = (config_data["fonts"]["h4"][0], config_data["fonts"]["h4"][1], config_data["fonts"]["h4"][2])
-
-# Departments and Roles from JSON
-DEPARTMENTS = config_data["departments"]
-ROLES = config_data["roles"]
+# Departments and Roles from the shared config
+DEPARTMENTS = config_store.departments()
+ROLES = config_store.roles()
 
 # Color scheme
 BACKGROUND_COLOR = "#1E1E1E"
@@ -40,14 +36,22 @@ class SupervisorConstraintsApp(ctk.CTkFrame):
     def __init__(self, master):
         super().__init__(master, fg_color=BACKGROUND_COLOR)
         self.master = master
-        self.db = db
-        self.supervisors = self.load_supervisors()
+        self.repository = supervisor_repository
+        self.supervisors = []
         self.create_widgets()
         self.pack(fill="both", expand=True, padx=20, pady=20)
+        self.pending_query = self.load_supervisors()
 
     def load_supervisors(self):
-        query = "SELECT id, name, rfid, dept_code, desg FROM supervisors"
-        return self.db.fetch(query) or []
+        """Load the shared supervisor repository in the background and fill the dropdown."""
+        return run_in_background(self, self.repository.ensure_loaded, on_done=self.set_supervisors,
+                                 on_error=lambda e: messagebox.showerror("Error", f"Error loading supervisors: {e}"),
+                                 loading=self.loading)
+
+    def set_supervisors(self, repository):
+        self.pending_query = None
+        self.supervisors = repository.all()
+        self.supervisor_dropdown.configure(values=[sup['name'] for sup in self.supervisors])
 
     def create_widgets(self):
         """Create all widgets in the supervisor constraints UI."""
@@ -78,6 +82,7 @@ class SupervisorConstraintsApp(ctk.CTkFrame):
         self.supervisor_dropdown = ctk.CTkComboBox(selection_frame, variable=self.supervisor_var, values=[sup['name'] for sup in self.supervisors], font=FONT_H3, width=300, fg_color=BUTTON_COLOR, text_color=TEXT_COLOR, dropdown_fg_color=BUTTON_COLOR, dropdown_text_color=TEXT_COLOR, dropdown_hover_color=BUTTON_HOVER_COLOR)
         self.supervisor_dropdown.pack(side="left", padx=10)
         self.supervisor_dropdown.bind("<<ComboboxSelected>>", self.update_readonly_fields)
+        self.loading = LoadingIndicator(selection_frame, text="Loading supervisors...", font=FONT_H3)
 
         # Supervisor details frame
         details_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
@@ -125,35 +130,43 @@ class SupervisorConstraintsApp(ctk.CTkFrame):
         selected_name = self.supervisor_var.get()
         print("Selected supervisor:", selected_name)  # Debug: Check selected name
         
-        supervisor = next((sup for sup in self.supervisors if sup['name'] == selected_name), None)
+        supervisor = self.repository.first_by_name(selected_name)
         if supervisor:
             print("Supervisor data:", supervisor)  # Debug: Check supervisor data
             for key, entry in self.entries.items():
                 entry.configure(state="normal")
                 entry.delete(0, ctk.END)
-                entry.insert(0, supervisor[key])
+                entry.insert(0, supervisor[key] or "")
                 entry.configure(state="readonly")
         else:
             print("Supervisor not found!")  # Debugging message
 
-    def add_or_update(self, query, success_msg):
-        supervisor_name = self.supervisor_var.get()
-        supervisor_id = next((sup['id'] for sup in self.supervisors if sup['name'] == supervisor_name), None)
+    def add_or_update(self, success_msg):
+        supervisor = self.repository.first_by_name(self.supervisor_var.get())
+        supervisor_id = supervisor['id'] if supervisor else None
         if not all([supervisor_id, self.date_from.get(), self.date_to.get()]):
             messagebox.showwarning("Required Fields", "Please complete all fields.")
             return
-        try:
-            self.db.exec(query, (self.date_from.get(), self.date_to.get(), supervisor_id))
-            messagebox.showinfo(success_msg, f"Supervisor constraint {success_msg.lower()} successfully.")
-            self.clear()
-        except Exception as e:
-            messagebox.showerror("Error", f"Error: {e}")
+        start_date, end_date = self.date_from.get_date(), self.date_to.get_date()
+        # Saves the window and moves any duties that now fall outside it
+        run_in_background(self, lambda: update_order_for_supervisor(supervisor_id, start_date, end_date),
+                          on_done=lambda result: self.show_order_changes(result, success_msg),
+                          on_error=lambda e: messagebox.showerror("Error", f"Error: {e}"))
+        self.clear()
+
+    def show_order_changes(self, result, success_msg):
+        messagebox.showinfo(success_msg, f"Supervisor constraint {success_msg.lower()} successfully.")
+        if result["changed"]:
+            message = f"{result['changed']} supervision duties were reassigned."
+            if result["unassigned"]:
+                message += f" {result['unassigned']} blocks have no available supervisor."
+            messagebox.showinfo("Supervision Order", message)
 
     def add(self):
-        self.add_or_update("UPDATE supervisors SET start_date=%s, end_date=%s WHERE id=%s", "Added")
+        self.add_or_update("Added")
 
     def update(self):
-        self.add_or_update("UPDATE supervisors SET start_date=%s, end_date=%s WHERE id=%s", "Updated")
+        self.add_or_update("Updated")
 
     def clear(self):
         """Clear all fields."""
@@ -0,0 +1,79 @@
+import customtkinter as ctk
+from tkinter import messagebox
+from tkcalendar import DateEntry
+from config.config_store import config_store
+from config.async_query import run_in_background, LoadingIndicator
+from System_Parameters.supervision_scheduler import generate_supervision_order
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+
+# Display the supervision order screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Create Supervision Order", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    # Exam period defaults to the dates saved under Institute Information
+    date_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    date_frame.pack(fill="x", padx=20, pady=15)
+    entries = []
+    for label, key in (("From:", "EXAM_START_DATE"), ("To:", "EXAM_END_DATE")):
+        default_date = config_store.date("exam_details", key)
+        ctk.CTkLabel(date_frame, text=label, font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+        entry = DateEntry(date_frame, font=NORMAL_FONT, year=default_date.year, month=default_date.month, day=default_date.day,
+                          date_pattern="yyyy-mm-dd", background=ACCENT_COLOR, foreground=TEXT_COLOR, borderwidth=2)
+        entry.pack(side="left", padx=10)
+        entries.append(entry)
+
+    summary_label = ctk.CTkLabel(content_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR, justify="left")
+    loading = LoadingIndicator(content_frame, text="Creating supervision order...", font=NORMAL_FONT)
+
+    def generate():
+        start_date, end_date = entries[0].get_date(), entries[1].get_date()
+        if start_date > end_date:
+            messagebox.showwarning("Invalid Period", "The start date must be before the end date.")
+            return
+        run_in_background(
+            content_frame, lambda: generate_supervision_order(start_date, end_date),
+            on_done=show_summary, on_error=lambda e: messagebox.showerror("Error", f"Could not create supervision order: {e}"),
+            loading=loading
+        )
+
+    def show_summary(summary):
+        text = (f"{summary['assigned']} of {summary['blocks']} block-sessions assigned to "
+                f"{summary['supervisors_on_duty']} supervisors.")
+        if summary["unassigned"]:
+            text += f"\n{summary['unassigned']} block-sessions have no available supervisor."
+        summary_label.configure(text=text)
+
+    ctk.CTkButton(content_frame, text="Generate Order", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f",
+                  command=generate).pack(pady=20)
+    summary_label.pack(pady=10)
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Create Supervision Order")
+    root.geometry("800x400")
+    display_module(root)
+    root.mainloop()
@@ -1 +1,146 @@
- 
+import customtkinter as ctk
+from datetime import datetime
+from tkinter import filedialog, messagebox
+from tkcalendar import DateEntry
+from config.config_store import config_store
+from config.async_query import run_in_background, LoadingIndicator
+from config.init import SESSIONS
+from System_Parameters.rfid_checkin import CheckInPipeline, KeyboardWedgeBuffer, replay_file, ACCEPTED, UNKNOWN
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+STATUS_POLL_MS = 500
+MAX_LOG_LINES = 200
+
+
+# Display the RFID daily attendance screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Daily Attendance", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=15)
+
+    ctk.CTkLabel(form_frame, text="Exam Date:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    date_entry = DateEntry(form_frame, font=NORMAL_FONT, date_pattern="yyyy-mm-dd", background=ACCENT_COLOR, foreground=TEXT_COLOR, borderwidth=2)
+    date_entry.pack(side="left", padx=10)
+
+    ctk.CTkLabel(form_frame, text="Session:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    session_var = ctk.StringVar(value=SESSIONS[0] if datetime.now().hour < 13 else SESSIONS[1])
+    ctk.CTkComboBox(form_frame, variable=session_var, values=list(SESSIONS), font=NORMAL_FONT, width=160).pack(side="left", padx=10)
+
+    start_button = ctk.CTkButton(form_frame, text="Start Check-In", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    start_button.pack(side="left", padx=10)
+    replay_button = ctk.CTkButton(form_frame, text="Load Scans From File", font=NORMAL_FONT, fg_color="#3C3C3C",
+                                  hover_color="#4E4E4E", state="disabled")
+    replay_button.pack(side="left", padx=10)
+
+    scan_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    scan_frame.pack(fill="x", padx=20, pady=10)
+    ctk.CTkLabel(scan_frame, text="Scan Card:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    scan_entry = ctk.CTkEntry(scan_frame, font=NORMAL_FONT, width=300, state="disabled")
+    scan_entry.pack(side="left", padx=10)
+    counts_label = ctk.CTkLabel(scan_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR)
+    counts_label.pack(side="left", padx=20)
+
+    log_box = ctk.CTkTextbox(content_frame, font=NORMAL_FONT, fg_color=BACKGROUND_COLOR, text_color=TEXT_COLOR, state="disabled")
+    log_box.pack(fill="both", expand=True, padx=20, pady=10)
+    loading = LoadingIndicator(content_frame, text="Loading supervisors...", font=NORMAL_FONT)
+
+    state = {"pipeline": None}
+    wedge = KeyboardWedgeBuffer()
+
+    def start():
+        if state["pipeline"] is not None:
+            state["pipeline"].stop(wait=False)
+            state["pipeline"] = None
+        pipeline = CheckInPipeline(date_entry.get_date(), session_var.get())
+        run_in_background(content_frame, pipeline.start, on_done=started, loading=loading,
+                          on_error=lambda e: messagebox.showerror("Error", f"Could not start check-in: {e}"))
+
+    def started(pipeline):
+        state["pipeline"] = pipeline
+        scan_entry.configure(state="normal")
+        replay_button.configure(state="normal")
+        scan_entry.focus_set()
+        log(f"Check-in open for {pipeline.exam_date} {pipeline.session}: "
+            f"{len(pipeline.checked_in)} already checked in, {len(pipeline.on_duty)} on duty.")
+        poll_status()
+
+    def show_ack(ack):
+        supervisor = ack["supervisor"]
+        if ack["status"] == UNKNOWN:
+            text = f"Card {ack['rfid']} is not registered"
+        else:
+            text = f"{supervisor['name']} ({supervisor['dept_code']})" + ("" if ack["on_duty"] or ack["status"] != ACCEPTED else " - not on duty")
+        log(f"{ack['time']:%H:%M:%S}  {ack['status'].upper():<20} {text}")
+
+    # The reader types the card number and Enter into the focused entry
+    def on_key(event):
+        pipeline = state["pipeline"]
+        code = wedge.feed("\r" if event.keysym in ("Return", "KP_Enter") else event.char)
+        if code is None or pipeline is None:
+            return
+        scan_entry.delete(0, ctk.END)
+        show_ack(pipeline.scan(code))
+        return "break"
+
+    def replay():
+        path = filedialog.askopenfilename(filetypes=[("Text files", "*.txt *.csv"), ("All files", "*.*")])
+        if path and state["pipeline"] is not None:
+            for ack in replay_file(state["pipeline"], path):
+                show_ack(ack)
+
+    def log(line):
+        log_box.configure(state="normal")
+        log_box.insert("1.0", line + "\n")
+        log_box.delete(f"{MAX_LOG_LINES + 1}.0", "end")
+        log_box.configure(state="disabled")
+
+    def poll_status():
+        pipeline = state["pipeline"]
+        if pipeline is None or not counts_label.winfo_exists():
+            return
+        on_duty_in = len(pipeline.checked_in & pipeline.on_duty)
+        counts_label.configure(text=f"Checked in: {len(pipeline.checked_in)}   On duty present: {on_duty_in}/{len(pipeline.on_duty)}"
+                                    f"   Waiting to save: {pipeline.pending()}")
+        counts_label.after(STATUS_POLL_MS, poll_status)
+
+    # CTkFrame.bind binds on the frame's inner canvas, so the event comes from that canvas, never from content_frame
+    def on_destroy(event=None):
+        if state["pipeline"] is not None:
+            state["pipeline"].stop(wait=False)
+            state["pipeline"] = None
+
+    start_button.configure(command=start)
+    replay_button.configure(command=replay)
+    scan_entry.bind("<Key>", on_key)
+    content_frame.bind("<Destroy>", on_destroy)
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Daily Attendance")
+    root.geometry("1000x600")
+    display_module(root)
+    root.mainloop()
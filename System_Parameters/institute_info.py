@@ -1,23 +1,11 @@
 import customtkinter as ctk
-import json
 from tkcalendar import DateEntry
-from datetime import datetime
+from config.config_store import config_store
 
-# Load font data from the JSON configuration file
-def load_fonts():
-    try:
-        with open('config/data.json', 'r') as f:
-            data = json.load(f)
-            return data.get("fonts", {})
-    except (FileNotFoundError, json.JSONDecodeError):
-        print("Error loading font data.")
-        return {}
-
-# Define font sizes based on loaded JSON
-fonts = load_fonts()
-HEADING_FONT = tuple(fonts.get("h2", ["Lexend", 24, "bold"]))
-NORMAL_FONT = tuple(fonts.get("h4", ["Lexend", 14, "normal"]))
-BUTTON_FONT = tuple(fonts.get("h4", ["Lexend", 14, "normal"]))
+# Define font sizes based on the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+BUTTON_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
 
 # Color scheme
 BACKGROUND_COLOR = "#1a1a1a"
@@ -28,16 +16,8 @@ ACCENT_COLOR = "#3a7ebf"
 # Update data.json with new institute and exam details
 def update_data_json(institute_data, exam_data):
     try:
-        with open('config/data.json', 'r') as f:
-            data = json.load(f)
-        
-        # Update institute and exam details
-        data['institute'] = institute_data
-        data['exam_details'] = exam_data
-        
-        with open('config/data.json', 'w') as f:
-            json.dump(data, f, indent=4)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        config_store.update(institute=institute_data, exam_details=exam_data)
+    except OSError as e:
         print(f"Error updating data.json: {e}")
 
 # Display the main UI for managing institute and exam info
@@ -111,20 +91,13 @@ def create_date_entry(parent, label, default_date):
     entry.pack(side="left", fill="x", expand=True, padx=10)
     return entry
 
-# Retrieve a value from the JSON configuration file
+# Retrieve a value from the in-memory configuration
 def get_json_value(key, section="institute", default_value="N/A"):
-    try:
-        with open('config/data.json', 'r') as f:
-            data = json.load(f)
-        return data.get(section, {}).get(key, default_value)
-    except (FileNotFoundError, json.JSONDecodeError):
-        print(f"Error retrieving {key} from JSON.")
-        return default_value
-
-# Retrieve a date from the JSON configuration file
+    return config_store.get(section, key, default_value)
+
+# Retrieve a date from the in-memory configuration
 def get_json_date(var_name, section="exam_details", default_date="2000-01-01"):
-    date_str = get_json_value(var_name, section, default_date)
-    return datetime.strptime(date_str, "%Y-%m-%d").date()
+    return config_store.date(section, var_name, default_date)
 
 # Save changes to the institute and exam details in the JSON file
 def save_changes(parent, exam_period, start_entry, end_entry):
@@ -0,0 +1,176 @@
+import queue
+import threading
+import time
+from datetime import datetime
+
+from config.db_connection import db
+from config.supervisor_repository import supervisor_repository
+
+DEDUPE_WINDOW_S = 30  # repeated scans of one card within this window are dropped
+BATCH_SIZE = 20  # check-ins written per transaction
+FLUSH_INTERVAL_S = 0.5  # longest a check-in waits for its batch to fill
+RETRY_DELAY_S = 2  # wait before retrying a batch the database rejected
+
+ACCEPTED = "accepted"
+ALREADY_CHECKED_IN = "already checked in"
+DUPLICATE = "duplicate"
+UNKNOWN = "unknown card"
+
+
+class CheckInPipeline:
+    """Turn RFID scans into `supervisor_attendance` rows without blocking the scanner.
+
+    `scan()` only touches memory: the card is resolved through the
+    supervisor repository's rfid index, repeats inside DEDUPE_WINDOW_S are
+    dropped, and accepted check-ins are queued. A writer thread drains the
+    queue and inserts them in batches of up to BATCH_SIZE, so a slow or
+    briefly unreachable database delays the write, never the acknowledgement.
+    Batches that fail are kept and retried.
+    """
+
+    def __init__(self, exam_date, session, repository=supervisor_repository, database=db,
+                 dedupe_window=DEDUPE_WINDOW_S, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL_S):
+        self.exam_date, self.session = exam_date, session
+        self.repository = repository
+        self.db = database
+        self.dedupe_window = dedupe_window
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_duty = set()  # supervisor ids in the session's supervision order
+        self.checked_in = set()  # supervisor ids checked in this session (stored or queued)
+        self.last_seen = {}  # rfid -> monotonic time of its last scan
+        self.stats = {ACCEPTED: 0, ALREADY_CHECKED_IN: 0, DUPLICATE: 0, UNKNOWN: 0, "written": 0, "failed_batches": 0}
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._give_up_at = 0.0
+        self._writer = None
+
+    def start(self):
+        """Preload supervisors and the session's existing check-ins, then start the writer."""
+        self.repository.ensure_loaded()
+        params = (self.exam_date, self.session)
+        self.checked_in = {row["supervisor_id"] for row in self.db.fetch(
+            "SELECT supervisor_id FROM supervisor_attendance WHERE exam_date = %s AND session = %s", params) or []}
+        self.on_duty = {row["supervisor_id"] for row in self.db.fetch(
+            "SELECT supervisor_id FROM supervision_order WHERE exam_date = %s AND session = %s", params) or []}
+        self._stop.clear()
+        self._writer = threading.Thread(target=self._write_loop, name="rfid-checkin-writer", daemon=True)
+        self._writer.start()
+        return self
+
+    def scan(self, rfid):
+        """Record one card scan and return an acknowledgement dict (no database access)."""
+        rfid = str(rfid).strip()
+        now = time.monotonic()
+        ack = {"rfid": rfid, "time": datetime.now().replace(microsecond=0), "supervisor": None, "on_duty": False}
+        with self._lock:
+            previous = self.last_seen.get(rfid)
+            self.last_seen[rfid] = now
+            supervisor = self.repository.by_rfid(rfid) if rfid else None
+            if supervisor is None:
+                status = UNKNOWN
+            elif previous is not None and now - previous < self.dedupe_window:
+                status = DUPLICATE
+            elif supervisor["id"] in self.checked_in:
+                status = ALREADY_CHECKED_IN
+            else:
+                status = ACCEPTED
+                self.checked_in.add(supervisor["id"])
+                self._queue.put((self.exam_date, self.session, supervisor["id"], ack["time"]))
+            self.stats[status] += 1
+        if supervisor is not None:
+            ack.update(supervisor=supervisor, on_duty=supervisor["id"] in self.on_duty)
+        ack["status"] = status
+        return ack
+
+    def pending(self):
+        """Check-ins accepted but not yet written."""
+        return self._queue.qsize()
+
+    def stop(self, timeout=10, wait=True):
+        """Write everything still queued, retrying for up to `timeout` seconds, and stop the writer thread.
+
+        With `wait=False` the writer is only told to stop and finishes on its
+        own, so the Tk thread never waits for the database.
+        """
+        self._give_up_at = time.monotonic() + timeout
+        self._stop.set()
+        if self._writer is not None and wait:
+            self._writer.join(timeout)
+        self._writer = None
+
+    def _write_loop(self):
+        batch = []
+        while True:
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if batch:
+                if self._write(batch):
+                    batch = []
+                elif self._stop.is_set() and time.monotonic() >= self._give_up_at:
+                    print(f"Check-ins not saved: {len(batch) + self._queue.qsize()}")
+                    return
+                else:
+                    time.sleep(RETRY_DELAY_S)
+            if self._stop.is_set() and self._queue.empty() and not batch:
+                return
+
+    def _write(self, batch):
+        try:
+            self.db.exec_many(
+                "INSERT IGNORE INTO supervisor_attendance (exam_date, session, supervisor_id, checked_in_at) "
+                "VALUES (%s, %s, %s, %s)", batch)
+        except Exception as e:
+            print(f"Check-in batch failed: {e}")
+            with self._lock:
+                self.stats["failed_batches"] += 1
+            return False
+        with self._lock:
+            self.stats["written"] += len(batch)
+        return True
+
+
+class KeyboardWedgeBuffer:
+    """Collect the keystrokes a keyboard-wedge RFID reader types into a focused widget.
+
+    The reader types the card number followed by Enter; `feed()` returns the
+    completed code on Enter and None otherwise. Keys left over from an
+    abandoned partial read are discarded after `max_gap` seconds of silence.
+    """
+
+    def __init__(self, max_gap=1.0):
+        self.max_gap = max_gap
+        self._chars = []
+        self._last = 0.0
+
+    def feed(self, char, now=None):
+        now = time.monotonic() if now is None else now
+        if now - self._last > self.max_gap:
+            self._chars.clear()
+        self._last = now
+        if char in ("\r", "\n"):
+            code, self._chars = "".join(self._chars).strip(), []
+            return code or None
+        if char and char.isprintable():
+            self._chars.append(char)
+        return None
+
+
+def replay_file(pipeline, path, delay=0.0):
+    """Feed every non-empty line of a text file to `pipeline.scan()`; stands in for a reader.
+
+    Returns the acknowledgements in file order.
+    """
+    acks = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                acks.append(pipeline.scan(line))
+                if delay:
+                    time.sleep(delay)
+    return acks
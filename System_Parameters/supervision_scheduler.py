@@ -0,0 +1,406 @@
+import heapq
+import threading
+from collections import Counter, defaultdict
+from datetime import date
+
+from config.db_connection import db
+from config.init import SESSIONS
+from config.interval_index import IntervalIndex
+from config.supervisor_repository import supervisor_repository
+
+ROSTER_TABLES = ("blocks", "supervision_order", "supervisors")  # changes here rebuild the duty roster
+
+
+class SwapError(Exception):
+    """Raised when a block cannot be given to the chosen supervisor."""
+
+
+def availability_window(supervisor):
+    """A supervisor's availability as a closed date interval (open-ended when unset)."""
+    return (supervisor.get("start_date") or date.min, supervisor.get("end_date") or date.max)
+
+
+def session_slot(exam_date, session):
+    """Position of a session on the timeline: (exam_date, index of the session in SESSIONS)."""
+    return (exam_date, SESSIONS.index(session) if session in SESSIONS else len(SESSIONS))
+
+
+def unavailable_spans(supervisor):
+    """Slot intervals outside the availability window: before start_date and after end_date."""
+    spans = []
+    if supervisor.get("start_date"):
+        spans.append(((date.min, -1), (supervisor["start_date"], -1)))
+    if supervisor.get("end_date"):
+        spans.append(((supervisor["end_date"], len(SESSIONS) + 1), (date.max, len(SESSIONS) + 1)))
+    return spans
+
+
+class SupervisionScheduler:
+    """Assign one supervisor to every block of every session.
+
+    Availability windows (`start_date`/`end_date` on supervisors) go into an
+    IntervalIndex, so the supervisors free on a given exam date are found
+    with one stabbing query. For each session the least-loaded available
+    supervisors are taken, ties broken by the average load of their
+    department and designation so duties are spread across both. A
+    supervisor gets at most one block per session.
+    """
+
+    def __init__(self, supervisors, block_sessions):
+        self.supervisors = {sup["id"]: sup for sup in supervisors}
+        self.block_sessions = block_sessions  # rows with id, exam_date, session, block_no
+        self.availability = IntervalIndex(
+            (*availability_window(sup), sup["id"]) for sup in self.supervisors.values())
+        self.assignments = {}  # block id -> supervisor id
+        self.booked = defaultdict(set)  # (exam_date, session) -> supervisor ids on duty
+        self.load = Counter()  # supervisor id -> duties
+        self.dept_size = Counter(sup["dept_code"] for sup in self.supervisors.values())
+        self.desg_size = Counter(sup["desg"] for sup in self.supervisors.values())
+        self.dept_load = Counter()
+        self.desg_load = Counter()
+
+    # ----- bookkeeping -----
+
+    def assign(self, block, supervisor_id):
+        sup = self.supervisors[supervisor_id]
+        self.assignments[block["id"]] = supervisor_id
+        self.booked[(block["exam_date"], block["session"])].add(supervisor_id)
+        self.load[supervisor_id] += 1
+        self.dept_load[sup["dept_code"]] += 1
+        self.desg_load[sup["desg"]] += 1
+
+    def unassign(self, block):
+        supervisor_id = self.assignments.pop(block["id"], None)
+        if supervisor_id is None:
+            return None
+        sup = self.supervisors.get(supervisor_id)
+        self.booked[(block["exam_date"], block["session"])].discard(supervisor_id)
+        self.load[supervisor_id] -= 1
+        if sup is not None:
+            self.dept_load[sup["dept_code"]] -= 1
+            self.desg_load[sup["desg"]] -= 1
+        return supervisor_id
+
+    def priority(self, supervisor_id):
+        """Sort key: fewest duties first, then least-loaded department and designation."""
+        sup = self.supervisors[supervisor_id]
+        return (
+            self.load[supervisor_id],
+            self.dept_load[sup["dept_code"]] / self.dept_size[sup["dept_code"]],
+            self.desg_load[sup["desg"]] / self.desg_size[sup["desg"]],
+            supervisor_id,
+        )
+
+    def candidates(self, exam_date, session, count):
+        """The `count` best supervisors available and not yet booked in the session."""
+        booked = self.booked[(exam_date, session)]
+        available = (sid for sid in self.availability.at(exam_date) if sid not in booked)
+        return heapq.nsmallest(count, available, key=self.priority)
+
+    # ----- scheduling -----
+
+    def generate(self):
+        """Build the whole order from scratch. Returns the blocks left without a supervisor."""
+        self.assignments.clear()
+        self.booked.clear()
+        self.load.clear()
+        self.dept_load.clear()
+        self.desg_load.clear()
+        sessions = defaultdict(list)
+        for block in self.block_sessions:
+            sessions[(block["exam_date"], block["session"])].append(block)
+
+        unassigned = []
+        for (exam_date, session), blocks in sorted(sessions.items()):
+            chosen = self.candidates(exam_date, session, len(blocks))
+            for block, supervisor_id in zip(blocks, chosen):
+                self.assign(block, supervisor_id)
+            unassigned.extend(blocks[len(chosen):])
+        return unassigned
+
+    def load_existing(self, order_rows):
+        """Seed the scheduler with an order already stored in the database."""
+        blocks = {block["id"]: block for block in self.block_sessions}
+        for row in order_rows:
+            block = blocks.get(row["block_id"])
+            if block is not None and row["supervisor_id"] in self.supervisors:
+                self.assign(block, row["supervisor_id"])
+
+    def update_supervisor(self, supervisor):
+        """Apply one supervisor's changed availability without rebuilding the order.
+
+        Only that supervisor's duties outside the new window are moved to
+        other supervisors. Returns (changed block ids, blocks left unassigned).
+        """
+        old = self.supervisors.get(supervisor["id"])
+        if old is not None:
+            self.availability.remove(*availability_window(old), old["id"])
+        self.supervisors[supervisor["id"]] = supervisor
+        self.availability.add(*availability_window(supervisor), supervisor["id"])
+
+        changed, unassigned = [], []
+        for block in self.duties_outside_window(supervisor):
+            self.unassign(block)
+            replacement = self.candidates(block["exam_date"], block["session"], 1)
+            if replacement:
+                self.assign(block, replacement[0])
+            else:
+                unassigned.append(block)
+            changed.append(block["id"])
+        return changed, unassigned
+
+    def duties_outside_window(self, supervisor):
+        """Blocks assigned to `supervisor` on dates outside their availability window."""
+        start, end = availability_window(supervisor)
+        return [block for block in self.block_sessions
+                if self.assignments.get(block["id"]) == supervisor["id"] and not start <= block["exam_date"] <= end]
+
+
+class DutyRoster(SupervisionScheduler):
+    """The stored supervision order with every supervisor's timeline indexed.
+
+    Each supervisor has an IntervalIndex over session slots (see
+    `session_slot`) holding their duties and the spans outside their
+    availability window, so checking whether they can take a block is one
+    stabbing query on their own small tree. Replacement candidates come
+    from the scheduler's availability index and per-session bookings,
+    ranked by current load, so last-minute swaps need no database reads.
+    """
+
+    def __init__(self, supervisors, block_sessions):
+        self.timelines = defaultdict(IntervalIndex)  # supervisor id -> duties and unavailable spans
+        super().__init__(supervisors, block_sessions)
+        self.blocks = {block["id"]: block for block in block_sessions}
+        self.session_blocks = defaultdict(list)  # (exam_date, session) -> blocks in block order
+        for block in block_sessions:
+            self.session_blocks[(block["exam_date"], block["session"])].append(block)
+        for sup in self.supervisors.values():
+            self._mark_unavailable(sup)
+
+    def _mark_unavailable(self, supervisor, add=True):
+        timeline = self.timelines[supervisor["id"]]
+        for start, end in unavailable_spans(supervisor):
+            if add:
+                timeline.add(start, end, ("unavailable", None))
+            else:
+                timeline.remove(start, end, ("unavailable", None))
+
+    def assign(self, block, supervisor_id):
+        super().assign(block, supervisor_id)
+        slot = session_slot(block["exam_date"], block["session"])
+        self.timelines[supervisor_id].add(slot, slot, ("duty", block["id"]))
+
+    def unassign(self, block):
+        supervisor_id = super().unassign(block)
+        if supervisor_id is not None:
+            slot = session_slot(block["exam_date"], block["session"])
+            self.timelines[supervisor_id].remove(slot, slot, ("duty", block["id"]))
+        return supervisor_id
+
+    def update_supervisor(self, supervisor):
+        old = self.supervisors.get(supervisor["id"])
+        if old is not None:
+            self._mark_unavailable(old, add=False)
+        self._mark_unavailable(supervisor)
+        return super().update_supervisor(supervisor)
+
+    def duties_outside_window(self, supervisor):
+        """Read from the supervisor's own timeline instead of scanning every block."""
+        timeline = self.timelines[supervisor["id"]]
+        return [self.blocks[block_id] for span in unavailable_spans(supervisor)
+                for kind, block_id in timeline.overlapping(*span) if kind == "duty"]
+
+    def conflicts(self, block_id, supervisor_id):
+        """Reasons `supervisor_id` cannot supervise block `block_id`; empty when the change is valid."""
+        block = self.blocks.get(block_id)
+        if block is None:
+            return [f"Block {block_id} no longer exists."]
+        if supervisor_id not in self.supervisors:
+            return [f"Supervisor {supervisor_id} no longer exists."]
+        reasons = []
+        for kind, other_block_id in self.timelines[supervisor_id].at(session_slot(block["exam_date"], block["session"])):
+            if kind == "unavailable":
+                reasons.append(f"Not available on {block['exam_date']}.")
+            elif other_block_id != block_id:
+                reasons.append(f"Already supervising block {self.blocks[other_block_id]['block_no']} in this session.")
+        return reasons
+
+    def replacements(self, block_id, count=10):
+        """The `count` least-loaded supervisors who can take block `block_id` instead of its current one."""
+        block = self.blocks[block_id]
+        return self.candidates(block["exam_date"], block["session"], count)
+
+    def reassign(self, block_id, supervisor_id):
+        """Move block `block_id` to `supervisor_id` in memory. Returns the previous supervisor id."""
+        block = self.blocks[block_id]
+        previous = self.unassign(block)
+        self.assign(block, supervisor_id)
+        return previous
+
+    def block_rows(self, session):
+        """(block, supervisor or None, their duties) for every block of `session`, in block order."""
+        rows = []
+        for block in self.session_blocks.get(session, []):
+            sup = self.supervisors.get(self.assignments.get(block["id"]))
+            rows.append((block, sup, self.load[sup["id"]] if sup else None))
+        return rows
+
+    def replacement_rows(self, block_id, count=10):
+        """(supervisor, duties) of the `count` best replacements for block `block_id`."""
+        return [(self.supervisors[sid], self.load[sid]) for sid in self.replacements(block_id, count)]
+
+
+class RosterCache:
+    """One DutyRoster, rebuilt only when blocks, the order or supervisors changed.
+
+    `lock` is only ever held for in-memory work: swapping in a rebuilt
+    roster, applying a committed change, or copying rows out for display.
+    Rebuilds and database writes happen outside it, so the Tk thread can
+    take it without waiting on the database. Changes made through the
+    roster hold `write_lock` from their conflict check to their commit.
+    """
+
+    def __init__(self, database=db):
+        self.db = database
+        self.roster = None
+        self.versions = None
+        self.lock = threading.Lock()  # guards the roster objects; never held across DB work
+        self.write_lock = threading.Lock()  # serializes changes made through the roster; not for the Tk thread
+
+    def get(self):
+        versions = self.db.table_versions(ROSTER_TABLES)
+        with self.lock:
+            if self.roster is not None and versions is not None and versions == self.versions:
+                return self.roster
+            previous = self.versions
+        if previous is not None and versions and versions["supervisors"] != previous["supervisors"]:
+            supervisor_repository.refresh()
+        supervisor_repository.ensure_loaded()
+        roster = DutyRoster(supervisor_repository.all(), load_block_sessions())
+        roster.load_existing(self.db.fetch("SELECT block_id, supervisor_id FROM supervision_order") or [])
+        with self.lock:
+            self.roster, self.versions = roster, versions
+        return roster
+
+    def changed(self, tables, roster):
+        """Note one committed transaction through `roster` that wrote `tables`, so it is not rebuilt for it.
+
+        If anybody else wrote meanwhile the counters do not add up and the
+        next `get()` rebuilds as usual. A roster that was already replaced
+        by a rebuild is left alone.
+        """
+        versions = self.db.table_versions(ROSTER_TABLES)
+        with self.lock:
+            if self.roster is not roster:
+                return
+            if self.versions is not None and versions is not None and \
+                    versions == {**self.versions, **{table: self.versions[table] + 1 for table in tables}}:
+                self.versions = versions
+            else:
+                self.roster = None
+
+    def discard(self, roster):
+        """Drop `roster` after a change applied to it in memory failed to commit."""
+        with self.lock:
+            if self.roster is roster:
+                self.roster = None
+
+
+duty_rosters = RosterCache()
+
+
+def load_block_sessions(start_date=None, end_date=None):
+    query = "SELECT id, exam_date, session, block_no FROM blocks"
+    params = ()
+    if start_date and end_date:
+        query += " WHERE exam_date BETWEEN %s AND %s"
+        params = (start_date, end_date)
+    return db.fetch(query + " ORDER BY exam_date, session, block_no", params) or []
+
+
+def save_order(scheduler):
+    """Replace the stored supervision order of every session the scheduler covers in one transaction.
+
+    Rows are deleted by session rather than by block, so rows left behind by
+    blocks that no longer exist cannot collide with the new order.
+    """
+    blocks = {block["id"]: block for block in scheduler.block_sessions}
+    rows = [(block_id, blocks[block_id]["exam_date"], blocks[block_id]["session"], supervisor_id)
+            for block_id, supervisor_id in scheduler.assignments.items()]
+    sessions = sorted({(block["exam_date"], block["session"]) for block in blocks.values()})
+    with db.transaction():
+        db.exec_many("DELETE FROM supervision_order WHERE exam_date = %s AND session = %s", sessions)
+        db.exec_many("INSERT INTO supervision_order (block_id, exam_date, session, supervisor_id) VALUES (%s, %s, %s, %s)", rows)
+
+
+def generate_supervision_order(start_date=None, end_date=None):
+    """Build and store the supervision order for every block in the period."""
+    supervisor_repository.ensure_loaded()
+    scheduler = SupervisionScheduler(supervisor_repository.all(), load_block_sessions(start_date, end_date))
+    unassigned = scheduler.generate()
+    save_order(scheduler)
+    return {
+        "blocks": len(scheduler.block_sessions),
+        "assigned": len(scheduler.assignments),
+        "unassigned": len(unassigned),
+        "supervisors_on_duty": sum(1 for count in scheduler.load.values() if count),
+    }
+
+
+def update_order_for_supervisor(supervisor_id, start_date, end_date):
+    """Set a supervisor's availability window and move their duties that fall outside it.
+
+    Works on the cached duty roster: the supervisor's timeline gives the
+    duties outside the new window and only those are handed to other
+    supervisors. The window and the moved duties are written in one
+    transaction. Returns a summary dict.
+    """
+    with duty_rosters.write_lock:
+        roster = duty_rosters.get()
+        supervisor = roster.supervisors.get(supervisor_id)
+        if supervisor is None:
+            supervisor_repository.set_availability(supervisor_id, start_date, end_date)
+            return {"changed": 0, "unassigned": 0}
+        with duty_rosters.lock:
+            changed, unassigned = roster.update_supervisor({**supervisor, "start_date": start_date, "end_date": end_date})
+        rows = [(block_id, roster.blocks[block_id]["exam_date"], roster.blocks[block_id]["session"], roster.assignments[block_id])
+                for block_id in changed if block_id in roster.assignments]
+        try:
+            with db.transaction():
+                written = []
+                if db.exec("UPDATE supervisors SET start_date = %s, end_date = %s WHERE id = %s",
+                           (start_date, end_date, supervisor_id)):
+                    written.append("supervisors")
+                if changed:
+                    db.exec_many("DELETE FROM supervision_order WHERE block_id = %s", [(block_id,) for block_id in changed])
+                    db.exec_many("INSERT INTO supervision_order (block_id, exam_date, session, supervisor_id) "
+                                 "VALUES (%s, %s, %s, %s)", rows)
+                    written.append("supervision_order")
+        except Exception:
+            duty_rosters.discard(roster)
+            raise
+        supervisor_repository.refresh([supervisor_id])
+        duty_rosters.changed(written, roster)
+    return {"changed": len(changed), "unassigned": len(unassigned)}
+
+
+def change_assigned_supervisor(block_id, supervisor_id):
+    """Give block `block_id` to `supervisor_id` after checking the change against the roster.
+
+    Raises SwapError with the reasons when the supervisor is unavailable
+    that day or already on duty in the session. Returns a summary dict.
+    """
+    with duty_rosters.write_lock:
+        roster = duty_rosters.get()
+        reasons = roster.conflicts(block_id, supervisor_id)
+        if reasons:
+            raise SwapError(" ".join(reasons))
+        block = roster.blocks[block_id]
+        with db.transaction():
+            db.exec("DELETE FROM supervision_order WHERE block_id = %s", (block_id,))
+            db.exec("INSERT INTO supervision_order (block_id, exam_date, session, supervisor_id) VALUES (%s, %s, %s, %s)",
+                    (block_id, block["exam_date"], block["session"], supervisor_id))
+        with duty_rosters.lock:
+            previous = roster.reassign(block_id, supervisor_id)
+        duty_rosters.changed(("supervision_order",), roster)
+    return {"block_id": block_id, "block_no": block["block_no"], "previous": previous, "supervisor_id": supervisor_id}
@@ -0,0 +1,138 @@
+import customtkinter as ctk
+from tkinter import ttk, messagebox
+from config.config_store import config_store
+from config.async_query import run_in_background
+from config.db_connection import db
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+LAYOUT_COLUMNS = [("Block No", 100), ("Room", 220), ("Capacity", 100), ("Seats Per Row", 130)]
+FIELDS = [("block_no", "Block No"), ("room", "Room"), ("capacity", "Capacity"), ("bench_columns", "Seats Per Row")]
+
+
+def load_layout():
+    return db.fetch("SELECT block_no, room, capacity, bench_columns FROM block_layout ORDER BY block_no") or []
+
+
+def save_block(block_no, room, capacity, bench_columns):
+    """Add a block to the layout, or change the block with the same number."""
+    db.upsert_many("block_layout", ("block_no", "room", "capacity", "bench_columns"), ("block_no",),
+                   [(block_no, room, capacity, bench_columns)])
+
+
+def delete_block(block_no):
+    db.exec("DELETE FROM block_layout WHERE block_no = %s", (block_no,))
+
+
+# Display the block arrangement (layout) screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Block Arrangement (Layout)", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    ctk.CTkLabel(content_frame, text="Blocks (rooms) used for seating every session, filled in block number order. "
+                                     "Changes apply to sessions prepared afterwards.",
+                 font=NORMAL_FONT, text_color="#C7C7C7", wraplength=900, justify="left").pack(anchor="w", padx=20, pady=(15, 5))
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=10)
+    entries = {}
+    for key, label in FIELDS:
+        ctk.CTkLabel(form_frame, text=f"{label}:", font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=(10, 5))
+        entries[key] = ctk.CTkEntry(form_frame, font=NORMAL_FONT, width=160 if key == "room" else 70)
+        entries[key].pack(side="left", padx=(0, 10))
+    entries["bench_columns"].insert(0, "2")
+
+    button_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    button_frame.pack(fill="x", padx=20, pady=5)
+    save_button = ctk.CTkButton(button_frame, text="Save Block", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    save_button.pack(side="left", padx=10)
+    delete_button = ctk.CTkButton(button_frame, text="Delete Block", font=NORMAL_FONT, fg_color="#3C3C3C", hover_color="#4E4E4E")
+    delete_button.pack(side="left", padx=10)
+    status_label = ctk.CTkLabel(button_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR)
+    status_label.pack(side="left", padx=20)
+
+    tree = ttk.Treeview(content_frame, columns=[heading for heading, _ in LAYOUT_COLUMNS], show="headings", height=12, selectmode="browse")
+    for heading, width in LAYOUT_COLUMNS:
+        tree.heading(heading, text=heading, anchor="center")
+        tree.column(heading, anchor="center", width=width)
+    style = ttk.Style()
+    style.configure("Layout.Treeview", font=NORMAL_FONT, rowheight=28)
+    style.configure("Treeview.Heading", font=NORMAL_FONT)
+    tree.configure(style="Layout.Treeview")
+    tree.pack(fill="both", expand=True, padx=20, pady=10)
+
+    def fill_layout(rows):
+        tree.delete(*tree.get_children())
+        for row in rows:
+            tree.insert("", "end", iid=str(row["block_no"]), values=(
+                row["block_no"], row["room"] or "", row["capacity"], row["bench_columns"]))
+        status_label.configure(text=f"{len(rows)} blocks, {sum(row['capacity'] for row in rows)} seats")
+
+    def refresh():
+        run_in_background(content_frame, load_layout, on_done=fill_layout,
+                          on_error=lambda e: messagebox.showerror("Error", f"Error loading the block layout: {e}"))
+
+    def pick(event=None):
+        selection = tree.selection()
+        if not selection:
+            return
+        for (key, _), value in zip(FIELDS, tree.item(selection[0], "values")):
+            entries[key].delete(0, ctk.END)
+            entries[key].insert(0, value)
+
+    def save():
+        try:
+            block_no, capacity, bench_columns = (int(entries[key].get().strip()) for key in ("block_no", "capacity", "bench_columns"))
+        except ValueError:
+            messagebox.showwarning("Invalid Block", "Block number, capacity and seats per row must be whole numbers.")
+            return
+        if block_no <= 0 or capacity <= 0 or bench_columns <= 0:
+            messagebox.showwarning("Invalid Block", "Block number, capacity and seats per row must be greater than zero.")
+            return
+        room = entries["room"].get().strip() or None
+        run_in_background(content_frame, lambda: save_block(block_no, room, capacity, bench_columns), on_done=lambda _: refresh(),
+                          on_error=lambda e: messagebox.showerror("Error", f"Error saving block {block_no}: {e}"))
+
+    def delete():
+        selection = tree.selection()
+        if not selection:
+            messagebox.showwarning("No Selection", "Select a block to delete.")
+            return
+        block_no = int(selection[0])
+        if not messagebox.askyesno("Delete Block", f"Remove block {block_no} from the layout?"):
+            return
+        run_in_background(content_frame, lambda: delete_block(block_no), on_done=lambda _: refresh(),
+                          on_error=lambda e: messagebox.showerror("Error", f"Error deleting block {block_no}: {e}"))
+
+    save_button.configure(command=save)
+    delete_button.configure(command=delete)
+    tree.bind("<<TreeviewSelect>>", pick)
+    refresh()
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Block Arrangement (Layout)")
+    root.geometry("1100x650")
+    display_module(root)
+    root.mainloop()
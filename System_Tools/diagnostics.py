@@ -0,0 +1,132 @@
+import customtkinter as ctk
+from tkinter import ttk
+from config.config_store import config_store
+from config.db_connection import db
+from config.perf_log import screen_timings, startup_timer
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+SCREEN_COLUMNS = [
+    ("screen", "Screen", 320),
+    ("count", "Opened", 80),
+    ("load_ms_p50", "Load p50 ms", 110),
+    ("build_ms_p50", "Build p50 ms", 110),
+    ("build_ms_p90", "Build p90 ms", 110),
+    ("build_ms_p99", "Build p99 ms", 110),
+    ("db_ms_p50", "DB p50 ms", 100),
+    ("db_ms_p90", "DB p90 ms", 100),
+    ("widgets_p50", "Widgets", 90),
+]
+QUERY_COLUMNS = [
+    ("sql", "Statement", 420),
+    ("calls", "Calls", 70),
+    ("total_ms", "Total ms", 90),
+    ("avg_ms", "Avg ms", 80),
+    ("max_ms", "Max ms", 80),
+    ("rows", "Rows", 80),
+    ("slow", "Slow", 60),
+    ("call_sites", "Top Call Site", 260),
+]
+MAX_QUERY_ROWS = 100
+
+
+def startup_summary():
+    """Milestones of the most recent launch in logs/startup.log, as text."""
+    launches = {}
+    for line in startup_timer.log.lines():
+        parts = line.split("\t")
+        if len(parts) == 4:
+            launches.setdefault((parts[0], parts[1]), []).append(f"{parts[2]} {float(parts[3]):.0f} ms")
+    if not launches:
+        return "No launches recorded yet."
+    (launched, _), marks = list(launches.items())[-1]
+    return f"Last launch {launched}: " + ", ".join(marks)
+
+
+def format_value(key, value):
+    if key == "call_sites":
+        return f"{value[0][0]} (x{value[0][1]})" if value else ""
+    if key in ("screen", "count", "sql", "calls", "rows", "slow"):
+        return value
+    return f"{value:.0f}" if key.startswith("widgets") else f"{value:.1f}"
+
+
+# Display the diagnostics screen (hidden from the menus, see modules.json)
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Diagnostics", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+    refresh_button = ctk.CTkButton(header_frame, text="Refresh", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    refresh_button.pack(side="right", padx=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    startup_label = ctk.CTkLabel(content_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR, wraplength=1000, justify="left")
+    startup_label.pack(anchor="w", padx=20, pady=(15, 5))
+    ctk.CTkLabel(content_frame, text="Screens (slowest first)", font=NORMAL_FONT, text_color="#C7C7C7").pack(anchor="w", padx=20)
+
+    style = ttk.Style()
+    style.configure("Diagnostics.Treeview", font=NORMAL_FONT, rowheight=28)
+    style.configure("Treeview.Heading", font=NORMAL_FONT)
+
+    def make_tree(columns, first_heading):
+        tree = ttk.Treeview(content_frame, columns=[heading for _, heading, _ in columns], show="headings", height=8,
+                            style="Diagnostics.Treeview")
+        for _, heading, width in columns:
+            tree.heading(heading, text=heading, anchor="center")
+            tree.column(heading, anchor="center", width=width)
+        tree.column(first_heading, anchor="w")
+        tree.pack(fill="both", expand=True, padx=20, pady=10)
+        return tree
+
+    screen_tree = make_tree(SCREEN_COLUMNS, "Screen")
+
+    query_header = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    query_header.pack(fill="x", padx=20)
+    ctk.CTkLabel(query_header, text=f"Statements since start (most total time first, slow >= {db.profiler.slow_ms:.0f} ms)",
+                 font=NORMAL_FONT, text_color="#C7C7C7").pack(side="left")
+    reset_button = ctk.CTkButton(query_header, text="Reset Query Stats", font=NORMAL_FONT, fg_color="#3C3C3C", hover_color="#4E4E4E")
+    reset_button.pack(side="right")
+    query_tree = make_tree(QUERY_COLUMNS, "Statement")
+
+    def refresh():
+        startup_label.configure(text=startup_summary())
+        screen_tree.delete(*screen_tree.get_children())
+        for row in screen_timings.summary():
+            screen_tree.insert("", "end", values=[format_value(key, row[key]) for key, _, _ in SCREEN_COLUMNS])
+        query_tree.delete(*query_tree.get_children())
+        for row in db.profiler.summary(limit=MAX_QUERY_ROWS):
+            query_tree.insert("", "end", values=[format_value(key, row[key]) for key, _, _ in QUERY_COLUMNS])
+
+    def reset():
+        db.profiler.reset()
+        refresh()
+
+    refresh_button.configure(command=refresh)
+    reset_button.configure(command=reset)
+    refresh()
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Diagnostics")
+    root.geometry("1100x650")
+    display_module(root)
+    root.mainloop()
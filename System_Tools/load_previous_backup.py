@@ -0,0 +1,115 @@
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from config.config_store import config_store
+from config.async_query import run_in_background
+from System_Tools.software_backup import BACKUP_DIR, list_backups, read_manifest, restore_backup
+from System_Tools.take_software_backup import build_backup_list, fill_backup_list
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+PROGRESS_POLL_MS = 200
+
+
+# Display the load previously taken backup screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Load Previously Taken Backup", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    ctk.CTkLabel(content_frame, text="Restoring replaces every table with the contents of the chosen backup. "
+                                     "An incremental backup needs the earlier backups it builds on in the same folder.",
+                 font=NORMAL_FONT, text_color="#C7C7C7", wraplength=900, justify="left").pack(anchor="w", padx=20, pady=(15, 5))
+
+    tree = build_backup_list(content_frame)
+    tree.pack(fill="both", expand=True, padx=20, pady=10)
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=10)
+    settings_var = ctk.BooleanVar(value=True)
+    ctk.CTkCheckBox(form_frame, text="Also restore settings (data.json, modules.json)", variable=settings_var,
+                    font=NORMAL_FONT, text_color=TEXT_COLOR).pack(side="left", padx=10)
+    browse_button = ctk.CTkButton(form_frame, text="Browse...", font=NORMAL_FONT, fg_color="#3C3C3C", hover_color="#4E4E4E")
+    browse_button.pack(side="left", padx=10)
+    restore_button = ctk.CTkButton(form_frame, text="Restore Selected", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    restore_button.pack(side="left", padx=10)
+    status_label = ctk.CTkLabel(content_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR)
+    status_label.pack(pady=5)
+    progress = {"done": 0, "total": 0, "running": False}
+
+    # restore_backup reports progress from its worker thread; the Tk thread polls it
+    def on_progress(done, total):
+        progress["done"], progress["total"] = done, total
+
+    def poll_progress():
+        if progress["running"] and status_label.winfo_exists():
+            status_label.configure(text=f"Restoring tables... {progress['done']} of {progress['total']} done")
+            status_label.after(PROGRESS_POLL_MS, poll_progress)
+
+    def browse():
+        path = filedialog.askopenfilename(initialdir=BACKUP_DIR, filetypes=[("Backups", "*.tar"), ("All files", "*.*")])
+        if path:
+            try:
+                manifest = read_manifest(path)
+            except Exception as e:
+                messagebox.showerror("Error", f"Not a backup file: {e}")
+                return
+            if not tree.exists(path):
+                fill_backup_list(tree, [(path, manifest)] + [(p, m) for p, m in list_backups() if p != path])
+            tree.selection_set(path)
+
+    def restore():
+        selection = tree.selection()
+        if not selection:
+            messagebox.showwarning("Restore", "Select a backup to restore.")
+            return
+        path = selection[0]
+        if not messagebox.askyesno("Restore", f"Replace all current data with {tree.set(path, 'File')}?\nThis cannot be undone."):
+            return
+        settings = settings_var.get()
+        progress.update(done=0, total=0, running=True)
+        restore_button.configure(state="disabled")
+        poll_progress()
+        run_in_background(content_frame, lambda: restore_backup(path, settings=settings, progress=on_progress),
+                          on_done=done, on_error=fail)
+
+    def done(summary):
+        progress["running"] = False
+        restore_button.configure(state="normal")
+        status_label.configure(text=f"Restored {summary['tables']} table(s), {summary['rows']} rows, in {summary['seconds']:.1f} s")
+
+    def fail(error):
+        progress["running"] = False
+        restore_button.configure(state="normal")
+        status_label.configure(text="")
+        messagebox.showerror("Error", f"Restore failed: {error}")
+
+    browse_button.configure(command=browse)
+    restore_button.configure(command=restore)
+    run_in_background(content_frame, list_backups, on_done=lambda backups: fill_backup_list(tree, backups))
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Load Previously Taken Backup")
+    root.geometry("1100x650")
+    display_module(root)
+    root.mainloop()
@@ -1 +1,243 @@
- 
+import gzip
+import io
+import json
+import os
+import tarfile
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+from config.config_store import config_store, CONFIG_PATH
+from config.db_connection import db, DB_POOL_SIZE, VERSIONS_TABLE
+from config.init import SCHEMA
+from config.supervisor_repository import supervisor_repository
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKUP_DIR = os.getenv("BACKUP_DIR") or os.path.join(BASE_DIR, "backups")
+MODULES_PATH = os.path.join(BASE_DIR, "modules.json")
+SETTINGS_FILES = {"config/data.json": CONFIG_PATH, "modules.json": MODULES_PATH}  # archive name -> file
+
+FORMAT_VERSION = 1
+FULL, INCREMENTAL = "full", "incremental"
+DUMP_WORKERS = max(1, min(4, DB_POOL_SIZE - 1))  # leave a pooled connection free for the screens
+COMPRESS_LEVEL = 3  # gzip level: most of the size gain of level 9 at a fraction of the time
+MAX_INCREMENTALS = 10  # take a full backup after this many incrementals in a row
+
+
+class BackupError(Exception):
+    """Raised when a backup cannot be taken or restored."""
+
+
+def backup_tables():
+    """Every table in the schema; the change counters travel in the manifest instead."""
+    return [table for table in SCHEMA if table != VERSIONS_TABLE]
+
+
+def _encode(value):
+    """JSON form of the non-JSON values our tables return."""
+    if isinstance(value, datetime):
+        return value.isoformat(" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (Decimal, timedelta)):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", "replace")
+    raise TypeError(f"cannot back up a {type(value).__name__} value")
+
+
+def dump_table(table, path):
+    """Stream every row of `table` into a gzipped JSON-lines file. Returns the row count.
+
+    The first line holds the column names, each further line one row as a
+    JSON array. Rows are read in batches with a plain SELECT, which takes
+    no locks on MySQL (InnoDB consistent read) nor on SQLite in WAL mode.
+    """
+    rows = 0
+    with db.stream(f"SELECT * FROM {table}") as (columns, batches), \
+            gzip.open(path, "wt", encoding="utf-8", compresslevel=COMPRESS_LEVEL) as f:
+        f.write(json.dumps(columns) + "\n")
+        for batch in batches:
+            f.write("".join(json.dumps(row, default=_encode) + "\n" for row in batch))
+            rows += len(batch)
+    return rows
+
+
+def read_manifest(path):
+    with tarfile.open(path) as tar:
+        return json.load(tar.extractfile("manifest.json"))
+
+
+def list_backups(folder=BACKUP_DIR):
+    """(path, manifest) of every readable backup in `folder`, newest first."""
+    backups = []
+    if not os.path.isdir(folder):
+        return backups
+    for name in os.listdir(folder):
+        if not name.endswith(".tar"):
+            continue
+        path = os.path.join(folder, name)
+        try:
+            backups.append((path, read_manifest(path)))
+        except (OSError, KeyError, ValueError, tarfile.TarError) as e:
+            print(f"Skipping unreadable backup {name}: {e}")
+    return sorted(backups, key=lambda item: item[1]["created"], reverse=True)
+
+
+def backup_chain(path):
+    """[(path, manifest)] from `path` back to the full backup it builds on."""
+    chain = [(path, read_manifest(path))]
+    while chain[-1][1]["kind"] == INCREMENTAL:
+        base_path = os.path.join(os.path.dirname(path), chain[-1][1]["base"])
+        if not os.path.exists(base_path):
+            raise BackupError(f"{os.path.basename(chain[-1][0])} builds on {chain[-1][1]['base']}, which is missing.")
+        chain.append((base_path, read_manifest(base_path)))
+    return chain
+
+
+def take_backup(folder=BACKUP_DIR, kind=None, progress=None):
+    """Write a backup archive of every table plus config/data.json and modules.json.
+
+    A backup is incremental when the newest backup in `folder` can serve as
+    its base: only tables whose change counter (see DB.table_versions)
+    moved since then are dumped, the rest are read from the base chain on
+    restore. After MAX_INCREMENTALS in a row, or when `kind` is FULL, every
+    table is dumped. Tables are dumped in parallel on pooled connections
+    and nobody is locked out meanwhile; each table is consistent in itself.
+    `progress(done, total)` is called as tables finish.
+    Returns a summary dict.
+    """
+    started = time.perf_counter()
+    tables = backup_tables()
+    versions = db.table_versions(tables)
+    if versions is None:
+        raise BackupError("Could not read the table change counters from the database.")
+
+    base = None
+    if kind != FULL:
+        previous = list_backups(folder)
+        if previous:
+            base_path, base_manifest = previous[0]
+            usable = (set(base_manifest["tables"]) == set(tables)
+                      and all(versions[table] >= base_manifest["versions"].get(table, 0) for table in tables))
+            if usable and (kind == INCREMENTAL or base_manifest["chain_length"] < MAX_INCREMENTALS):
+                base = (base_path, base_manifest)
+        if kind == INCREMENTAL and base is None:
+            raise BackupError("No earlier backup of this database to build an incremental backup on.")
+    kind = INCREMENTAL if base else FULL
+    changed = [table for table in tables if base is None or versions[table] != base[1]["versions"][table]]
+
+    os.makedirs(folder, exist_ok=True)
+    created = datetime.now()
+    path = os.path.join(folder, f"backup-{created:%Y%m%d-%H%M%S}-{kind}.tar")
+    suffix = 1
+    while os.path.exists(path):  # two backups within one second
+        suffix += 1
+        path = os.path.join(folder, f"backup-{created:%Y%m%d-%H%M%S}-{suffix}-{kind}.tar")
+    rows = {}
+    with tempfile.TemporaryDirectory(prefix=".backup-", dir=folder) as tmp:
+        if progress:
+            progress(0, len(changed))
+        with ThreadPoolExecutor(max_workers=DUMP_WORKERS, thread_name_prefix="backup") as pool:
+            futures = {pool.submit(dump_table, table, os.path.join(tmp, f"{table}.jsonl.gz")): table for table in changed}
+            for future in as_completed(futures):
+                rows[futures[future]] = future.result()
+                if progress:
+                    progress(len(rows), len(changed))
+        after = db.table_versions(tables) or {}
+
+        manifest = {
+            "format": FORMAT_VERSION,
+            "created": created.isoformat(timespec="microseconds"),
+            "kind": kind,
+            "base": os.path.basename(base[0]) if base else None,
+            "chain_length": base[1]["chain_length"] + 1 if base else 0,
+            "tables": tables,
+            "rows": {table: rows[table] for table in changed},
+            "versions": versions,
+            # Written to while being dumped: the next backup dumps them again
+            "changed_during_dump": sorted(table for table in changed if after.get(table) != versions[table]),
+        }
+        part_path = path + ".part"
+        with tarfile.open(part_path, "w") as tar:
+            data = json.dumps(manifest, indent=2).encode("utf-8")
+            info = tarfile.TarInfo("manifest.json")
+            info.size, info.mtime = len(data), int(time.time())
+            tar.addfile(info, io.BytesIO(data))
+            for name, file_path in SETTINGS_FILES.items():
+                if os.path.exists(file_path):
+                    tar.add(file_path, arcname=f"settings/{name}")
+            for table in changed:
+                tar.add(os.path.join(tmp, f"{table}.jsonl.gz"), arcname=f"tables/{table}.jsonl.gz")
+        os.replace(part_path, path)
+
+    return {
+        "path": path, "kind": kind, "base": manifest["base"], "tables_dumped": len(changed),
+        "rows": sum(rows.values()), "bytes": os.path.getsize(path), "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def restore_backup(path, settings=True, progress=None):
+    """Replace every table with its contents in backup `path` (following incremental bases).
+
+    Each table is streamed out of its archive and inserted in batches; the
+    whole restore is one transaction, so a failure leaves the database as it
+    was. With `settings`, config/data.json and modules.json are restored too.
+    `progress(done, total)` is called as tables finish. Returns a summary dict.
+    """
+    started = time.perf_counter()
+    chain = backup_chain(path)
+    manifest = chain[0][1]
+    if manifest["format"] > FORMAT_VERSION:
+        raise BackupError("This backup was taken by a newer version of the software.")
+    source = {}  # table -> index in chain of the backup holding its newest dump
+    for index, (_, entry) in reversed(list(enumerate(chain))):
+        source.update(dict.fromkeys(entry["rows"], index))
+    missing = [table for table in manifest["tables"] if table not in source]
+    if missing:
+        raise BackupError(f"No dump of {', '.join(missing)} in the backup chain.")
+    tables = [table for table in manifest["tables"] if table in SCHEMA]
+
+    restored = {}
+    with ExitStack() as stack:
+        archives = [stack.enter_context(tarfile.open(chain_path)) for chain_path, _ in chain]
+        if progress:
+            progress(0, len(tables))
+        with db.transaction():
+            for table in tables:
+                index = source[table]
+                db.exec(f"DELETE FROM {table}")
+                with gzip.open(archives[index].extractfile(f"tables/{table}.jsonl.gz"), "rt", encoding="utf-8") as f:
+                    columns = json.loads(next(f))
+                    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+                    count = db.exec_many(query, (tuple(json.loads(line)) for line in f))
+                expected = chain[index][1]["rows"][table]
+                if count != expected and count >= 0:
+                    raise BackupError(f"{table}: restored {count} rows, the backup holds {expected}.")
+                restored[table] = expected
+                if progress:
+                    progress(len(restored), len(tables))
+
+        if settings:
+            for name, file_path in SETTINGS_FILES.items():
+                try:
+                    data = json.load(archives[0].extractfile(f"settings/{name}"))
+                except KeyError:
+                    continue
+                if file_path == CONFIG_PATH:
+                    config_store.update(**data)
+                else:
+                    tmp_path = file_path + ".tmp"
+                    with open(tmp_path, "w", encoding="utf-8") as f:
+                        json.dump(data, f, indent=4)
+                    os.replace(tmp_path, file_path)
+
+    if supervisor_repository.loaded:
+        supervisor_repository.refresh()
+    return {
+        "path": path, "backups_read": len({source[table] for table in tables}), "tables": len(restored),
+        "rows": sum(restored.values()), "settings": settings, "seconds": round(time.perf_counter() - started, 2),
+    }
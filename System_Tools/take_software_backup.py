@@ -0,0 +1,127 @@
+import os
+import customtkinter as ctk
+from tkinter import ttk, messagebox
+from config.config_store import config_store
+from config.async_query import run_in_background
+from System_Tools.software_backup import BACKUP_DIR, FULL, list_backups, take_backup
+
+# Fonts from the shared config
+HEADING_FONT = config_store.font("h2", ["Lexend", 24, "bold"])
+NORMAL_FONT = config_store.font("h4", ["Lexend", 14, "normal"])
+
+# Color scheme
+BACKGROUND_COLOR = "#1a1a1a"
+FRAME_COLOR = "#2a2a2a"
+TEXT_COLOR = "#ffffff"
+ACCENT_COLOR = "#3a7ebf"
+
+PROGRESS_POLL_MS = 200
+BACKUP_COLUMNS = [("File", 380), ("Kind", 110), ("Taken At", 190), ("Tables", 80), ("Rows", 100), ("Size (KB)", 100)]
+
+
+def backup_row(path, manifest):
+    """Values shown for one backup in the list."""
+    return (os.path.basename(path), manifest["kind"].title(), manifest["created"][:19].replace("T", " "),
+            len(manifest["rows"]), sum(manifest["rows"].values()), round(os.path.getsize(path) / 1024))
+
+
+def build_backup_list(parent):
+    """Treeview of the backups in BACKUP_DIR, shared with the restore screen."""
+    tree = ttk.Treeview(parent, columns=[heading for heading, _ in BACKUP_COLUMNS], show="headings", height=12, selectmode="browse")
+    for heading, width in BACKUP_COLUMNS:
+        tree.heading(heading, text=heading, anchor="center")
+        tree.column(heading, anchor="center", width=width)
+    tree.column("File", anchor="w")
+    style = ttk.Style()
+    style.configure("Backup.Treeview", font=NORMAL_FONT, rowheight=28)
+    style.configure("Treeview.Heading", font=NORMAL_FONT)
+    tree.configure(style="Backup.Treeview")
+    return tree
+
+
+def fill_backup_list(tree, backups):
+    tree.delete(*tree.get_children())
+    for path, manifest in backups:
+        tree.insert("", "end", iid=path, values=backup_row(path, manifest))
+
+
+# Display the take software backup screen
+def display_module(root):
+    for widget in root.winfo_children(): widget.destroy()
+
+    main_frame = ctk.CTkFrame(root, fg_color=BACKGROUND_COLOR)
+    main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+
+    header_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    header_frame.pack(fill="x", pady=(0, 20))
+    ctk.CTkLabel(header_frame, text="Take Software Backup", font=HEADING_FONT, text_color=TEXT_COLOR).pack(side="left", padx=20, pady=20)
+
+    content_frame = ctk.CTkFrame(main_frame, fg_color=FRAME_COLOR, corner_radius=10)
+    content_frame.pack(fill="both", expand=True, pady=10)
+
+    ctk.CTkLabel(content_frame, text=f"Backups are saved in {BACKUP_DIR}. Only tables changed since the last backup are "
+                                     "saved again, so backups during an exam take seconds and nobody has to stop working.",
+                 font=NORMAL_FONT, text_color="#C7C7C7", wraplength=900, justify="left").pack(anchor="w", padx=20, pady=(15, 5))
+
+    form_frame = ctk.CTkFrame(content_frame, fg_color=FRAME_COLOR)
+    form_frame.pack(fill="x", padx=20, pady=10)
+    backup_button = ctk.CTkButton(form_frame, text="Take Backup", font=NORMAL_FONT, fg_color=ACCENT_COLOR, hover_color="#2a5d8f")
+    backup_button.pack(side="left", padx=10)
+    full_button = ctk.CTkButton(form_frame, text="Take Full Backup", font=NORMAL_FONT, fg_color="#3C3C3C", hover_color="#4E4E4E")
+    full_button.pack(side="left", padx=10)
+    status_label = ctk.CTkLabel(form_frame, text="", font=NORMAL_FONT, text_color=TEXT_COLOR)
+    status_label.pack(side="left", padx=20)
+
+    tree = build_backup_list(content_frame)
+    tree.pack(fill="both", expand=True, padx=20, pady=10)
+    progress = {"done": 0, "total": 0, "running": False}
+
+    # take_backup reports progress from its worker thread; the Tk thread polls it
+    def on_progress(done, total):
+        progress["done"], progress["total"] = done, total
+
+    def poll_progress():
+        if progress["running"] and status_label.winfo_exists():
+            status_label.configure(text=f"Saving tables... {progress['done']} of {progress['total']} done")
+            status_label.after(PROGRESS_POLL_MS, poll_progress)
+
+    def refresh():
+        run_in_background(content_frame, list_backups, on_done=lambda backups: fill_backup_list(tree, backups))
+
+    def backup(kind=None):
+        progress.update(done=0, total=0, running=True)
+        backup_button.configure(state="disabled")
+        full_button.configure(state="disabled")
+        poll_progress()
+        run_in_background(content_frame, lambda: take_backup(kind=kind, progress=on_progress), on_done=done, on_error=fail)
+
+    def finish():
+        progress["running"] = False
+        backup_button.configure(state="normal")
+        full_button.configure(state="normal")
+
+    def done(summary):
+        finish()
+        status_label.configure(text=f"{summary['kind'].title()} backup of {summary['tables_dumped']} table(s), "
+                                    f"{summary['rows']} rows, in {summary['seconds']:.1f} s")
+        refresh()
+
+    def fail(error):
+        finish()
+        status_label.configure(text="")
+        messagebox.showerror("Error", f"Backup failed: {error}")
+
+    backup_button.configure(command=backup)
+    full_button.configure(command=lambda: backup(FULL))
+    refresh()
+
+
+if __name__ == "__main__":
+    ctk.set_appearance_mode("dark")
+    ctk.set_default_color_theme("blue")
+
+    root = ctk.CTk()
+    root.title("Take Software Backup")
+    root.geometry("1100x650")
+    display_module(root)
+    root.mainloop()
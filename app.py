@@ -1,8 +1,13 @@
+from config.perf_log import startup_timer, db_clock, screen_timings  # first import: startup is timed from here
+import multiprocessing
+import threading
+import time
 import tkinter as tk
 import customtkinter as ctk
 import json
-import importlib.util
 import os
+from config.screen_registry import ScreenRegistry
+from config.config_store import config_store
 
 class MainApp(ctk.CTk):
     def __init__(self):
@@ -15,22 +20,39 @@ class MainApp(ctk.CTk):
         self.HEADING_FONT = tuple(self.config_data['fonts']['h1'])
         self.NORMAL_FONT = tuple(self.config_data['fonts']['h4'])
 
-        # Load modules and create UI
-        self.modules = self.load_modules_data()
+        # Only the window frame is built here; menus, the home screen and the
+        # database connection follow once the first frame is on screen
+        self.screens = ScreenRegistry()
         self.create_header()
         self.create_footer()
         self.create_content_frame()
+        startup_timer.mark("window built")
+        self.after(0, self.finish_startup)
+
+    def finish_startup(self):
+        """Paint the window, then build menus and the home screen and connect in the background."""
+        self.update_idletasks()
+        startup_timer.mark("first frame")
+        self.modules = self.load_modules_data()
         self.create_menu_bar()
+        self.bind_hidden_screens()
+        startup_timer.mark("menu ready")
         self.show_home_screen()
+        startup_timer.mark("home screen ready")
+        threading.Thread(target=self.connect_database, name="db-warm-up", daemon=True).start()
+
+    def connect_database(self):
+        """Import the DB layer and open its first connection off the Tk thread."""
+        from config.db_connection import db
+        error = db.warm_up()
+        startup_timer.mark("database connected" if error is None else "database connection failed")
 
     def load_config_data(self):
-        """Load configuration from JSON file."""
-        try:
-            with open('config/data.json', 'r') as file:
-                return json.load(file)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            self.display_error(f"Error loading config: {e}")
-            return {}
+        """Load configuration from the shared config store."""
+        data = config_store.data()
+        if not data:
+            self.display_error("Error loading config: 'config/data.json' is missing or invalid.")
+        return data
 
 
     def load_modules_data(self):
@@ -62,22 +84,39 @@ class MainApp(ctk.CTk):
         menu_bar = tk.Menu(self)
         for module in self.modules:
             module_menu = tk.Menu(menu_bar, tearoff=0)
-            self.add_submodules_to_menu(module, module_menu)
+            # Entries are added the first time the menu opens
+            module_menu.configure(postcommand=lambda m=module, mm=module_menu: self.fill_menu(m, mm))
             menu_bar.add_cascade(label=module['module_name'], menu=module_menu)
         menu_bar.add_command(label="Exit", command=self.quit)
         self.config(menu=menu_bar)
 
+    def fill_menu(self, module, module_menu):
+        """Populate a module's menu once, on first open."""
+        if module_menu.index("end") is None:
+            self.add_submodules_to_menu(module, module_menu)
+
     def add_submodules_to_menu(self, module, module_menu):
-        """Add submodules to menu."""
+        """Add submodules to menu, leaving out hidden ones."""
         for submodule in module.get('submodules', []):
+            if submodule.get('hidden'):
+                continue
             if 'submodules' in submodule:
                 sub_menu = tk.Menu(module_menu, tearoff=0)
                 for item in submodule.get('submodules', []):
-                    sub_menu.add_command(label=item['name'], command=lambda s=item: self.show_frame(s))
+                    if not item.get('hidden'):
+                        sub_menu.add_command(label=item['name'], command=lambda s=item: self.show_frame(s))
                 module_menu.add_cascade(label=submodule['name'], menu=sub_menu)
             else:
                 module_menu.add_command(label=submodule['name'], command=lambda s=submodule: self.show_frame(s))
 
+    def bind_hidden_screens(self):
+        """Hidden screens are left out of the menus and opened with their keyboard shortcut instead."""
+        for module in self.modules:
+            for submodule in module.get('submodules', []):
+                for item in [submodule] + submodule.get('submodules', []):
+                    if item.get('hidden') and item.get('shortcut'):
+                        self.bind_all(item['shortcut'], lambda event, s=item: self.show_frame(s))
+
     def show_home_screen(self):
         """Show home screen."""
         self.show_frame({"name": "Home", "file": "home.py"})
@@ -94,15 +133,25 @@ class MainApp(ctk.CTk):
             widget.destroy()
 
     def execute_file(self, file_path):
-        """Execute file and load display function if available."""
+        """Load file through the screen cache and call its display function if available.
+
+        Each successful opening is timed and written to logs/screens.log
+        (see System_Tools/diagnostics.py). Its DB time only counts queries
+        run on this (the Tk) thread, not background work running meanwhile.
+        """
+        screen_name = file_path
         file_path = os.path.abspath(file_path)  # Using absolute path
         if os.path.exists(file_path):
             try:
-                spec = importlib.util.spec_from_file_location("module.name", file_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+                started, db_started = time.perf_counter(), db_clock.thread_total()
+                module = self.screens.get(file_path)
+                loaded = time.perf_counter()
                 if hasattr(module, 'display_module'):
                     module.display_module(self.content_frame)
+                    self.update_idletasks()  # include laying the new widgets out
+                    built = time.perf_counter()
+                    screen_timings.record(screen_name, (loaded - started) * 1000, (built - loaded) * 1000,
+                                          self.count_widgets(self.content_frame), (db_clock.thread_total() - db_started) * 1000)
                 else:
                     self.display_message("No display function found in module.")
             except Exception as e:
@@ -110,6 +159,12 @@ class MainApp(ctk.CTk):
         else:
             self.display_error(f"Error: '{file_path}' not found.")
 
+    @staticmethod
+    def count_widgets(widget):
+        """Number of widgets below `widget`."""
+        children = widget.winfo_children()
+        return len(children) + sum(MainApp.count_widgets(child) for child in children)
+
     def display_message(self, message):
         """Display message in content frame."""
         ctk.CTkLabel(self.content_frame, text=message, font=self.NORMAL_FONT, text_color="black").pack(pady=20)
@@ -119,5 +174,6 @@ class MainApp(ctk.CTk):
         ctk.CTkLabel(self.content_frame, text=error_message, font=self.NORMAL_FONT, text_color="red").pack(pady=10)
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # report rendering workers in the frozen build
     app = MainApp()
     app.mainloop()
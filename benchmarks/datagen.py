@@ -0,0 +1,137 @@
+import math
+import random
+import time
+from datetime import date, timedelta
+
+from config.config_store import config_store
+
+# Data set sizes, from one small college up to a large exam center
+SIZES = {
+    "small": {"examinees": 1_500, "supervisors": 80, "exam_days": 6},
+    "medium": {"examinees": 10_000, "supervisors": 300, "exam_days": 10},
+    "large": {"examinees": 40_000, "supervisors": 800, "exam_days": 12},
+    "huge": {"examinees": 100_000, "supervisors": 1_800, "exam_days": 15},
+}
+PAPERS_PER_COURSE = 5  # every examinee writes all papers of their course
+SEMESTERS = (2, 4, 6)
+BLOCK_CAPACITY = 30
+SPARE_BLOCKS = 1.1  # block layout covers the busiest session plus this margin
+ABSENT_RATE = 0.03
+COPY_CASE_RATE = 0.002
+FIRST_EXAM_DATE = date(2031, 4, 7)  # far from any real exam, so a benchmark DB is never mistaken for one
+
+FIRST_NAMES = ["AARAV", "ADITI", "AKASH", "ANANYA", "ARJUN", "DIVYA", "GAURAV", "ISHA", "KAVYA", "KIRAN",
+               "MANASI", "NEHA", "NIKHIL", "OMKAR", "PRANAV", "PRIYA", "RAHUL", "RAVI", "ROHAN", "SAKSHI",
+               "SHREYA", "SIDDHI", "SNEHA", "TANVI", "VAIBHAV", "VEDANT", "YASH"]
+SURNAMES = ["BHOSALE", "CHAVAN", "DESAI", "DESHMUKH", "GAIKWAD", "JADHAV", "JOSHI", "KADAM", "KALE", "KULKARNI",
+            "MANE", "MORE", "NAIK", "PATIL", "PAWAR", "SALUNKHE", "SAWANT", "SHINDE", "SURYAWANSHI", "THORAT"]
+
+
+def person_name(rng):
+    return f"{rng.choice(SURNAMES)} {rng.choice(FIRST_NAMES)} {rng.choice(FIRST_NAMES)[0]}"
+
+
+class DataSet:
+    """Rows for every exam table, generated from one seed.
+
+    Departments and roles come from config/data.json, so supervisors and
+    courses look like the institute's own. Every examinee belongs to one
+    course and writes each of its papers; a course never has two papers in
+    one session. The same size and seed always give the same rows.
+    """
+
+    def __init__(self, size="small", seed=1, **overrides):
+        self.size = size
+        self.seed = seed
+        self.params = {**SIZES[size], **overrides}
+        rng = random.Random(seed)
+        departments = [dept["code"] for dept in config_store.data().get("departments", [])] or ["CO", "ME", "CE"]
+        roles = config_store.data().get("roles") or ["LECTURER"]
+
+        self.courses = [f"{dept}{semester}I" for dept in departments for semester in SEMESTERS]
+        self.slots = [(FIRST_EXAM_DATE + timedelta(days=day), session)
+                      for day in range(self.params["exam_days"]) for session in ("MORNING", "AFTERNOON")]
+        self.course_papers = {}  # course -> [paper_code, ...]
+        self.timetable = []
+        for c, course in enumerate(self.courses):
+            papers = [f"{22000 + c * PAPERS_PER_COURSE + k + 100}" for k in range(PAPERS_PER_COURSE)]
+            self.course_papers[course] = papers
+            offset = rng.randrange(len(self.slots))
+            stride = 2 if len(self.slots) >= 2 * PAPERS_PER_COURSE else 1  # a day between papers when there is room
+            for k, paper in enumerate(papers):
+                exam_date, session = self.slots[(offset + k * stride) % len(self.slots)]
+                self.timetable.append((exam_date, session, paper, f"{course} Paper {k + 1}"))
+
+        self.examinees = []  # (seat_no, enrollment_no, name, course_code)
+        for i in range(self.params["examinees"]):
+            self.examinees.append((str(100001 + i), f"{1710 + i % 90:04d}{i:06d}", person_name(rng), rng.choice(self.courses)))
+        self.seating_chart = [(seat_no, enrollment_no, name, course, paper)
+                              for seat_no, enrollment_no, name, course in self.examinees for paper in self.course_papers[course]]
+
+        headcount = {}
+        slot_of_paper = {paper: (exam_date, session) for exam_date, session, paper, _ in self.timetable}
+        for *_, paper in self.seating_chart:
+            headcount[slot_of_paper[paper]] = headcount.get(slot_of_paper[paper], 0) + 1
+        self.session_headcount = headcount
+        blocks = math.ceil(max(headcount.values(), default=0) * SPARE_BLOCKS / BLOCK_CAPACITY)
+        self.block_layout = [(block_no, f"R-{100 + block_no}", BLOCK_CAPACITY, 2) for block_no in range(1, blocks + 1)]
+
+        self.supervisors = []  # (rfid, name, dept_code, desg, emp_type, start_date, end_date)
+        last_day = self.slots[-1][0]
+        for i in range(self.params["supervisors"]):
+            start_date = end_date = None
+            if rng.random() < 0.1:  # some staff join late or leave early
+                start_date = FIRST_EXAM_DATE + timedelta(days=rng.randrange(3))
+                end_date = last_day - timedelta(days=rng.randrange(3))
+            self.supervisors.append((f"{0xA0000000 + i:08X}", person_name(rng), rng.choice(departments), rng.choice(roles),
+                                     "Perm" if rng.random() < 0.7 else "Temp", start_date, end_date))
+
+        self.marks = {}  # (exam_date, session) -> {"ABSENT": [seat_no...], "COPY_CASE": [...]}
+        seats_by_slot = {}
+        for seat_no, _, _, _, paper in self.seating_chart:
+            seats_by_slot.setdefault(slot_of_paper[paper], []).append(seat_no)
+        for slot, seat_nos in sorted(seats_by_slot.items()):
+            sample = rng.sample(seat_nos, round(len(seat_nos) * (ABSENT_RATE + COPY_CASE_RATE)))
+            copy_cases = round(len(seat_nos) * COPY_CASE_RATE)
+            self.marks[slot] = {"COPY_CASE": sample[:copy_cases], "ABSENT": sample[copy_cases:]}
+
+    def busiest_session(self):
+        return max(self.session_headcount, key=self.session_headcount.get)
+
+    def counts(self):
+        return {
+            "examinees": len(self.examinees), "seating_chart": len(self.seating_chart), "timetable": len(self.timetable),
+            "sessions": len(self.session_headcount), "block_layout": len(self.block_layout),
+            "supervisors": len(self.supervisors), "busiest_session": max(self.session_headcount.values(), default=0),
+        }
+
+
+# Insert statement and DataSet attribute of each table, in load order
+INSERTS = {
+    "supervisors": ("INSERT INTO supervisors (rfid, name, dept_code, desg, emp_type, start_date, end_date) "
+                    "VALUES (%s, %s, %s, %s, %s, %s, %s)", "supervisors"),
+    "timetable": ("INSERT INTO timetable (exam_date, session, paper_code, paper_name) VALUES (%s, %s, %s, %s)", "timetable"),
+    "seating_chart": ("INSERT INTO seating_chart (seat_no, enrollment_no, name, course_code, paper_code) "
+                      "VALUES (%s, %s, %s, %s, %s)", "seating_chart"),
+    "block_layout": ("INSERT INTO block_layout (block_no, room, capacity, bench_columns) VALUES (%s, %s, %s, %s)", "block_layout"),
+}
+# Every table a benchmark writes, cleared first so each run starts from the same state
+TABLES = ("attendance_marks", "attendance_counts", "supervisor_attendance", "supervision_order", "block_seats",
+          "blocks", "block_layout", "seating_chart", "timetable", "supervisors")
+
+
+def clear(database):
+    with database.transaction():
+        for table in TABLES:
+            database.exec(f"DELETE FROM {table}")
+
+
+def load(database, data):
+    """Write `data` into the cleared tables. Returns {table: (rows, seconds)}."""
+    timings = {}
+    for table, (query, attribute) in INSERTS.items():
+        rows = getattr(data, attribute)
+        started = time.perf_counter()
+        database.exec_many(query, rows)
+        timings[table] = (len(rows), time.perf_counter() - started)
+    return timings
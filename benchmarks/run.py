@@ -0,0 +1,264 @@
+"""Headless benchmarks of the DB layer, supervisor loading, allocation and reports.
+
+    python -m benchmarks --size medium
+    python -m benchmarks --size small --compare benchmarks/results/small-<earlier>.json
+
+Runs against a throwaway SQLite file unless --backend mysql is given, and
+writes one JSON file per run to benchmarks/results/.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BASE_DIR, "benchmarks", "results")
+REGRESSION_TOLERANCE = 0.25  # a metric this much worse than the baseline counts as a regression
+NOISE_SECONDS = 0.05  # timings below this on both runs are too noisy to compare
+MIN_RATE_ROWS = 1000  # tables smaller than this get no rows-per-second figure
+POINT_QUERIES = 1000
+SINGLE_WRITES = 300
+
+
+class Timer:
+    """Collects {benchmark: {metric: value}} and silences the DB layer's per-query prints."""
+
+    def __init__(self):
+        self.results = {}
+
+    @contextlib.contextmanager
+    def measure(self, benchmark, metric="seconds"):
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield self.results.setdefault(benchmark, {})
+        self.results[benchmark][metric] = round(time.perf_counter() - started, 4)
+        print(f"  {benchmark:<28} {metric:<22} {self.results[benchmark][metric]:.3f}")
+
+    def add(self, benchmark, **metrics):
+        self.results.setdefault(benchmark, {}).update(metrics)
+
+
+def bench_load(timer, db, datagen, data):
+    with timer.measure("load", "clear_seconds"):
+        datagen.clear(db)
+    with timer.measure("load"):
+        timings = datagen.load(db, data)
+    for table, (rows, seconds) in timings.items():
+        if rows >= MIN_RATE_ROWS and seconds:
+            timer.add("load", **{f"{table}_rows_per_s": round(rows / seconds)})
+
+
+def bench_db(timer, db, data):
+    seat_nos = [row[0] for row in data.examinees]
+    step = max(1, len(seat_nos) // POINT_QUERIES)
+    probes = seat_nos[::step][:POINT_QUERIES]
+    with timer.measure("db_fetch", "point_seconds"):
+        for seat_no in probes:
+            db.fetch("SELECT * FROM seating_chart WHERE seat_no = %s", (seat_no,))
+    exam_date, session = data.busiest_session()
+    with timer.measure("db_fetch", "session_scan_seconds") as metrics:
+        rows = db.fetch("SELECT sc.* FROM seating_chart sc JOIN timetable t ON t.paper_code = sc.paper_code "
+                        "WHERE t.exam_date = %s AND t.session = %s", (exam_date, session))
+        metrics["session_scan_rows"] = len(rows)
+    timer.add("db_fetch", point_per_s=round(len(probes) / timer.results["db_fetch"]["point_seconds"]))
+
+    ids = [row["id"] for row in db.fetch("SELECT id FROM supervisors ORDER BY id LIMIT %s", (SINGLE_WRITES,))]
+    with timer.measure("db_exec", "autocommit_seconds"):
+        for supervisor_id in ids:
+            db.exec("UPDATE supervisors SET post = %s WHERE id = %s", ("Bench", supervisor_id))
+    with timer.measure("db_exec", "transaction_seconds"):
+        with db.transaction():
+            for supervisor_id in ids:
+                db.exec("UPDATE supervisors SET post = NULL WHERE id = %s", (supervisor_id,))
+    timer.add("db_exec", autocommit_per_s=round(len(ids) / timer.results["db_exec"]["autocommit_seconds"]),
+              transaction_per_s=round(len(ids) / timer.results["db_exec"]["transaction_seconds"]))
+
+
+def bench_supervisors(timer, db):
+    from config.supervisor_repository import SupervisorRepository
+    from config.virtual_table import VirtualTable
+
+    with timer.measure("supervisor_screens", "repository_load_seconds"):
+        SupervisorRepository(db).refresh()
+
+    # The paging queries of the Add / Edit / Delete screen; page_query only
+    # reads plain attributes, so no widget has to be created for it
+    table = VirtualTable.__new__(VirtualTable)
+    table.table, table.key, table.page_size = "supervisors", "id", 100
+    table.sort_column, table.sort_desc, table.filter_text = "name", False, ""
+    table.filter_columns = ["name", "dept_code", "desg", "rfid"]
+    table.display_filters = {}
+    table.page_bounds = {}
+    with timer.measure("supervisor_screens", "scroll_10_pages_seconds"):
+        db.fetch("SELECT COUNT(*) AS total FROM supervisors")
+        for page_no in range(10):
+            query, params, _ = table.page_query(page_no)
+            rows = db.fetch(query, params)
+            if not rows:
+                break
+            table.page_bounds[page_no] = ((rows[0]["_sort"], rows[0]["_key"]), (rows[-1]["_sort"], rows[-1]["_key"]))
+    table.page_bounds, table.filter_text = {}, "pat"
+    with timer.measure("supervisor_screens", "filter_first_page_seconds"):
+        where, params = table.where_clause()
+        db.fetch(f"SELECT COUNT(*) AS total FROM supervisors{where}", params)
+        query, params, _ = table.page_query(0)
+        db.fetch(query, params)
+
+
+def bench_allocation(timer, db, data):
+    from Absent_Copy_Case_Nos.attendance import save_marks
+    from Exam_Block_Details.seat_allocation import allocate, load_session_examinees, prepare_session_blocks
+    from System_Parameters.supervision_scheduler import generate_supervision_order
+
+    exam_date, session = data.busiest_session()
+    examinees = load_session_examinees(exam_date, session)
+    with timer.measure("allocation", "allocate_busiest_seconds") as metrics:
+        result = allocate([row["seat_no"] for row in examinees], [row["paper_code"] for row in examinees],
+                          [capacity for _, _, capacity, _ in data.block_layout],
+                          [columns for _, _, _, columns in data.block_layout])
+        metrics["busiest_conflicts"] = result["conflicts"]
+    with timer.measure("allocation", "prepare_all_sessions_seconds"):
+        for exam_date, session in sorted(data.session_headcount):
+            prepare_session_blocks(exam_date, session)
+    with timer.measure("allocation", "supervision_order_seconds") as metrics:
+        metrics.update({f"supervision_{key}": value for key, value in generate_supervision_order().items()})
+    with timer.measure("allocation", "absent_entry_seconds"):
+        for (exam_date, session), marks in data.marks.items():
+            for status, seat_nos in marks.items():
+                save_marks(exam_date, session, status, seat_nos)
+
+
+def bench_reports(timer, data):
+    from Reports.report_engine import REPORTS, render_reports
+
+    exam_date, session = data.busiest_session()
+    with timer.measure("reports", "cold_seconds") as metrics:
+        metrics["reports"] = len(render_reports(list(REPORTS), exam_date, session, force=True))
+    with timer.measure("reports", "cached_seconds"):
+        render_reports(list(REPORTS), exam_date, session)
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def lower_is_better(metric):
+    return metric.endswith("seconds")
+
+
+def compare(baseline, current, tolerance=REGRESSION_TOLERANCE):
+    """Lines describing metrics that got worse than `baseline` by more than `tolerance`."""
+    regressions = []
+    for benchmark, metrics in current["results"].items():
+        for metric, value in metrics.items():
+            old = baseline.get("results", {}).get(benchmark, {}).get(metric)
+            if not isinstance(value, (int, float)) or not isinstance(old, (int, float)) or not old:
+                continue
+            if not (lower_is_better(metric) or metric.endswith("_per_s")):
+                continue
+            if lower_is_better(metric) and max(old, value) < NOISE_SECONDS:
+                continue
+            ratio = value / old if lower_is_better(metric) else old / value if value else float("inf")
+            if ratio > 1 + tolerance:
+                regressions.append(f"{benchmark}.{metric}: {old} -> {value} ({(ratio - 1) * 100:.0f}% worse)")
+    return regressions
+
+
+def parse_args(argv=None):
+    from benchmarks.datagen import SIZES
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.split("\n")[0])
+    parser.add_argument("--size", choices=list(SIZES), default="small")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--backend", choices=["sqlite", "mysql"], default="sqlite")
+    parser.add_argument("--database", help="SQLite file (default: a temporary file) or MySQL database name. "
+                                           "Its exam tables are emptied first.")
+    parser.add_argument("--skip", nargs="*", default=[], choices=["db", "supervisors", "allocation", "reports"])
+    parser.add_argument("--output", help="result file (default: benchmarks/results/<size>-<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier result file; exit with status 1 on a regression")
+    args = parser.parse_args(argv)
+    if args.backend == "mysql" and not args.database:
+        parser.error("--backend mysql needs --database naming a scratch database; its exam tables are emptied")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    scratch = None
+    # Pick the database before config.db_connection is imported; .env never overrides these
+    os.environ["DB_BACKEND"] = args.backend
+    if args.backend == "sqlite":
+        if not args.database:
+            scratch = tempfile.TemporaryDirectory(prefix="exam-bench-")
+            args.database = os.path.join(scratch.name, "bench.db")
+        os.environ["DB_PATH"] = args.database
+    else:
+        os.environ["DB_NAME"] = args.database
+    os.environ.setdefault("REPORTS_DIR", os.path.join(scratch.name if scratch else tempfile.gettempdir(), "bench-reports"))
+
+    from benchmarks import datagen
+    from config.db_connection import db
+
+    started = time.perf_counter()
+    data = datagen.DataSet(args.size, args.seed)
+    print(f"Data set '{args.size}' (seed {args.seed}) generated in {time.perf_counter() - started:.1f}s: {data.counts()}")
+
+    timer = Timer()
+    bench_load(timer, db, datagen, data)
+    if "db" not in args.skip:
+        bench_db(timer, db, data)
+    if "supervisors" not in args.skip:
+        bench_supervisors(timer, db)
+    if "allocation" not in args.skip:
+        bench_allocation(timer, db, data)
+    if "reports" not in args.skip:
+        if "allocation" in args.skip:
+            print("  reports skipped: they need the blocks made by the allocation benchmark")
+        else:
+            bench_reports(timer, data)
+
+    result = {
+        "meta": {
+            "time": datetime.now().isoformat(timespec="seconds"), "revision": git_revision(), "size": args.size,
+            "seed": args.seed, "backend": args.backend, "python": platform.python_version(),
+            "platform": platform.platform(), "cpu_count": os.cpu_count(), "counts": data.counts(),
+        },
+        "results": timer.results,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, f"{args.size}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2, default=str)
+    print(f"Results written to {output}")
+
+    db.close()
+    if scratch is not None:
+        scratch.cleanup()
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        setup = ("size", "seed", "backend")
+        if any(baseline.get("meta", {}).get(key) != result["meta"][key] for key in setup):
+            print(f"Not compared: {args.compare} was run with a different {'/'.join(setup)}.")
+            return 2
+        regressions = compare(baseline, result)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        print(f"{len(regressions)} regression(s) against {args.compare}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
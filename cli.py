@@ -0,0 +1,164 @@
+"""Run the exam data operations from a shell or a scheduled task, without the GUI.
+
+    python cli.py import-timetable timetable.xlsx
+    python cli.py prepare-blocks --date 2024-05-06 --session MORNING
+    python cli.py supervision-order
+    python cli.py reports --date 2024-05-06 --session MORNING
+    python cli.py delete-blocks --date 2024-05-06 --session MORNING
+    python cli.py backup
+
+Each command prints one JSON object on stdout:
+{"command": ..., "ok": true, "result": {...}, "seconds": ...}, or "ok": false
+with an "error" and exit status 1. Log output of the DB layer goes to stderr
+(nothing with --quiet). No GUI module is imported, and each command imports
+only the engine it needs, so startup stays well below the GUI's.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from datetime import date
+
+SESSIONS = ("MORNING", "AFTERNOON")  # as in config/init.py, repeated so --help needs no imports
+
+
+def import_timetable(args):
+    from Exam_Examinee_Details.timetable_importer import import_timetable
+    return import_timetable(args.path)
+
+
+def import_seating_chart(args):
+    from Exam_Examinee_Details.seating_chart_importer import import_seating_chart
+    return import_seating_chart(args.path)
+
+
+def prepare_blocks(args):
+    from config.db_connection import db
+    from Exam_Block_Details.seat_allocation import prepare_session_blocks
+
+    if args.date:
+        sessions = [(args.date, session) for session in (args.session or SESSIONS)]
+    else:
+        sessions = sorted(((row["exam_date"], row["session"]) for row in db.fetch(
+            "SELECT DISTINCT exam_date, session FROM timetable") or []),
+            key=lambda item: (item[0], SESSIONS.index(item[1]) if item[1] in SESSIONS else len(SESSIONS)))
+    if args.date and not args.session:
+        # Both sessions of a day: skip the one without papers instead of failing
+        scheduled = {row["session"] for row in db.fetch(
+            "SELECT DISTINCT session FROM timetable WHERE exam_date = %s", (args.date,)) or []}
+        sessions = [(exam_date, session) for exam_date, session in sessions if session in scheduled]
+    return {"sessions": [prepare_session_blocks(exam_date, session, seed=args.seed) for exam_date, session in sessions]}
+
+
+def delete_blocks(args):
+    from Exam_Block_Details.block_archive import delete_session_blocks, undo_delete
+
+    if args.undo:
+        return undo_delete(args.undo)
+    return delete_session_blocks(args.date, args.session)
+
+
+def supervision_order(args):
+    from System_Parameters.supervision_scheduler import generate_supervision_order
+    return generate_supervision_order(args.start_date, args.end_date)
+
+
+def reports(args):
+    from Reports.report_engine import REPORTS, render_reports
+
+    unknown = set(args.report or ()) - set(REPORTS)
+    if unknown:
+        raise ValueError(f"unknown report(s) {', '.join(sorted(unknown))}; choose from {', '.join(REPORTS)}")
+    return render_reports(args.report or list(REPORTS), args.date, args.session, force=args.force)
+
+
+def backup(args):
+    from System_Tools.software_backup import BACKUP_DIR, FULL, take_backup
+    return take_backup(args.folder or BACKUP_DIR, kind=FULL if args.full else None)
+
+
+def restore(args):
+    from System_Tools.software_backup import restore_backup
+    return restore_backup(args.path, settings=not args.no_settings)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cli.py", description=__doc__.split("\n")[0])
+    parser.add_argument("--quiet", action="store_true", help="discard log output instead of writing it to stderr")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+
+    command = commands.add_parser("import-timetable", help="import a timetable .xlsx/.xls/.csv file")
+    command.add_argument("path")
+    command.set_defaults(run=import_timetable)
+
+    command = commands.add_parser("import-seating-chart", help="import an MSBTE seating chart file")
+    command.add_argument("path")
+    command.set_defaults(run=import_seating_chart)
+
+    command = commands.add_parser("prepare-blocks", help="seat examinees into blocks (every timetable session by default)")
+    command.add_argument("--date", type=date.fromisoformat, help="only this exam date (YYYY-MM-DD)")
+    command.add_argument("--session", choices=SESSIONS, action="append", help="only this session; needs --date")
+    command.add_argument("--seed", type=int, default=0, help="paper order seed, as on the Block Preparation screen")
+    command.set_defaults(run=prepare_blocks)
+
+    command = commands.add_parser("delete-blocks", help="delete a session's blocks (archived, can be undone)")
+    command.add_argument("--date", type=date.fromisoformat, help="exam date (YYYY-MM-DD)")
+    command.add_argument("--session", choices=SESSIONS)
+    command.add_argument("--undo", type=int, metavar="BATCH", help="bring back the blocks of an earlier delete")
+    command.set_defaults(run=delete_blocks)
+
+    command = commands.add_parser("supervision-order", help="generate the supervision order")
+    command.add_argument("--from", dest="start_date", type=date.fromisoformat, help="first exam date (YYYY-MM-DD)")
+    command.add_argument("--to", dest="end_date", type=date.fromisoformat, help="last exam date (YYYY-MM-DD)")
+    command.set_defaults(run=supervision_order)
+
+    command = commands.add_parser("reports", help="render session reports to PDF")
+    command.add_argument("--date", type=date.fromisoformat, required=True, help="exam date (YYYY-MM-DD)")
+    command.add_argument("--session", choices=SESSIONS, required=True)
+    command.add_argument("--report", action="append", help="report key (repeatable); all reports by default")
+    command.add_argument("--force", action="store_true", help="rebuild reports whose data has not changed")
+    command.set_defaults(run=reports)
+
+    command = commands.add_parser("backup", help="back up the database and settings (incremental when possible)")
+    command.add_argument("--folder", help="backup folder (default: backups/ next to app.py)")
+    command.add_argument("--full", action="store_true", help="dump every table even if unchanged")
+    command.set_defaults(run=backup)
+
+    command = commands.add_parser("restore", help="replace all data with a backup")
+    command.add_argument("path", help="backup .tar file; earlier backups it builds on must be in the same folder")
+    command.add_argument("--no-settings", action="store_true", help="keep the current data.json and modules.json")
+    command.set_defaults(run=restore)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if getattr(args, "session", None) and not getattr(args, "date", None):
+        parser.error("--session needs --date")
+    if args.command == "supervision-order" and bool(args.start_date) != bool(args.end_date):
+        parser.error("--from and --to go together")
+    if args.command == "delete-blocks" and not args.undo and not (args.date and args.session):
+        parser.error("delete-blocks needs --date and --session, or --undo")
+
+    started = time.perf_counter()
+    output = {"command": args.command}
+    log = open(os.devnull, "w") if args.quiet else sys.stderr
+    try:
+        with contextlib.redirect_stdout(log):
+            output["result"] = args.run(args)
+        output["ok"] = True
+    except Exception as e:
+        output.update(ok=False, error=f"{type(e).__name__}: {e}")
+    finally:
+        if args.quiet:
+            log.close()
+    output["seconds"] = round(time.perf_counter() - started, 3)
+    print(json.dumps(output, default=str))
+    return 0 if output["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+import customtkinter as ctk
+from concurrent.futures import ThreadPoolExecutor
+import os
+import threading
+
+from config.db_connection import db
+
+# Worker threads for background queries; each borrows its own pooled connection
+QUERY_WORKERS = int(os.getenv("DB_QUERY_WORKERS", "4"))
+POLL_INTERVAL_MS = 30  # how often the Tk thread checks for a finished query
+
+_executor = ThreadPoolExecutor(max_workers=QUERY_WORKERS, thread_name_prefix="db-query")
+
+
+class QueryError(Exception):
+    """Raised in the worker when a background fetch fails, so `on_error` is called."""
+
+
+class QueryHandle:
+    """A query running on a worker thread. Call `cancel()` to drop its result."""
+
+    def __init__(self, future):
+        self.future = future
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        """Stop waiting for the query; its callbacks will never be called."""
+        self._cancelled.set()
+        self.future.cancel()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def done(self):
+        return self.future.done()
+
+
+def run_in_background(widget, func, on_done, on_error=None, loading=None):
+    """Run `func()` on a worker thread and hand its result to `on_done` on the Tk thread.
+
+    `widget` is used for `after()` polling, so callbacks are skipped once it has
+    been destroyed (e.g. the user switched screens). `on_done` may be None when
+    only errors matter. `loading` is an optional LoadingIndicator shown while
+    the work is running.
+    """
+    handle = QueryHandle(_executor.submit(func))
+    if loading is not None:
+        loading.show()
+
+    def poll():
+        if handle.cancelled or not widget.winfo_exists():
+            if loading is not None:
+                loading.hide()
+            return
+        if not handle.done():
+            widget.after(POLL_INTERVAL_MS, poll)
+            return
+        if loading is not None:
+            loading.hide()
+        try:
+            result = handle.future.result()
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+            else:
+                print(f"Background query error: {e}")
+            return
+        if on_done is not None:
+            on_done(result)
+
+    widget.after(POLL_INTERVAL_MS, poll)
+    return handle
+
+
+def fetch_async(widget, query, params=None, on_done=None, on_error=None, loading=None):
+    """Background version of `db.fetch`.
+
+    `db.fetch` reports a failed query by returning None; here that becomes a
+    QueryError passed to `on_error`, so `on_done` only ever receives rows.
+    """
+    def fetch():
+        rows = db.fetch(query, params)
+        if rows is None:
+            raise QueryError("The query failed; see the log for the database error.")
+        return rows
+
+    return run_in_background(widget, fetch, on_done, on_error, loading)
+
+
+def exec_async(widget, query, params=None, on_done=None, on_error=None, loading=None):
+    """Background version of `db.exec`. `on_done` receives the number of affected rows."""
+    return run_in_background(widget, lambda: db.exec(query, params), on_done, on_error, loading)
+
+
+class LoadingIndicator:
+    """A small "Loading..." label that is placed over `parent` while a query runs."""
+
+    def __init__(self, parent, text="Loading...", font=None):
+        self.parent = parent
+        self.text = text
+        self.font = font
+        self.label = None
+        self._active = 0
+
+    def show(self):
+        self._active += 1
+        if self.label is None and self.parent.winfo_exists():
+            self.label = ctk.CTkLabel(self.parent, text=self.text, font=self.font, text_color="#C7C7C7", fg_color="#2E2E2E", corner_radius=8)
+            self.label.place(relx=0.5, rely=0.5, anchor="center")
+
+    def hide(self):
+        self._active = max(0, self._active - 1)
+        if self._active == 0 and self.label is not None:
+            if self.label.winfo_exists():
+                self.label.destroy()
+            self.label = None
@@ -0,0 +1,114 @@
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data.json')
+DEFAULT_FONT = ("Lexend", 14, "normal")
+
+
+class ConfigStore:
+    """Single in-memory copy of config/data.json.
+
+    The file is parsed once and re-parsed only when its mtime changes.
+    Writes go to a temp file that is renamed over the original, and
+    subscribers are called with the new data after every reload or write.
+    """
+
+    def __init__(self, path=CONFIG_PATH):
+        self.path = path
+        self._data = {}
+        self._mtime = None
+        self._lock = threading.RLock()
+        self._subscribers = []
+
+    def data(self):
+        """Return the parsed config, reloading it if the file changed on disk."""
+        with self._lock:
+            try:
+                mtime = os.stat(self.path).st_mtime_ns
+            except FileNotFoundError:
+                print(f"Error: The file '{self.path}' does not exist.")
+                return self._data
+            if mtime != self._mtime:
+                try:
+                    with open(self.path, 'r') as f:
+                        self._data = json.load(f)
+                    self._mtime = mtime
+                except json.JSONDecodeError:
+                    print(f"Error: Failed to decode JSON from '{self.path}'.")
+                    return self._data
+                self._notify()
+            return self._data
+
+    def get(self, section, key=None, default=None):
+        """Return a whole section, or one key from it."""
+        value = self.data().get(section, default if key is None else {})
+        if key is None:
+            return value
+        return value.get(key, default)
+
+    def font(self, name, default=DEFAULT_FONT):
+        """Return a font from the "fonts" section as a (family, size, weight) tuple."""
+        return tuple(self.get("fonts", name, default))
+
+    def date(self, section, key, default="2000-01-01"):
+        """Return a "YYYY-MM-DD" value as a date."""
+        return datetime.strptime(self.get(section, key, default), "%Y-%m-%d").date()
+
+    def departments(self):
+        return self.get("departments", default=[])
+
+    def roles(self):
+        return self.get("roles", default=[])
+
+    def update(self, **sections):
+        """Replace the given top-level sections and write the file atomically."""
+        with self._lock:
+            data = dict(self.data())
+            data.update(sections)
+            directory = os.path.dirname(self.path)
+            fd, tmp_path = tempfile.mkstemp(prefix='.data-', suffix='.json', dir=directory)
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, indent=4)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            self._data = data
+            self._mtime = os.stat(self.path).st_mtime_ns
+            self._notify()
+
+    def subscribe(self, callback, widget=None):
+        """Call `callback(data)` whenever the config is reloaded or written.
+
+        Reloads can happen on any thread that calls `data()`. When the
+        subscriber updates Tk widgets, pass one as `widget`: the call is then
+        handed to the Tk thread with `widget.after(0, ...)`, and the
+        subscription is dropped once the widget has been destroyed.
+        """
+        self._subscribers.append((callback, widget))
+        return callback
+
+    def unsubscribe(self, callback):
+        self._subscribers = [(cb, widget) for cb, widget in self._subscribers if cb != callback]
+
+    def _notify(self):
+        for callback, widget in list(self._subscribers):
+            try:
+                if widget is None:
+                    callback(self._data)
+                elif widget.winfo_exists():
+                    widget.after(0, callback, self._data)
+                else:
+                    self.unsubscribe(callback)
+            except Exception as e:
+                print(f"Config subscriber error: {e}")
+
+
+config_store = ConfigStore()
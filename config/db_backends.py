@@ -0,0 +1,188 @@
+import functools
+import os
+import re
+import sqlite3
+import threading
+from datetime import date, datetime
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class MySQLBackend:
+    """mysql-connector connections to the central exam server."""
+
+    name = "mysql"
+    autocommit = True  # each statement outside transaction() commits on its own, so reads never keep an old snapshot
+
+    def __init__(self, host, user, password, database):
+        self.settings = dict(host=host, user=user, password=password, database=database)
+        self._connector = None
+
+    @property
+    def connector(self):
+        """mysql.connector, imported on first use: it is slow to import and not needed to paint the UI."""
+        if self._connector is None:
+            import mysql.connector
+            self._connector = mysql.connector
+        return self._connector
+
+    @property
+    def Error(self):
+        return self.connector.Error
+
+    def connect(self):
+        # InnoDB keeps a REPEATABLE READ snapshot until the transaction ends; with autocommit
+        # a pooled connection that only ran SELECTs still sees other connections' commits
+        return self.connector.connect(autocommit=True, **self.settings)
+
+    def begin(self, conn):
+        conn.start_transaction()
+
+    def cursor(self, conn, dictionary=False):
+        return conn.cursor(dictionary=dictionary)
+
+    def ping(self, conn):
+        conn.ping(reconnect=True, attempts=2, delay=1)
+
+    def translate(self, query):
+        return query
+
+    def execute(self, cur, query, params=None):
+        cur.execute(query, params)
+
+    def executemany(self, cur, query, rows):
+        cur.executemany(query, rows)
+
+    def upsert_query(self, table, columns, key_columns):
+        updates = ", ".join(f"{col} = VALUES({col})" for col in columns if col not in key_columns)
+        return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))}) "
+                f"ON DUPLICATE KEY UPDATE {updates or f'{key_columns[0]} = {key_columns[0]}'}")
+
+    def increment_query(self, table, key_column, counter_column):
+        return (f"INSERT INTO {table} ({key_column}, {counter_column}) VALUES (%s, 1) "
+                f"ON DUPLICATE KEY UPDATE {counter_column} = {counter_column} + 1")
+
+    def explain_query(self, query):
+        return "EXPLAIN " + query
+
+    def is_connection_lost(self, error):
+        from mysql.connector import errorcode
+        # Errors meaning the socket is gone and the statement can be retried on a fresh connection
+        return getattr(error, "errno", None) in (
+            errorcode.CR_SERVER_GONE_ERROR, errorcode.CR_SERVER_LOST, errorcode.CR_CONN_HOST_ERROR)
+
+
+def _dict_factory(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+# Store dates the way MySQL returns them so screens see datetime.date either way
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("DATE", lambda value: date.fromisoformat(value.decode()))
+sqlite3.register_converter("DATETIME", lambda value: datetime.fromisoformat(value.decode()))
+sqlite3.register_converter("TIMESTAMP", lambda value: datetime.fromisoformat(value.decode()))
+
+
+class SQLiteBackend:
+    """Local SQLite file in WAL mode for single-machine exam centers.
+
+    Queries are written for MySQL, so `%s` placeholders and the MySQL-only
+    bits of our DDL are rewritten before they reach SQLite. The schema from
+    config/init.py is created the first time the file is opened.
+    """
+
+    name = "sqlite"
+    Error = sqlite3.Error
+    autocommit = False  # sqlite3 opens a transaction before the first write and needs commit()
+
+    # (pattern, replacement) applied in order to every statement
+    REWRITES = [
+        (re.compile(r"\bINT(EGER)?\s+(NOT\s+NULL\s+)?AUTO_INCREMENT\s+PRIMARY\s+KEY", re.I), "INTEGER PRIMARY KEY AUTOINCREMENT"),
+        (re.compile(r"\bAUTO_INCREMENT\b", re.I), ""),
+        (re.compile(r"\bON\s+UPDATE\s+CURRENT_TIMESTAMP\b", re.I), ""),
+        (re.compile(r"\)\s*ENGINE\s*=\s*\w+[^;]*", re.I), ")"),
+        (re.compile(r"\bINSERT\s+IGNORE\b", re.I), "INSERT OR IGNORE"),
+    ]
+
+    def __init__(self, path):
+        self.path = path
+        self.schema_ready = False
+        self._schema_lock = threading.Lock()  # connections opened meanwhile wait until the tables exist
+
+    def connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, detect_types=sqlite3.PARSE_DECLTYPES)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        if not self.schema_ready:
+            with self._schema_lock:
+                if not self.schema_ready:
+                    from config.init import create_tables
+                    try:
+                        create_tables(_SingleConnection(self, conn))
+                    except BaseException:
+                        conn.close()
+                        raise
+                    self.schema_ready = True  # only once it worked, so a failed attempt is retried by the next connect
+        return conn
+
+    def begin(self, conn):
+        pass  # sqlite3 begins the transaction itself at the first write
+
+    def cursor(self, conn, dictionary=False):
+        cur = conn.cursor()
+        if dictionary:
+            cur.row_factory = _dict_factory
+        return cur
+
+    def ping(self, conn):
+        conn.execute("SELECT 1")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def translate(query):
+        query = query.replace("%s", "?").replace("%%", "%")
+        for pattern, replacement in SQLiteBackend.REWRITES:
+            query = pattern.sub(replacement, query)
+        return query
+
+    def execute(self, cur, query, params=None):
+        cur.execute(self.translate(query), params or ())
+
+    def executemany(self, cur, query, rows):
+        cur.executemany(self.translate(query), rows)
+
+    def upsert_query(self, table, columns, key_columns):
+        updates = ", ".join(f"{col} = excluded.{col}" for col in columns if col not in key_columns)
+        return (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))}) "
+                f"ON CONFLICT ({', '.join(key_columns)}) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING"))
+
+    def increment_query(self, table, key_column, counter_column):
+        return (f"INSERT INTO {table} ({key_column}, {counter_column}) VALUES (%s, 1) "
+                f"ON CONFLICT ({key_column}) DO UPDATE SET {counter_column} = {counter_column} + 1")
+
+    def explain_query(self, query):
+        return "EXPLAIN QUERY PLAN " + query
+
+    def is_connection_lost(self, error):
+        return False
+
+
+class _SingleConnection:
+    """Minimal DB-like wrapper used to build the schema on a brand-new connection."""
+
+    def __init__(self, backend, conn):
+        self.backend = backend
+        self.conn = conn
+
+    def exec(self, query, params=None):
+        self.conn.execute(self.backend.translate(query), params or ())
+        self.conn.commit()
+
+
+def create_backend(name, **settings):
+    """Return the backend selected by DB_BACKEND ("mysql" or "sqlite")."""
+    if name == "sqlite":
+        return SQLiteBackend(settings.get("path") or os.path.join(BASE_DIR, "supervisors.db"))
+    return MySQLBackend(settings["host"], settings["user"], settings["password"], settings["database"])
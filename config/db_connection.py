@@ -1,64 +1,396 @@
-import mysql.connector
-from mysql.connector import Error
 from dotenv import load_dotenv
+from contextlib import contextmanager
+from functools import lru_cache
 import os
+import queue
+import re
+import threading
+import time
+
+from config.db_backends import create_backend
+from config.perf_log import db_clock
+from config.query_profiler import QueryProfiler
 
 # Load environment variables
 load_dotenv()
 
 # Database configuration from environment variables
+DB_BACKEND = os.getenv("DB_BACKEND", "mysql").lower()  # "mysql" or "sqlite"
+DB_PATH = os.getenv("DB_PATH", "")  # SQLite file, defaults to supervisors.db in the app folder
 DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_USER = os.getenv("DB_USER", "root")
 DB_PASS = os.getenv("DB_PASSWORD", "")
 DB_NAME = os.getenv("DB_NAME", "your_database_name")
 
+# Pool configuration
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "10"))  # seconds to wait for a free connection
+DB_HEALTH_CHECK_INTERVAL = float(os.getenv("DB_HEALTH_CHECK_INTERVAL", "30"))  # ping connections idle longer than this
+DB_BATCH_SIZE = int(os.getenv("DB_BATCH_SIZE", "1000"))  # rows sent per executemany() call
+
+# Query profiling (see config/query_profiler.py)
+DB_PROFILE = os.getenv("DB_PROFILE", "1") == "1"
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))  # statements at least this slow go to logs/slow_queries.log
+DB_EXPLAIN_SLOW = os.getenv("DB_EXPLAIN_SLOW", "0") == "1"  # also log the plan of slow SELECTs
+
+VERSIONS_TABLE = "table_versions"
+WRITE_PATTERN = re.compile(r"^\s*(?:INSERT(?:\s+IGNORE|\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE|DELETE\s+FROM)\s+`?(\w+)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def written_table(query):
+    """Name of the table a write statement changes, or None for reads and DDL."""
+    match = WRITE_PATTERN.match(query)
+    if match is None or match.group(1).lower() == VERSIONS_TABLE:
+        return None
+    return match.group(1).lower()
+
+
+
 class DB:
-    def __init__(self):
-        self.conn = None
+    def __init__(self, pool_size=DB_POOL_SIZE, backend=None, profiler=None):
+        self.backend = backend or create_backend(
+            DB_BACKEND, host=DB_HOST, user=DB_USER, password=DB_PASS, database=DB_NAME, path=DB_PATH)
+        self.profiler = profiler or QueryProfiler(DB_SLOW_QUERY_MS, DB_EXPLAIN_SLOW, DB_PROFILE)
+        self.pool_size = max(1, pool_size)
+        self._pool = queue.LifoQueue(maxsize=self.pool_size)
+        self._last_used = {}  # id(conn) -> time the connection was returned to the pool
+        self._created = 0
+        self._versions_ready = False
+        self._lock = threading.Lock()
+        self._local = threading.local()  # per-thread connection and written tables of an open transaction()
+
+    @property
+    def Error(self):
+        """Exception base class of the active driver."""
+        return self.backend.Error
+
+    def warm_up(self):
+        """Open the first pooled connection ahead of the first query.
+
+        Connections are otherwise opened on demand, so importing this module
+        never waits on the server. The app calls this on a background thread
+        once its window is up. Returns None on success or the connection error.
+        """
         try:
-            # Initialize the connection
-            self.conn = mysql.connector.connect(
-                host=DB_HOST,
-                user=DB_USER,
-                password=DB_PASS,
-                database=DB_NAME
-            )
-            if self.conn.is_connected():
-                print("Connected to DB.")
-        except Error as e:
+            self._release(self._acquire())
+        except (self.Error, TimeoutError) as e:
             print(f"Connection error: {e}")
+            return e
+        print("Connected to DB.")
+        return None
 
-    def exec(self, query, params=None):
-        """Execute a query with optional parameters and commit changes."""
+    def _connect(self):
+        """Open a new server connection counted against the pool size."""
+        with self._lock:
+            self._created += 1
         try:
-            cur = self.conn.cursor()
-            cur.execute(query, params)
-            self.conn.commit()
-            print("Query executed.")
-        except Error as e:
-            print(f"Execution error: {e}")
-            raise e
+            conn = self.backend.connect()
+            if not self._versions_ready:
+                self._create_versions_table(conn)
+            return conn
+        except self.Error:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _create_versions_table(self, conn):
+        """Create the change-counter table on databases set up before it existed.
+
+        Done on a fresh connection because DDL would commit an open MySQL transaction.
+        """
+        from config.init import SCHEMA
+        cur = self.backend.cursor(conn)
+        try:
+            self.backend.execute(cur, SCHEMA[VERSIONS_TABLE])
+            conn.commit()
         finally:
             cur.close()
+        self._versions_ready = True
 
-    def fetch(self, query, params=None):
-        """Fetch results from a SELECT query."""
-        results = None
+    def _discard(self, conn):
+        """Drop a broken connection so its slot can be reopened."""
+        self._last_used.pop(id(conn), None)
+        with self._lock:
+            self._created -= 1
+        try:
+            conn.close()
+        except self.Error:
+            pass
+
+    def _acquire(self):
+        """Borrow a healthy connection, opening or reconnecting one if needed."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._created < self.pool_size
+            if can_open:
+                return self._connect()
+            try:
+                conn = self._pool.get(timeout=DB_POOL_TIMEOUT)
+            except queue.Empty:
+                raise TimeoutError(f"No free DB connection after {DB_POOL_TIMEOUT}s (pool size {self.pool_size}).")
+
+        idle = time.monotonic() - self._last_used.get(id(conn), 0)
+        if idle > DB_HEALTH_CHECK_INTERVAL:
+            try:
+                self.backend.ping(conn)
+            except self.Error:
+                self._discard(conn)
+                return self._connect()
+        return conn
+
+    def _release(self, conn):
+        """Return a connection to the pool."""
+        self._last_used[id(conn)] = time.monotonic()
+        self._pool.put_nowait(conn)
+
+    @contextmanager
+    def connection(self):
+        """Borrow a pooled connection for the duration of a `with` block.
+
+        Inside `transaction()` the thread's transaction connection is reused instead.
+        """
+        tx_conn = getattr(self._local, "conn", None)
+        if tx_conn is not None:
+            yield tx_conn
+            return
+        conn = self._acquire()
+        try:
+            yield conn
+        except self.Error as e:
+            if self.backend.is_connection_lost(e):
+                self._discard(conn)
+                conn = None
+            else:
+                try:
+                    conn.rollback()  # never hand a half-finished transaction to the next borrower
+                except self.Error:
+                    self._discard(conn)
+                    conn = None
+            raise
+        finally:
+            if conn is not None:
+                self._release(conn)
+
+    def in_transaction(self):
+        """Return True if the calling thread is inside `transaction()`."""
+        return getattr(self._local, "conn", None) is not None
+
+    @contextmanager
+    def transaction(self):
+        """Group every exec/exec_many in the block into a single commit.
+
+        The whole block is rolled back if it raises. Nested blocks join the
+        outer transaction.
+        """
+        if self.in_transaction():
+            yield self
+            return
+        with self.connection() as conn:
+            self.backend.begin(conn)
+            self._local.conn = conn
+            self._local.written = set()
+            try:
+                yield self
+                self._bump_versions(conn, self._local.written)
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._local.conn = None
+                self._local.written = None
+
+    def _record_write(self, conn, query, rowcount):
+        """Note that `query` changed its table; the version is bumped in the same commit."""
+        table = written_table(query)
+        if table is None or rowcount == 0:
+            return
+        if self.in_transaction():
+            self._local.written.add(table)
+        else:
+            self._bump_versions(conn, (table,))
+
+    def _bump_versions(self, conn, tables):
+        if not tables:
+            return
+        cur = self.backend.cursor(conn)
+        try:
+            # Sorted so concurrent writers lock the counter rows in the same order
+            self.backend.executemany(cur, self.backend.increment_query(VERSIONS_TABLE, "table_name", "version"),
+                                     [(table,) for table in sorted(tables)])
+        finally:
+            cur.close()
+
+    def table_versions(self, tables):
+        """Current change counter of each table (0 if it was never written through DB).
+
+        Counters live in the `table_versions` table, so every client of the
+        database sees the same values. Returns None if they cannot be read.
+        """
+        tables = sorted(set(tables))
+        rows = self.fetch(f"SELECT table_name, version FROM {VERSIONS_TABLE} WHERE table_name IN ({', '.join(['%s'] * len(tables))})",
+                          tables) if tables else []
+        if rows is None:
+            return None
+        versions = dict.fromkeys(tables, 0)
+        versions.update((row["table_name"], row["version"]) for row in rows)
+        return versions
+
+    def _profile(self, conn, query, params, started, rows):
+        """Hand one finished statement to the profiler; SELECTs can be EXPLAINed on `conn`."""
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        explain = None
+        if query.lstrip()[:6].upper() == "SELECT":
+            explain = lambda: self._explain(conn, query, params)
+        self.profiler.record(query, elapsed_ms, rows, explain)
+
+    def _explain(self, conn, query, params):
+        cur = self.backend.cursor(conn, dictionary=True)
         try:
-            cur = self.conn.cursor(dictionary=True)
-            cur.execute(query, params)
-            results = cur.fetchall()
-        except Error as e:
-            print(f"Fetch error: {e}")
+            self.backend.execute(cur, self.backend.explain_query(query), params)
+            return cur.fetchall()
         finally:
             cur.close()
-        return results
+
+    def exec(self, query, params=None):
+        """Execute a query with optional parameters and commit changes.
+
+        Writes bump the change counter of their table (see table_versions).
+        Returns the number of affected rows.
+        """
+        return self._execute(query, params)[0]
+
+    def insert(self, query, params=None):
+        """Execute one single-row INSERT like `exec` and return the id it generated.
+
+        The id is the cursor's lastrowid, so it is this statement's row even
+        when other clients insert into the same table at the same time.
+        """
+        return self._execute(query, params)[1]
+
+    def _execute(self, query, params):
+        """Run one statement; returns (affected rows, lastrowid)."""
+        try:
+            with db_clock.timed(), self.connection() as conn:
+                cur = self.backend.cursor(conn)
+                try:
+                    started = time.perf_counter()
+                    self.backend.execute(cur, query, params)
+                    self._record_write(conn, query, cur.rowcount)
+                    if not self.in_transaction() and not self.backend.autocommit:
+                        conn.commit()
+                    self._profile(conn, query, params, started, cur.rowcount)
+                    result = (cur.rowcount, cur.lastrowid)
+                finally:
+                    cur.close()
+            print("Query executed.")
+            return result
+        except self.Error as e:
+            print(f"Execution error: {e}")
+            raise e
+
+    def exec_many(self, query, rows, chunk_size=DB_BATCH_SIZE):
+        """Execute `query` for every parameter tuple in `rows` and commit once.
+
+        Rows are sent in chunks of `chunk_size` (INSERTs become multi-row
+        statements) and nothing is committed unless every chunk succeeds.
+        Returns the number of affected rows.
+        """
+        affected = 0
+        try:
+            with db_clock.timed(), self.transaction():
+                with self.connection() as conn:
+                    cur = self.backend.cursor(conn)
+                    try:
+                        started = time.perf_counter()
+                        chunk = []
+                        for row in rows:
+                            chunk.append(row)
+                            if len(chunk) >= chunk_size:
+                                self.backend.executemany(cur, query, chunk)
+                                affected += cur.rowcount
+                                chunk = []
+                        if chunk:
+                            self.backend.executemany(cur, query, chunk)
+                            affected += cur.rowcount
+                        self._record_write(conn, query, affected)
+                        self._profile(conn, query, None, started, affected)
+                    finally:
+                        cur.close()
+            print(f"Batch executed ({affected} rows).")
+        except self.Error as e:
+            print(f"Batch execution error: {e}")
+            raise e
+        return affected
+
+    def upsert_many(self, table, columns, key_columns, rows, chunk_size=DB_BATCH_SIZE):
+        """Insert `rows`, updating the non-key columns of rows whose unique key already exists.
+
+        `key_columns` must match a UNIQUE constraint of `table`.
+        """
+        query = self.backend.upsert_query(table, columns, key_columns)
+        return self.exec_many(query, rows, chunk_size)
+
+    def fetch(self, query, params=None):
+        """Fetch results from a SELECT query, retrying once if the connection dropped."""
+        for attempt in range(2):
+            try:
+                with db_clock.timed(), self.connection() as conn:
+                    cur = self.backend.cursor(conn, dictionary=True)
+                    try:
+                        started = time.perf_counter()
+                        self.backend.execute(cur, query, params)
+                        rows = cur.fetchall()
+                        self._profile(conn, query, params, started, len(rows))
+                        return rows
+                    finally:
+                        cur.close()
+            except self.Error as e:
+                if attempt == 0 and self.backend.is_connection_lost(e):
+                    continue
+                print(f"Fetch error: {e}")
+                return None
+
+    @contextmanager
+    def stream(self, query, params=None, batch_size=DB_BATCH_SIZE):
+        """Run a SELECT and give `(columns, batches)` to the `with` block.
+
+        `batches` yields lists of up to `batch_size` row tuples, read from the
+        server as they are consumed, so a large table is never held in memory
+        at once. The connection stays borrowed until the block ends.
+        """
+        with self.connection() as conn:
+            cur = self.backend.cursor(conn)
+            try:
+                started = time.perf_counter()
+                self.backend.execute(cur, query, params)
+                # No EXPLAIN here: the connection is busy until the rows are read
+                self.profiler.record(query, (time.perf_counter() - started) * 1000, None)
+                columns = [column[0] for column in cur.description]
+
+                def batches():
+                    while True:
+                        rows = cur.fetchmany(batch_size)
+                        if not rows:
+                            return
+                        yield rows
+
+                yield columns, batches()
+            finally:
+                cur.close()
 
     def close(self):
-        """Close the DB connection."""
-        if self.conn.is_connected():
-            self.conn.close()
-            print("DB connection closed.")
+        """Close every pooled DB connection."""
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+        print("DB connection closed.")
 
 
 db = DB()
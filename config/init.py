@@ -1,8 +1,13 @@
-from db_connection import db
+import os
+import sys
 
-def create_supervisors_table():
-    # SQL command to create the supervisors table if it doesn't already exist
-    create_table_query = """
+# Values stored in the `session` column of the exam tables
+SESSIONS = ("MORNING", "AFTERNOON")
+
+# Tables created by create_tables(), in dependency order. Written for MySQL;
+# the SQLite backend rewrites the MySQL-only parts.
+SCHEMA = {
+    "supervisors": """
    CREATE TABLE IF NOT EXISTS supervisors (
     id          INT AUTO_INCREMENT PRIMARY KEY,  -- Unique ID for each supervisor entry
     rfid        VARCHAR(50) UNIQUE,              -- Unique RFID for supervisor identification
@@ -14,14 +19,188 @@ def create_supervisors_table():
     start_date  DATE,                            -- Start date for the role, if applicable
     end_date    DATE                             -- End date for the role, if applicable
     );
-    """
+    """,
+    "timetable": """
+    CREATE TABLE IF NOT EXISTS timetable (
+    id          INT AUTO_INCREMENT PRIMARY KEY,
+    exam_date   DATE NOT NULL,                   -- Date of the paper
+    session     VARCHAR(10) NOT NULL,            -- 'MORNING' or 'AFTERNOON'
+    paper_code  VARCHAR(10) NOT NULL,            -- MSBTE paper code, e.g. '22517'
+    paper_name  VARCHAR(100),                    -- Paper title
+    UNIQUE (exam_date, session, paper_code)
+    );
+    """,
+    "seating_chart": """
+    CREATE TABLE IF NOT EXISTS seating_chart (
+    id            INT AUTO_INCREMENT PRIMARY KEY,
+    seat_no       VARCHAR(20) NOT NULL,          -- Board seat number
+    enrollment_no VARCHAR(20),                   -- Enrollment number of the examinee
+    name          VARCHAR(100) NOT NULL,         -- Examinee's name
+    course_code   VARCHAR(10),                   -- Programme/course code, e.g. 'CO5I'
+    paper_code    VARCHAR(10) NOT NULL,          -- Paper the examinee appears for
+    row_hash      CHAR(32),                      -- Hash of the imported row, used to skip unchanged rows
+    UNIQUE (seat_no, paper_code)
+    );
+    """,
+    "block_layout": """
+    CREATE TABLE IF NOT EXISTS block_layout (
+    block_no      INT PRIMARY KEY,               -- Block (room) number used in every session
+    room          VARCHAR(20),                   -- Room name / location
+    capacity      INT NOT NULL,                  -- Number of seats in the block
+    bench_columns INT NOT NULL DEFAULT 2         -- Seats per row, used to work out neighbours
+    );
+    """,
+    "blocks": """
+    CREATE TABLE IF NOT EXISTS blocks (
+    id          INT AUTO_INCREMENT PRIMARY KEY,
+    exam_date   DATE NOT NULL,
+    session     VARCHAR(10) NOT NULL,
+    block_no    INT NOT NULL,                    -- Block from block_layout used this session
+    capacity    INT NOT NULL,
+    allotted    INT NOT NULL DEFAULT 0,          -- Examinees seated in the block
+    UNIQUE (exam_date, session, block_no)
+    );
+    """,
+    "block_seats": """
+    CREATE TABLE IF NOT EXISTS block_seats (
+    id          INT AUTO_INCREMENT PRIMARY KEY,
+    block_id    INT NOT NULL,                    -- blocks.id
+    exam_date   DATE NOT NULL,
+    session     VARCHAR(10) NOT NULL,
+    bench_no    INT NOT NULL,                    -- 1-based seat position inside the block
+    seat_no     VARCHAR(20) NOT NULL,
+    paper_code  VARCHAR(10) NOT NULL,
+    UNIQUE (exam_date, session, seat_no),
+    UNIQUE (block_id, bench_no)
+    );
+    """,
+    "supervision_order": """
+    CREATE TABLE IF NOT EXISTS supervision_order (
+    id            INT AUTO_INCREMENT PRIMARY KEY,
+    block_id      INT NOT NULL,                  -- blocks.id
+    exam_date     DATE NOT NULL,
+    session       VARCHAR(10) NOT NULL,
+    supervisor_id INT NOT NULL,                  -- supervisors.id
+    UNIQUE (block_id),
+    UNIQUE (exam_date, session, supervisor_id)   -- one block per supervisor per session
+    );
+    """,
+    "supervisor_attendance": """
+    CREATE TABLE IF NOT EXISTS supervisor_attendance (
+    id            INT AUTO_INCREMENT PRIMARY KEY,
+    exam_date     DATE NOT NULL,
+    session       VARCHAR(10) NOT NULL,
+    supervisor_id INT NOT NULL,                  -- supervisors.id
+    checked_in_at DATETIME NOT NULL,             -- Time of the first RFID scan in the session
+    UNIQUE (exam_date, session, supervisor_id)
+    );
+    """,
+    "attendance_marks": """
+    CREATE TABLE IF NOT EXISTS attendance_marks (
+    id          INT AUTO_INCREMENT PRIMARY KEY,
+    exam_date   DATE NOT NULL,
+    session     VARCHAR(10) NOT NULL,
+    seat_no     VARCHAR(20) NOT NULL,
+    status      VARCHAR(10) NOT NULL,            -- 'ABSENT' or 'COPY_CASE'
+    UNIQUE (exam_date, session, seat_no)
+    );
+    """,
+    "attendance_counts": """
+    CREATE TABLE IF NOT EXISTS attendance_counts (
+    id          INT AUTO_INCREMENT PRIMARY KEY,
+    exam_date   DATE NOT NULL,
+    session     VARCHAR(10) NOT NULL,
+    block_id    INT NOT NULL,                    -- blocks.id
+    paper_code  VARCHAR(10) NOT NULL,
+    allotted    INT NOT NULL DEFAULT 0,          -- Seats of this paper in the block
+    absent      INT NOT NULL DEFAULT 0,          -- Kept in step with attendance_marks
+    copy_case   INT NOT NULL DEFAULT 0,
+    UNIQUE (exam_date, session, block_id, paper_code)
+    );
+    """,
+    "block_delete_batches": """
+    CREATE TABLE IF NOT EXISTS block_delete_batches (
+    id          INT AUTO_INCREMENT PRIMARY KEY,
+    exam_date   DATE NOT NULL,
+    session     VARCHAR(10) NOT NULL,
+    deleted_at  DATETIME NOT NULL,
+    undo_until  DATETIME NOT NULL,               -- Archived rows are purged after this
+    status      VARCHAR(10) NOT NULL,            -- 'ARCHIVED', 'RESTORED' or 'PURGED'
+    blocks      INT NOT NULL DEFAULT 0,
+    seats       INT NOT NULL DEFAULT 0
+    );
+    """,
+    "blocks_archive": """
+    CREATE TABLE IF NOT EXISTS blocks_archive (
+    batch_id    INT NOT NULL,                    -- block_delete_batches.id
+    id          INT NOT NULL,                    -- Columns as in blocks
+    exam_date   DATE NOT NULL,
+    session     VARCHAR(10) NOT NULL,
+    block_no    INT NOT NULL,
+    capacity    INT NOT NULL,
+    allotted    INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (batch_id, id)
+    );
+    """,
+    "block_seats_archive": """
+    CREATE TABLE IF NOT EXISTS block_seats_archive (
+    batch_id    INT NOT NULL,                    -- block_delete_batches.id
+    id          INT NOT NULL,                    -- Columns as in block_seats
+    block_id    INT NOT NULL,
+    exam_date   DATE NOT NULL,
+    session     VARCHAR(10) NOT NULL,
+    bench_no    INT NOT NULL,
+    seat_no     VARCHAR(20) NOT NULL,
+    paper_code  VARCHAR(10) NOT NULL,
+    PRIMARY KEY (batch_id, id)
+    );
+    """,
+    "supervision_order_archive": """
+    CREATE TABLE IF NOT EXISTS supervision_order_archive (
+    batch_id      INT NOT NULL,                  -- block_delete_batches.id
+    id            INT NOT NULL,                  -- Columns as in supervision_order
+    block_id      INT NOT NULL,
+    exam_date     DATE NOT NULL,
+    session       VARCHAR(10) NOT NULL,
+    supervisor_id INT NOT NULL,
+    PRIMARY KEY (batch_id, id)
+    );
+    """,
+    "attendance_counts_archive": """
+    CREATE TABLE IF NOT EXISTS attendance_counts_archive (
+    batch_id    INT NOT NULL,                    -- block_delete_batches.id
+    id          INT NOT NULL,                    -- Columns as in attendance_counts
+    exam_date   DATE NOT NULL,
+    session     VARCHAR(10) NOT NULL,
+    block_id    INT NOT NULL,
+    paper_code  VARCHAR(10) NOT NULL,
+    allotted    INT NOT NULL DEFAULT 0,
+    absent      INT NOT NULL DEFAULT 0,
+    copy_case   INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (batch_id, id)
+    );
+    """,
+    "table_versions": """
+    CREATE TABLE IF NOT EXISTS table_versions (
+    table_name  VARCHAR(64) PRIMARY KEY,         -- Table whose data changed
+    version     BIGINT NOT NULL DEFAULT 0        -- Bumped by DB on every committed write to the table
+    );
+    """,
+}
+
+
+def create_tables(database):
+    """Create every table in SCHEMA that does not exist yet."""
+    for table, create_table_query in SCHEMA.items():
+        database.exec(create_table_query)
 
-    # Execute the SQL command
-    try:
-        db.exec(create_table_query)
-        print("Table 'supervisors' created successfully (if it did not already exist).")
-    except Exception as e:
-        print(f"An error occurred while creating the table: {e}")
 
 if __name__ == "__main__":
-    create_supervisors_table()
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    from config.db_connection import db
+
+    try:
+        create_tables(db)
+        print(f"Tables {', '.join(SCHEMA)} created successfully (if they did not already exist).")
+    except Exception as e:
+        print(f"An error occurred while creating the tables: {e}")
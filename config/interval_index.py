@@ -0,0 +1,97 @@
+import bisect
+
+
+class IntervalIndex:
+    """Closed intervals [start, end] with fast stabbing and overlap queries.
+
+    Intervals are kept sorted by start with a max-end segment tree on top, so
+    `overlapping()` and `at()` cost O(log n + k). The tree is rebuilt lazily
+    after `add()`/`remove()`, which suits indexes that are built once and
+    queried many times (availability windows, duty rosters).
+    Any comparable values work as bounds (dates, datetimes, numbers).
+    """
+
+    def __init__(self, intervals=()):
+        self._items = sorted(((start, end, value) for start, end, value in intervals), key=_start_key)
+        self._starts = [item[0] for item in self._items]
+        self._tree = None
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def add(self, start, end, value):
+        position = bisect.bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._items.insert(position, (start, end, value))
+        self._tree = None
+
+    def remove(self, start, end, value):
+        """Remove one interval; returns False if it was not present."""
+        position = bisect.bisect_left(self._starts, start)
+        while position < len(self._items) and self._starts[position] == start:
+            if self._items[position][1] == end and self._items[position][2] == value:
+                del self._items[position]
+                del self._starts[position]
+                self._tree = None
+                return True
+            position += 1
+        return False
+
+    def at(self, point):
+        """Values of every interval containing `point`."""
+        return self.overlapping(point, point)
+
+    def overlapping(self, start, end):
+        """Values of every interval that shares at least one point with [start, end]."""
+        return [item[2] for item in self.overlapping_items(start, end)]
+
+    def overlapping_items(self, start, end):
+        """(start, end, value) of every interval that overlaps [start, end]."""
+        limit = bisect.bisect_right(self._starts, end)  # only these can start early enough
+        if limit == 0:
+            return []
+        tree, size = self._max_end_tree()
+        found = []
+        stack = [1]
+        while stack:
+            node = stack.pop()
+            if tree[node] is None or tree[node] < start:
+                continue
+            if node >= size:
+                position = node - size
+                if position < limit:
+                    found.append(self._items[position])
+                continue
+            # Push the right child first so results come out sorted by start
+            if _leftmost(node * 2 + 1, size) < limit:
+                stack.append(node * 2 + 1)
+            stack.append(node * 2)
+        return found
+
+    def _max_end_tree(self):
+        if self._tree is None:
+            size = 1
+            while size < len(self._items):
+                size *= 2
+            tree = [None] * (2 * size)
+            for position, item in enumerate(self._items):
+                tree[size + position] = item[1]
+            for node in range(size - 1, 0, -1):
+                left, right = tree[node * 2], tree[node * 2 + 1]
+                tree[node] = left if right is None else right if left is None else max(left, right)
+            self._tree = (tree, size)
+        return self._tree
+
+
+def _start_key(item):
+    return item[0]
+
+
+def _leftmost(node, size):
+    """Index of the first leaf under `node`."""
+    while node < size:
+        node *= 2
+    return node - size
@@ -0,0 +1,155 @@
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
+MAX_LOG_BYTES = 512 * 1024  # a log is cut back to its newer half beyond this size
+
+
+class RollingLog:
+    """Append-only text log that keeps only its most recent lines.
+
+    Appends are cheap; once the file passes `max_bytes` it is rewritten
+    with the newer half of its lines, so it never grows without bound.
+    """
+
+    def __init__(self, name, max_bytes=MAX_LOG_BYTES):
+        self.path = os.path.join(LOG_DIR, name)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def append(self, line):
+        with self._lock:
+            try:
+                os.makedirs(LOG_DIR, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(line.rstrip("\n") + "\n")
+                    size = f.tell()
+                if size > self.max_bytes:
+                    self._trim()
+            except OSError as e:
+                print(f"Could not write {self.path}: {e}")
+
+    def _trim(self):
+        with open(self.path, encoding="utf-8") as f:
+            lines = f.readlines()
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines[len(lines) // 2:])
+        os.replace(tmp_path, self.path)
+
+    def lines(self):
+        """Every line currently in the log, oldest first."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return [line.rstrip("\n") for line in f]
+        except FileNotFoundError:
+            return []
+
+
+class StartupTimer:
+    """Milestones of one application launch, written to logs/startup.log.
+
+    Times are measured from when this module was first imported, which
+    app.py does before anything else.
+    """
+
+    def __init__(self, log=None):
+        self.started = time.perf_counter()
+        self.launch = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.log = log or RollingLog("startup.log")
+        self.marks = {}
+
+    def mark(self, event):
+        """Record that `event` happened now; returns milliseconds since start."""
+        elapsed_ms = (time.perf_counter() - self.started) * 1000
+        self.marks[event] = elapsed_ms
+        print(f"Startup: {event} after {elapsed_ms:.0f} ms")
+        self.log.append(f"{self.launch}\t{os.getpid()}\t{event}\t{elapsed_ms:.1f}")
+        return elapsed_ms
+
+
+class BusyClock:
+    """Time spent inside `timed()` blocks, in total and per thread.
+
+    The DB layer times every statement with `db_clock`, so a caller can
+    read `thread_total()` before and after some work to learn its share of
+    DB time; `total` also counts background threads.
+    """
+
+    def __init__(self):
+        self.total = 0.0  # seconds, all threads
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def thread_total(self):
+        """Seconds spent in `timed()` blocks on the calling thread."""
+        return getattr(self._local, "total", 0.0)
+
+    @contextmanager
+    def timed(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._local.total = self.thread_total() + elapsed
+            with self._lock:
+                self.total += elapsed
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list of numbers."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class ScreenTimings:
+    """Cost of every screen opened from the menu, kept in logs/screens.log.
+
+    One tab-separated line per opening: time, screen file, module load ms,
+    display_module build ms, widget count and DB ms spent while building.
+    """
+
+    FIELDS = ("load_ms", "build_ms", "widgets", "db_ms")
+
+    def __init__(self, log=None):
+        self.log = log or RollingLog("screens.log")
+
+    def record(self, screen, load_ms, build_ms, widgets, db_ms):
+        self.log.append(f"{datetime.now():%Y-%m-%d %H:%M:%S}\t{screen}\t{load_ms:.1f}\t{build_ms:.1f}\t{widgets}\t{db_ms:.1f}")
+
+    def samples(self):
+        """{screen: {field: [values...]}} for every line in the log."""
+        samples = {}
+        for line in self.log.lines():
+            parts = line.split("\t")
+            if len(parts) != 2 + len(self.FIELDS):
+                continue
+            try:
+                values = [float(value) for value in parts[2:]]
+            except ValueError:
+                continue
+            fields = samples.setdefault(parts[1], {field: [] for field in self.FIELDS})
+            for field, value in zip(self.FIELDS, values):
+                fields[field].append(value)
+        return samples
+
+    def summary(self, percentiles=(50, 90, 99)):
+        """Per-screen rows with the count and the given percentiles of each field, slowest build first."""
+        rows = []
+        for screen, fields in self.samples().items():
+            row = {"screen": screen, "count": len(fields["build_ms"])}
+            for field, values in fields.items():
+                for pct in percentiles:
+                    row[f"{field}_p{pct}"] = percentile(values, pct)
+            rows.append(row)
+        return sorted(rows, key=lambda row: row[f"build_ms_p{percentiles[-1]}"], reverse=True)
+
+
+startup_timer = StartupTimer()
+db_clock = BusyClock()
+screen_timings = ScreenTimings()
@@ -0,0 +1,142 @@
+import os
+import re
+import sys
+import threading
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+
+from config.perf_log import RollingLog
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOP_CALL_SITES = 5  # call sites kept per statement in summaries
+# Frames in these files belong to the DB layer itself, never to the caller
+INTERNAL_FILES = ("db_connection.py", "query_profiler.py", "contextlib.py")
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROW_LIST = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_SPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1024)
+def normalize_sql(query):
+    """Statement text with the values taken out, so repeats of one statement group together.
+
+    Literals and placeholders become ?, lists of them become (...), and
+    whitespace is collapsed: "WHERE id IN (%s, %s)" -> "WHERE id IN (...)".
+    """
+    query = _STRING.sub("?", query.replace("%s", "?"))
+    query = _NUMBER.sub("?", query)
+    query = _ROW_LIST.sub("(...)", _PLACEHOLDER_LIST.sub("(...)", query))
+    return _SPACE.sub(" ", query).strip()
+
+
+@lru_cache(maxsize=256)
+def _relative(path):
+    try:
+        return os.path.relpath(path, BASE_DIR)
+    except ValueError:  # another drive on Windows
+        return path
+
+
+def call_site():
+    """'file:line function' of the nearest caller outside the DB layer."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.endswith(INTERNAL_FILES):
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    return f"{_relative(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+
+
+class QueryStats:
+    """Totals for one normalized statement."""
+
+    __slots__ = ("sql", "calls", "total_ms", "max_ms", "rows", "slow", "call_sites", "explain")
+
+    def __init__(self, sql):
+        self.sql = sql
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.slow = 0
+        self.call_sites = Counter()
+        self.explain = None  # plan captured for the first slow run, if EXPLAIN capture is on
+
+    def as_dict(self):
+        return {
+            "sql": self.sql, "calls": self.calls, "total_ms": self.total_ms, "avg_ms": self.total_ms / self.calls,
+            "max_ms": self.max_ms, "rows": self.rows, "slow": self.slow,
+            "call_sites": self.call_sites.most_common(TOP_CALL_SITES), "explain": self.explain,
+        }
+
+
+class QueryProfiler:
+    """Per-statement timing, row counts and call sites, grouped by normalized SQL.
+
+    Statements slower than `slow_ms` are also written to
+    logs/slow_queries.log. With `explain` on, the query plan of a slow
+    SELECT is captured the first time it is slow and logged with it.
+    Many calls of one statement from one call site, each returning a row or
+    two, is the signature of an N+1 loop.
+    """
+
+    def __init__(self, slow_ms=200.0, explain=False, enabled=True, log=None):
+        self.slow_ms = slow_ms
+        self.explain = explain
+        self.enabled = enabled
+        self.log = log or RollingLog("slow_queries.log")
+        self._stats = {}  # normalized sql -> QueryStats
+        self._lock = threading.Lock()
+
+    def record(self, query, elapsed_ms, rows, explain=None):
+        """Account one execution. `explain` is a callable returning the plan lines, used only when slow."""
+        if not self.enabled:
+            return
+        sql = normalize_sql(query)
+        site = call_site()
+        slow = elapsed_ms >= self.slow_ms
+        with self._lock:
+            stats = self._stats.get(sql)
+            if stats is None:
+                stats = self._stats[sql] = QueryStats(sql)
+            stats.calls += 1
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.rows += max(rows or 0, 0)
+            stats.call_sites[site] += 1
+            if slow:
+                stats.slow += 1
+            want_plan = slow and self.explain and explain is not None and stats.explain is None
+        if not slow:
+            return
+        plan = None
+        if want_plan:
+            plan = self._capture(explain)
+            with self._lock:
+                stats.explain = plan
+        line = f"{datetime.now():%Y-%m-%d %H:%M:%S}\t{elapsed_ms:.1f}\t{rows}\t{site}\t{sql}"
+        if plan:
+            line += "\tEXPLAIN: " + " | ".join(plan)
+        self.log.append(line)
+
+    @staticmethod
+    def _capture(explain):
+        try:
+            return [" ".join(str(value) for value in row.values()) for row in explain()]
+        except Exception as e:
+            return [f"EXPLAIN failed: {e}"]
+
+    def summary(self, order_by="total_ms", limit=None):
+        """Statement totals as dicts, most expensive first."""
+        with self._lock:
+            rows = [stats.as_dict() for stats in self._stats.values()]
+        rows.sort(key=lambda row: row[order_by], reverse=True)
+        return rows[:limit] if limit else rows
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
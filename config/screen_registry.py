@@ -0,0 +1,48 @@
+import importlib.util
+import os
+import re
+import threading
+
+
+class ScreenRegistry:
+    """Load screen modules listed in modules.json once and cache them by path.
+
+    A cached module is reused until its source file's mtime changes, at which
+    point it is executed again so edits still show up without a restart.
+    """
+
+    def __init__(self):
+        self._cache = {}  # abs path -> (mtime, module)
+        self._lock = threading.Lock()
+
+    def get(self, file_path):
+        """Return the loaded module for `file_path`, loading it if needed."""
+        file_path = os.path.abspath(file_path)
+        mtime = os.stat(file_path).st_mtime_ns
+        with self._lock:
+            cached = self._cache.get(file_path)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            module = self._load(file_path)
+            self._cache[file_path] = (mtime, module)
+            return module
+
+    def invalidate(self, file_path=None):
+        """Drop one cached module, or all of them when no path is given."""
+        with self._lock:
+            if file_path is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(os.path.abspath(file_path), None)
+
+    def _load(self, file_path):
+        spec = importlib.util.spec_from_file_location(self._module_name(file_path), file_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    @staticmethod
+    def _module_name(file_path):
+        """Build a unique module name from the path relative to the app root."""
+        rel_path = os.path.relpath(file_path, os.getcwd())
+        return "screens." + re.sub(r'\W', '_', os.path.splitext(rel_path)[0])
@@ -0,0 +1,138 @@
+import threading
+from collections import defaultdict
+
+from config.db_connection import db
+
+SUPERVISOR_COLUMNS = "id, rfid, name, dept_code, desg, emp_type, post, start_date, end_date"
+
+
+class SupervisorRepository:
+    """In-memory copy of the `supervisors` table with hash indexes.
+
+    Lookups by id, rfid, name and dept_code are O(1). Writes made through the
+    repository update the table and the indexes together; `refresh(ids)`
+    re-reads only the given rows, and `refresh()` re-reads the whole table
+    and applies the difference.
+    """
+
+    def __init__(self, database=db):
+        self.db = database
+        self._lock = threading.RLock()
+        self._by_id = {}
+        self._by_rfid = {}
+        self._by_name = defaultdict(dict)  # name -> {id: row}, names are not unique
+        self._by_dept = defaultdict(dict)  # dept_code -> {id: row}
+        self.loaded = False
+
+    # ----- loading -----
+
+    def ensure_loaded(self):
+        """Load the table on first use; later calls are free."""
+        if not self.loaded:
+            self.refresh()
+        return self
+
+    def refresh(self, ids=None):
+        """Re-read all supervisors, or only the rows with the given ids."""
+        if ids is None:
+            rows = self.db.fetch(f"SELECT {SUPERVISOR_COLUMNS} FROM supervisors")
+            if rows is None:
+                return
+            with self._lock:
+                fetched = {row["id"] for row in rows}
+                for stale_id in set(self._by_id) - fetched:
+                    self._remove(stale_id)
+                for row in rows:
+                    self._upsert(row)
+                self.loaded = True
+            return
+
+        ids = list(ids)
+        if not ids:
+            return
+        placeholders = ", ".join(["%s"] * len(ids))
+        rows = self.db.fetch(f"SELECT {SUPERVISOR_COLUMNS} FROM supervisors WHERE id IN ({placeholders})", tuple(ids))
+        if rows is None:
+            return
+        with self._lock:
+            for row in rows:
+                self._upsert(row)
+            for missing_id in set(ids) - {row["id"] for row in rows}:
+                self._remove(missing_id)
+
+    def _upsert(self, row):
+        row = dict(row)
+        self._remove(row["id"])
+        self._by_id[row["id"]] = row
+        if row.get("rfid"):
+            self._by_rfid[row["rfid"]] = row
+        self._by_name[row["name"]][row["id"]] = row
+        self._by_dept[row["dept_code"]][row["id"]] = row
+
+    def _remove(self, supervisor_id):
+        row = self._by_id.pop(supervisor_id, None)
+        if row is None:
+            return
+        if row.get("rfid") and self._by_rfid.get(row["rfid"]) is row:
+            del self._by_rfid[row["rfid"]]
+        for index, key in ((self._by_name, row["name"]), (self._by_dept, row["dept_code"])):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.pop(supervisor_id, None)
+                if not bucket:
+                    del index[key]
+
+    # ----- lookups -----
+
+    def get(self, supervisor_id):
+        return self._by_id.get(supervisor_id)
+
+    def by_rfid(self, rfid):
+        return self._by_rfid.get(rfid)
+
+    def by_name(self, name):
+        """Return every supervisor with this name."""
+        return list(self._by_name.get(name, {}).values())
+
+    def first_by_name(self, name):
+        bucket = self._by_name.get(name)
+        return next(iter(bucket.values())) if bucket else None
+
+    def by_dept(self, dept_code):
+        return list(self._by_dept.get(dept_code, {}).values())
+
+    def all(self):
+        with self._lock:
+            return list(self._by_id.values())
+
+    def __len__(self):
+        return len(self._by_id)
+
+    # ----- writes -----
+
+    def add(self, name, dept_code, desg, rfid):
+        """Insert a supervisor and index the new row."""
+        self.db.exec("INSERT INTO supervisors (name, dept_code, desg, rfid) VALUES (%s, %s, %s, %s)",
+                     (name, dept_code, desg, rfid))
+        rows = self.db.fetch(f"SELECT {SUPERVISOR_COLUMNS} FROM supervisors WHERE rfid = %s", (rfid,))
+        with self._lock:
+            for row in rows or []:
+                self._upsert(row)
+
+    def update(self, supervisor_id, name, dept_code, desg, rfid):
+        self.db.exec("UPDATE supervisors SET name = %s, dept_code = %s, desg = %s, rfid = %s WHERE id = %s",
+                     (name, dept_code, desg, rfid, supervisor_id))
+        self.refresh([supervisor_id])
+
+    def set_availability(self, supervisor_id, start_date, end_date):
+        self.db.exec("UPDATE supervisors SET start_date=%s, end_date=%s WHERE id=%s",
+                     (start_date, end_date, supervisor_id))
+        self.refresh([supervisor_id])
+
+    def delete(self, supervisor_id):
+        self.db.exec("DELETE FROM supervisors WHERE id = %s", (supervisor_id,))
+        with self._lock:
+            self._remove(supervisor_id)
+
+
+supervisor_repository = SupervisorRepository()
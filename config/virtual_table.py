@@ -0,0 +1,260 @@
+import customtkinter as ctk
+from tkinter import ttk
+from collections import OrderedDict
+
+from config.db_connection import db
+from config.async_query import run_in_background, LoadingIndicator
+
+
+PAGE_RETRY_MS = 2000  # wait before fetching a page or the row count again after a failed query
+
+
+class VirtualTable(ctk.CTkFrame):
+    """A Treeview that only ever holds the visible rows of a (possibly huge) table.
+
+    Rows are fetched a page at a time with keyset pagination on
+    (sort column, key column); sorting and filtering happen in SQL. Only the
+    most recently used pages are kept in memory, so memory and render time do
+    not grow with the table size.
+
+    `columns` is a list of (sql_column, heading) pairs. `row_formatter`
+    turns a fetched row dict into the tuple of displayed values. When it
+    shows a column differently from how it is stored (a code shown as a
+    name), `display_filters` maps that column to a function returning the
+    stored values whose displayed text contains the filter text, so the
+    filter matches what the user sees as well as the stored value.
+    """
+
+    def __init__(self, master, table, columns, key="id", visible_rows=15, page_size=100,
+                 max_cached_pages=8, row_formatter=None, font=None, row_height=35, display_filters=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.table = table
+        self.columns = columns
+        self.key = key
+        self.visible_rows = visible_rows
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+        self.row_formatter = row_formatter or (lambda row: tuple(row[col] for col, _ in self.columns))
+
+        self.sort_column = columns[0][0]
+        self.sort_desc = False
+        self.filter_text = ""
+        self.filter_columns = [col for col, _ in columns]
+        self.display_filters = display_filters or {}
+
+        self.total = 0
+        self.offset = 0  # index of the first visible row
+        self.pages = OrderedDict()  # page number -> list of row dicts (LRU)
+        self.page_bounds = OrderedDict()  # page number -> (first sort tuple, last sort tuple)
+        self.pending_pages = {}  # page number -> QueryHandle
+        self.count_query = None
+        self.generation = 0  # bumped on sort/filter change so stale pages are ignored
+
+        self.create_widgets(font, row_height)
+        self.loading = LoadingIndicator(self, font=font)
+
+    def create_widgets(self, font, row_height):
+        headings = [heading for _, heading in self.columns]
+        self.tree = ttk.Treeview(self, columns=headings, show="headings", height=self.visible_rows, selectmode="browse")
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        for (col, heading) in self.columns:
+            self.tree.heading(heading, text=heading, anchor="center", command=lambda c=col: self.sort_by(c))
+            self.tree.column(heading, anchor="center", width=200)
+
+        style = ttk.Style()
+        style.configure("Virtual.Treeview", font=font, rowheight=row_height)
+        style.configure("Treeview.Heading", font=font)
+        self.tree.configure(style="Virtual.Treeview")
+
+        self.scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.on_scroll)
+        self.scrollbar.grid(row=0, column=1, sticky="ns")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.tree.bind("<MouseWheel>", self.on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_to(self.offset - 3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_to(self.offset + 3))
+        self.tree.bind("<Up>", lambda e: self.move_selection(-1))
+        self.tree.bind("<Down>", lambda e: self.move_selection(1))
+
+    # ----- public API -----
+
+    def refresh(self):
+        """Drop cached pages and reload the current window from the database."""
+        self.generation += 1
+        for handle in self.pending_pages.values():
+            handle.cancel()
+        if self.count_query is not None:
+            self.count_query.cancel()
+        self.pending_pages.clear()
+        self.pages.clear()
+        self.page_bounds.clear()
+
+        where, params = self.where_clause()
+        query = f"SELECT COUNT(*) AS total FROM {self.table}{where}"
+        generation = self.generation
+        self.count_query = run_in_background(
+            self, lambda: db.fetch(query, params),
+            on_done=lambda rows: self.set_total(rows, generation), loading=self.loading
+        )
+
+    def set_filter(self, text):
+        """Show only rows where any filter column contains `text`."""
+        self.filter_text = text.strip()
+        self.offset = 0
+        self.refresh()
+
+    def sort_by(self, column):
+        """Sort on `column`, toggling direction when it is already the sort column."""
+        self.sort_desc = not self.sort_desc if column == self.sort_column else False
+        self.sort_column = column
+        self.offset = 0
+        self.refresh()
+
+    def selected_row(self):
+        """Return the row dict of the selected item, or None."""
+        selection = self.tree.selection()
+        if not selection:
+            return None
+        index = int(selection[0])
+        page = self.pages.get(index // self.page_size)
+        return page[index % self.page_size] if page and index % self.page_size < len(page) else None
+
+    # ----- SQL -----
+
+    def sort_expr(self):
+        return f"COALESCE({self.sort_column}, '')"
+
+    def where_clause(self, extra=None, extra_params=()):
+        conditions, params = [], []
+        if self.filter_text:
+            matches = [f"{col} LIKE %s" for col in self.filter_columns]
+            params.extend([f"%{self.filter_text}%"] * len(self.filter_columns))
+            for col, stored_values in self.display_filters.items():
+                values = list(stored_values(self.filter_text))
+                if values:
+                    matches.append(f"{col} IN ({', '.join(['%s'] * len(values))})")
+                    params.extend(values)
+            conditions.append("(" + " OR ".join(matches) + ")")
+        if extra:
+            conditions.append(extra)
+            params.extend(extra_params)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), tuple(params)
+
+    def page_query(self, page_no):
+        """Build the query for one page, using a neighbouring page's bounds when known."""
+        sort, key = self.sort_expr(), self.key
+        forward_op, backward_op = ("<", ">") if self.sort_desc else (">", "<")
+        direction = "DESC" if self.sort_desc else "ASC"
+        reverse = "ASC" if self.sort_desc else "DESC"
+        select = f"SELECT {sort} AS _sort, {key} AS _key, {self.table}.* FROM {self.table}"
+
+        if page_no - 1 in self.page_bounds:
+            last_sort, last_key = self.page_bounds[page_no - 1][1]
+            where, params = self.where_clause(
+                f"({sort} {forward_op} %s OR ({sort} = %s AND {key} {forward_op} %s))", (last_sort, last_sort, last_key))
+            return f"{select}{where} ORDER BY {sort} {direction}, {key} {direction} LIMIT {self.page_size}", params, False
+        if page_no + 1 in self.page_bounds:
+            first_sort, first_key = self.page_bounds[page_no + 1][0]
+            where, params = self.where_clause(
+                f"({sort} {backward_op} %s OR ({sort} = %s AND {key} {backward_op} %s))", (first_sort, first_sort, first_key))
+            return f"{select}{where} ORDER BY {sort} {reverse}, {key} {reverse} LIMIT {self.page_size}", params, True
+        # No neighbour loaded (e.g. the scrollbar was dragged): fall back to OFFSET for this one page
+        where, params = self.where_clause()
+        return (f"{select}{where} ORDER BY {sort} {direction}, {key} {direction} "
+                f"LIMIT {self.page_size} OFFSET {page_no * self.page_size}"), params, False
+
+    # ----- paging -----
+
+    def set_total(self, rows, generation):
+        if generation != self.generation:
+            return
+        self.count_query = None
+        if rows is None:  # the count failed: try again later instead of showing an empty table
+            self.after(PAGE_RETRY_MS, lambda: self.refresh() if generation == self.generation and self.winfo_exists() else None)
+            return
+        self.total = rows[0]["total"] if rows else 0
+        self.offset = max(0, min(self.offset, self.total - self.visible_rows))
+        self.render()
+
+    def request_page(self, page_no):
+        if page_no in self.pages or page_no in self.pending_pages or page_no * self.page_size >= self.total:
+            return
+        query, params, reverse = self.page_query(page_no)
+        generation = self.generation
+        self.pending_pages[page_no] = run_in_background(
+            self, lambda: db.fetch(query, params),
+            on_done=lambda rows: self.store_page(page_no, rows, reverse, generation), loading=self.loading
+        )
+
+    def store_page(self, page_no, rows, reverse, generation):
+        if generation != self.generation:
+            return
+        self.pending_pages.pop(page_no, None)
+        if rows is None:  # the fetch failed: leave the page uncached and render (which requests it) again later
+            self.after(PAGE_RETRY_MS, lambda: self.render() if generation == self.generation and self.winfo_exists() else None)
+            return
+        rows = list(reversed(rows)) if reverse else rows
+        self.pages[page_no] = rows
+        if rows:
+            self.page_bounds[page_no] = ((rows[0]["_sort"], rows[0]["_key"]), (rows[-1]["_sort"], rows[-1]["_key"]))
+        while len(self.pages) > self.max_cached_pages:
+            evicted, _ = self.pages.popitem(last=False)
+            self.page_bounds.pop(evicted, None)
+        self.render()
+
+    def render(self):
+        """Show rows offset..offset+visible_rows, requesting any page that is missing."""
+        selection = self.tree.selection()
+        self.tree.delete(*self.tree.get_children())
+        end = min(self.offset + self.visible_rows, self.total)
+        for index in range(self.offset, end):
+            page_no = index // self.page_size
+            page = self.pages.get(page_no)
+            if page is None:
+                self.request_page(page_no)
+                continue
+            self.pages.move_to_end(page_no)
+            if index % self.page_size < len(page):
+                self.tree.insert("", "end", iid=str(index), values=self.row_formatter(page[index % self.page_size]))
+        # Prefetch the next page so scrolling down rarely waits on the database
+        self.request_page(end // self.page_size)
+        if selection and self.tree.exists(selection[0]):
+            self.tree.selection_set(selection[0])
+
+        if self.total:
+            self.scrollbar.set(self.offset / self.total, end / self.total)
+        else:
+            self.scrollbar.set(0, 1)
+
+    # ----- scrolling -----
+
+    def scroll_to(self, offset):
+        offset = max(0, min(offset, self.total - self.visible_rows))
+        if offset != self.offset:
+            self.offset = offset
+            self.render()
+        return "break"
+
+    def on_scroll(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(int(float(amount) * self.total))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def on_mousewheel(self, event):
+        return self.scroll_to(self.offset - int(event.delta / 120) * 3)
+
+    def move_selection(self, step):
+        selection = self.tree.selection()
+        index = int(selection[0]) + step if selection else self.offset
+        index = max(0, min(index, self.total - 1))
+        if index < self.offset:
+            self.scroll_to(index)
+        elif index >= self.offset + self.visible_rows:
+            self.scroll_to(index - self.visible_rows + 1)
+        if self.tree.exists(str(index)):
+            self.tree.selection_set(str(index))
+            self.tree.see(str(index))
+        return "break"
@@ -1,19 +1,6 @@
 import customtkinter as ctk
-import json
-import os
 import webbrowser
-
-def load_json(file_path):
-    """Load JSON data from the specified file path."""
-    if not os.path.exists(file_path):
-        print(f"Error: The file '{file_path}' does not exist.")
-        return {}
-    try:
-        with open(file_path, 'r') as file:
-            return json.load(file)
-    except json.JSONDecodeError:
-        print(f"Error: Failed to decode JSON from '{file_path}'.")
-        return {}
+from config.config_store import config_store
 
 def display_module(root):
     """Display the main application interface."""
@@ -26,12 +13,26 @@ def display_module(root):
             self.pack(fill="both", expand=True)
 
             # Load configuration data
-            self.data = load_json('config/data.json')
+            self.data = config_store.data()
             self.institute_data = self.data.get("institute", {})
             self.dev_info = self.data.get("dev", {})
 
             self.create_widgets()
 
+            # Refresh the institute banner when data.json changes
+            config_store.subscribe(self.on_config_changed, widget=self)
+            # CTkFrame.bind binds on the frame's inner canvas, so no check against `self` here
+            self.bind("<Destroy>", lambda e: config_store.unsubscribe(self.on_config_changed))
+
+        def on_config_changed(self, data):
+            """Rebuild the institute banner with the new institute details."""
+            if not self.winfo_exists():
+                return
+            self.institute_data = data.get("institute", {})
+            self.institute_frame.destroy()
+            self.create_institute_frame()
+            self.institute_frame.pack_configure(before=self.content_frame)
+
         def create_widgets(self):
             """Create the main widgets for the application."""
             # Institute Information
@@ -55,7 +56,7 @@ def display_module(root):
 
         def create_institute_frame(self):
             """Create a frame displaying institute information."""
-            institute_frame = ctk.CTkFrame(self, fg_color="#2e2e2e")
+            institute_frame = self.institute_frame = ctk.CTkFrame(self, fg_color="#2e2e2e")
             institute_frame.pack(fill="x", padx=20, pady=(20, 0))
             
             ctk.CTkLabel(institute_frame, text=self.institute_data.get("INS_NAME", "Institute Name Not Found"), 
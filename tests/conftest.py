@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the app's packages (config, System_Parameters, ...) importable from the tests
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
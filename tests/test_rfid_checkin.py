@@ -0,0 +1,135 @@
+"""RFID check-in pipeline, fed from a scan file against a throwaway SQLite database."""
+from datetime import date
+
+import pytest
+
+import System_Parameters.rfid_checkin as rfid_checkin
+from config.db_backends import SQLiteBackend
+from config.db_connection import DB
+from config.supervisor_repository import SupervisorRepository
+from System_Parameters.rfid_checkin import (
+    ACCEPTED, ALREADY_CHECKED_IN, DUPLICATE, UNKNOWN, CheckInPipeline, KeyboardWedgeBuffer, replay_file)
+
+EXAM_DATE, SESSION = date(2031, 4, 7), "MORNING"
+SUPERVISORS = [("C001", "PATIL RAVI"), ("C002", "SHAH ASHA"), ("C003", "KHAN IMRAN"), ("C004", "DESAI NEHA"), ("C005", "ROY AMIT")]
+
+
+class FlakyDB:
+    """Passes everything to `database` but fails the first `failures` batch writes."""
+
+    def __init__(self, database, failures):
+        self.database = database
+        self.failures = failures
+        self.batches = []
+
+    def __getattr__(self, name):
+        return getattr(self.database, name)
+
+    def exec_many(self, query, rows, *args, **kwargs):
+        rows = list(rows)
+        if self.failures:
+            self.failures -= 1
+            raise self.database.Error("database unreachable")
+        self.batches.append(len(rows))
+        return self.database.exec_many(query, rows, *args, **kwargs)
+
+
+@pytest.fixture
+def database(tmp_path):
+    database = DB(pool_size=2, backend=SQLiteBackend(str(tmp_path / "checkin.db")))
+    database.exec_many("INSERT INTO supervisors (rfid, name, dept_code, desg) VALUES (%s, %s, 'CO', 'Lecturer')", SUPERVISORS)
+    yield database
+    database.close()
+
+
+@pytest.fixture
+def repository(database):
+    return SupervisorRepository(database)
+
+
+def write_scans(tmp_path, lines):
+    path = tmp_path / "scans.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return path
+
+
+def stored_checkins(database):
+    rows = database.fetch("SELECT s.rfid FROM supervisor_attendance a JOIN supervisors s ON s.id = a.supervisor_id "
+                          "WHERE a.exam_date = %s AND a.session = %s ORDER BY s.rfid", (EXAM_DATE, SESSION))
+    return [row["rfid"] for row in rows]
+
+
+def test_replayed_scans_are_acknowledged_and_stored(tmp_path, database, repository):
+    pipeline = CheckInPipeline(EXAM_DATE, SESSION, repository, database, flush_interval=0.05).start()
+    acks = replay_file(pipeline, write_scans(tmp_path, ["C001", "", "C002", "C001", "X999", " C003 "]))
+    pipeline.stop()
+
+    assert [ack["status"] for ack in acks] == [ACCEPTED, ACCEPTED, DUPLICATE, UNKNOWN, ACCEPTED]
+    assert acks[0]["supervisor"]["name"] == "PATIL RAVI"
+    assert acks[3]["supervisor"] is None
+    assert stored_checkins(database) == ["C001", "C002", "C003"]
+    assert pipeline.stats["written"] == 3 and pipeline.pending() == 0
+
+
+def test_rescan_after_the_dedupe_window_is_already_checked_in(tmp_path, database, repository):
+    pipeline = CheckInPipeline(EXAM_DATE, SESSION, repository, database, dedupe_window=0, flush_interval=0.05).start()
+    acks = replay_file(pipeline, write_scans(tmp_path, ["C001", "C001"]))
+    pipeline.stop()
+
+    assert [ack["status"] for ack in acks] == [ACCEPTED, ALREADY_CHECKED_IN]
+    assert stored_checkins(database) == ["C001"]
+
+
+def test_check_ins_stored_earlier_are_already_checked_in(tmp_path, database, repository):
+    first = CheckInPipeline(EXAM_DATE, SESSION, repository, database, flush_interval=0.05).start()
+    replay_file(first, write_scans(tmp_path, ["C004"]))
+    first.stop()
+
+    second = CheckInPipeline(EXAM_DATE, SESSION, repository, database, flush_interval=0.05).start()
+    acks = replay_file(second, write_scans(tmp_path, ["C004", "C005"]))
+    second.stop()
+
+    assert [ack["status"] for ack in acks] == [ALREADY_CHECKED_IN, ACCEPTED]
+    assert stored_checkins(database) == ["C004", "C005"]
+
+
+def test_check_ins_are_written_in_batches(tmp_path, database, repository):
+    flaky = FlakyDB(database, failures=0)
+    pipeline = CheckInPipeline(EXAM_DATE, SESSION, repository, flaky, batch_size=2, flush_interval=0.2).start()
+    acks = replay_file(pipeline, write_scans(tmp_path, [rfid for rfid, _ in SUPERVISORS]))
+    pipeline.stop()
+
+    assert all(ack["status"] == ACCEPTED for ack in acks)
+    assert sum(flaky.batches) == 5 and max(flaky.batches) <= 2
+    assert stored_checkins(database) == [rfid for rfid, _ in SUPERVISORS]
+
+
+def test_failed_batch_is_retried(tmp_path, database, repository, monkeypatch):
+    monkeypatch.setattr(rfid_checkin, "RETRY_DELAY_S", 0.01)
+    flaky = FlakyDB(database, failures=2)
+    pipeline = CheckInPipeline(EXAM_DATE, SESSION, repository, flaky, flush_interval=0.05).start()
+    acks = replay_file(pipeline, write_scans(tmp_path, ["C001", "C002"]))
+    pipeline.stop()
+
+    assert [ack["status"] for ack in acks] == [ACCEPTED, ACCEPTED]
+    assert pipeline.stats["failed_batches"] == 2
+    assert pipeline.stats["written"] == 2
+    assert stored_checkins(database) == ["C001", "C002"]
+
+
+def test_keyboard_wedge_buffer_feeds_the_pipeline(database, repository):
+    pipeline = CheckInPipeline(EXAM_DATE, SESSION, repository, database, flush_interval=0.05).start()
+    wedge = KeyboardWedgeBuffer(max_gap=1.0)
+    acks = []
+    # A partial read abandoned for longer than max_gap is dropped before the next card
+    wedge.feed("C", now=0.0)
+    wedge.feed("0", now=0.5)
+    for offset, char in enumerate("C002\r"):
+        code = wedge.feed(char, now=10.0 + offset * 0.01)
+        if code:
+            acks.append(pipeline.scan(code))
+    pipeline.stop()
+
+    assert [ack["rfid"] for ack in acks] == ["C002"]
+    assert acks[0]["status"] == ACCEPTED
+    assert stored_checkins(database) == ["C002"]